@@ -11,4 +11,12 @@ def get_char_id_dict() -> dict:
                         'M': '37', 'N': '38', 'H': '39', 'V': '40', 'Y': '41', 'PwD': '42'}
 
     char_id_dict = {v: k for k, v in char_dict.items()}
-    return char_id_dict
\ No newline at end of file
+    return char_id_dict
+
+def get_char_table() -> tuple:
+    """
+    Class id -> character lookup table of the character model, built once from
+    get_char_id_dict so that decoded class ids can be indexed directly.
+    """
+    char_id_dict = get_char_id_dict()
+    return tuple(char_id_dict[str(i)] for i in range(len(char_id_dict)))
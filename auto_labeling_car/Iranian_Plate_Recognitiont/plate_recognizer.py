@@ -1,37 +1,115 @@
-import torch
 import cv2
-import statistics
 
 from .weights.parser import get_path_model_object, get_path_model_char
-from .helper import get_char_id_dict
+from .helper import get_char_table
+from ..models import load_yolov5
+from ..metrics import profile
 
-# Load models
-modelPlate = torch.hub.load('yolov5', 'custom', get_path_model_object(), source='local', force_reload=True)
-modelCharX = torch.hub.load('yolov5', 'custom', get_path_model_char(), source='local', force_reload=True)
+def get_plate_model():
+    """
+    Returns the plate YOLOv5 model, loaded on first use.
+    """
+    return load_yolov5(get_path_model_object())
+
+def get_char_model():
+    """
+    Returns the plate character YOLOv5 model, loaded on first use.
+    """
+    return load_yolov5(get_path_model_char())
+
+# Minimum confidence of a character detection.
+CHAR_CONF_THRESHOLD = 0.5
+CHAR_TABLE = get_char_table()
 
 def detect_plate_chars(image):
-    results_plate = modelPlate(image)
-    plates = []
-    for *xyxy, conf, _ in results_plate.xyxy[0]:
-        x1, y1, x2, y2 = map(int, xyxy)
-        crop_img = image[y1:y2, x1:x2]
-        chars, confidences, char_detected = [], [], []
-
-        results = modelCharX(crop_img)
-        detections = results.pred[0]
-        detections = sorted(detections, key=lambda x: x[0])  # sort by x coordinate
-        for det in detections:
-            conf = det[4]
-            if conf > 0.5:
-                cls = det[5].item()
-                char = get_char_id_dict().get(str(int(cls)), '')
-                chars.append(char)
-                confidences.append(conf.item())
-                char_detected.append(det.tolist())
-        charConfAvg = round(statistics.mean(confidences) * 100) if confidences else 0
-        plate = ''.join(chars)
-        return plate, (x1, y1, x2, y2)
-    return None , None
+    """
+    Recognizes the first plate of an RGB image.
+    Returns (plate, (x1, y1, x2, y2)), or (None, None) if no plate is found.
+    """
+    plates = recognize_plates([image], max_plates=1)[0]
+    return plates[0] if plates else (None, None)
+
+
+def detect_plates(image):
+    """
+    Recognizes every plate of an RGB image (e.g. a multi-vehicle frame).
+    Returns a list of (plate, (x1, y1, x2, y2)), one per detected plate.
+    """
+    return recognize_plates([image])[0]
+
+
+def detect_plate_chars_batch(images, metrics=None):
+    """
+    Batched detect_plate_chars: one plate-detector call over all RGB images and one
+    character-model call over the plate crops of all images.
+    Returns one (plate, (x1, y1, x2, y2)) or (None, None) per image.
+    """
+    return [plates[0] if plates else (None, None) for plates in recognize_plates(images, max_plates=1, metrics=metrics)]
+
+
+def recognize_plates(images, max_plates=None, metrics=None):
+    """
+    Runs the plate detector once over all RGB images, then the character model once over
+    the crops of every detected plate (at most max_plates per image, all if None).
+    Returns, per image, a list of (plate, (x1, y1, x2, y2)).
+    Both calls are timed in metrics (a StageMetrics) if given.
+    """
+    detections = detect_plate_boxes(images, max_plates, metrics)
+    chars = iter(read_plate_crops([crop for plates in detections for _, crop in plates], metrics))
+    return [[(next(chars)[0], box) for box, _ in plates] for plates in detections]
+
+
+def detect_plate_boxes(images, max_plates=None, metrics=None):
+    """
+    Runs the plate detector once over all RGB images.
+    Returns, per image, a list of ((x1, y1, x2, y2), crop) for at most max_plates plates,
+    with boxes clipped to the image and empty boxes dropped.
+    """
+    if not len(images):
+        return []
+    with profile(metrics, "plate_detection", len(images)):
+        results_plate = get_plate_model()(list(images))
+    detections = []
+    for image, pred in zip(images, results_plate.xyxy):
+        h, w = image.shape[:2]
+        plates = []
+        for *xyxy, conf, _ in pred[:max_plates]:
+            x1, y1, x2, y2 = map(int, xyxy)
+            x1, y1, x2, y2 = max(x1, 0), max(y1, 0), min(x2, w), min(y2, h)
+            if x2 <= x1 or y2 <= y1:
+                continue
+            plates.append(((x1, y1, x2, y2), image[y1:y2, x1:x2]))
+        detections.append(plates)
+    return detections
+
+
+def read_plate_crops(crops, metrics=None):
+    """
+    Runs the character model once over plate crops.
+    Returns one (plate, average character confidence in percent) per crop.
+    """
+    if not crops:
+        return []
+    with profile(metrics, "char_ocr", len(crops)):
+        results = get_char_model()(list(crops))
+    return [decode_chars(detections) for detections in results.pred]
+
+
+def decode_chars(detections):
+    """
+    Turns the character-model detections (n x 6 tensor: x1, y1, x2, y2, conf, class)
+    of one plate crop into the plate string, reading characters from left to right.
+    Returns (plate, average character confidence in percent).
+    """
+    detections = detections[detections[:, 4] > CHAR_CONF_THRESHOLD]
+    if not len(detections):
+        return '', 0
+    order = detections[:, 0].sort(stable=True).indices
+    detections = detections[order]
+    classes = detections[:, 5].long().tolist()
+    plate = ''.join(CHAR_TABLE[c] if 0 <= c < len(CHAR_TABLE) else '' for c in classes)
+    charConfAvg = round(detections[:, 4].mean().item() * 100)
+    return plate, charConfAvg
 
 
 
@@ -0,0 +1,155 @@
+import cv2
+from collections import defaultdict
+
+from .plate_recognizer import detect_plate_boxes, read_plate_crops
+
+# Minimum IoU between a plate box and a track's last box to continue the track.
+IOU_THRESHOLD = 0.3
+# A track not matched for this many consecutive frames is closed.
+MAX_AGE = 5
+# A plate crop is read again when its quality beats the best read crop of its track by this factor.
+QUALITY_MARGIN = 1.2
+
+
+def box_iou(a, b):
+    """
+    Intersection over union of two (x1, y1, x2, y2) boxes.
+    """
+    w = min(a[2], b[2]) - max(a[0], b[0])
+    h = min(a[3], b[3]) - max(a[1], b[1])
+    if w <= 0 or h <= 0:
+        return 0.0
+    inter = w * h
+    return inter / ((a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter)
+
+
+def crop_quality(crop):
+    """
+    Area times sharpness (variance of the Laplacian) of an RGB plate crop:
+    large, well-focused crops score highest.
+    """
+    gray = cv2.cvtColor(crop, cv2.COLOR_RGB2GRAY)
+    return crop.shape[0] * crop.shape[1] * cv2.Laplacian(gray, cv2.CV_64F).var()
+
+
+class PlateTrack:
+    def __init__(self, track_id, box):
+        self.track_id = track_id
+        self.box = box
+        self.age = 0                    # frames since the track was last matched
+        self.since_read = 0             # observations since the last OCR of the track
+        self.best_quality = None        # quality of the best crop read so far
+        self.votes = defaultdict(float)  # plate string -> summed character confidence
+
+    @property
+    def plate(self):
+        """
+        Plate string with the highest summed confidence, '' until a plate was read.
+        """
+        return max(self.votes, key=self.votes.get) if self.votes else ''
+
+
+class PlateTracker:
+    def __init__(self, iou_threshold=IOU_THRESHOLD, max_age=MAX_AGE, ocr_every=None,
+                 quality_margin=QUALITY_MARGIN):
+        """
+        Plate recognition over consecutive frames of one video, with the character model
+        run once per vehicle rather than once per frame.
+
+        Plate boxes are detected on every frame and associated with the boxes of the
+        previous frames by greedy IoU matching. The character model only reads the crop of
+        a track when the track is new, when the crop's quality (see crop_quality) beats the
+        best crop read so far by quality_margin, or, with ocr_every, after ocr_every
+        observations without a read. The strings read for a track are fused by confidence
+        voting and every frame of the track reports the winning string at that point.
+
+        Parameters:
+          - iou_threshold: Minimum IoU to continue a track.
+          - max_age: Number of frames without a match after which a track is closed.
+          - ocr_every: Read every ocr_every-th observation of a track, None to only read on
+            new tracks and better crops.
+          - quality_margin: Factor by which a crop must beat the best read crop to be read.
+        """
+        self.iou_threshold = iou_threshold
+        self.max_age = max_age
+        self.ocr_every = ocr_every
+        self.quality_margin = quality_margin
+        self.tracks = []
+        self.next_id = 0
+        self.reads = 0
+        self.observations = 0
+
+    def update(self, images, max_plates=1, metrics=None):
+        """
+        Recognizes the plates of consecutive RGB frames, in order. The plate detector runs
+        once over all frames and the character model once over the crops selected for
+        reading. Returns, per frame, a list of (plate, (x1, y1, x2, y2)) like recognize_plates.
+        """
+        detections = detect_plate_boxes(images, max_plates, metrics)
+        assigned, to_read = [], []
+        for plates in detections:
+            tracks = self._associate([box for box, _ in plates])
+            for (_, crop), track in zip(plates, tracks):
+                self.observations += 1
+                track.since_read += 1
+                quality = crop_quality(crop)
+                if (track.best_quality is None or quality > track.best_quality * self.quality_margin
+                        or (self.ocr_every and track.since_read >= self.ocr_every)):
+                    track.best_quality = max(quality, track.best_quality or 0.0)
+                    track.since_read = 0
+                    to_read.append((len(assigned), crop, track))
+            assigned.append(tracks)
+
+        # Frames are labeled in order, so a frame sees the votes of its batch's reads up to
+        # itself only; reads of later frames in the batch are applied after it.
+        reads = iter(zip(to_read, read_plate_crops([crop for _, crop, _ in to_read], metrics)))
+        self.reads += len(to_read)
+        pending = next(reads, None)
+        results = []
+        for frame, (plates, tracks) in enumerate(zip(detections, assigned)):
+            while pending is not None and pending[0][0] == frame:
+                (_, _, track), (plate, conf) = pending
+                if plate:
+                    track.votes[plate] += conf
+                pending = next(reads, None)
+            results.append([(track.plate, box) for (box, _), track in zip(plates, tracks)])
+        return results
+
+    def _associate(self, boxes):
+        """
+        Matches the boxes of one frame to open tracks (highest IoU first), starts new tracks
+        for the unmatched boxes, ages the unmatched tracks and closes the stale ones.
+        Returns the track of every box.
+        """
+        pairs = sorted(((box_iou(box, track.box), i, j) for i, box in enumerate(boxes)
+                        for j, track in enumerate(self.tracks)), reverse=True)
+        matched, used = {}, set()
+        for iou, i, j in pairs:
+            if iou < self.iou_threshold:
+                break
+            if i in matched or j in used:
+                continue
+            matched[i] = self.tracks[j]
+            used.add(j)
+
+        for j, track in enumerate(self.tracks):
+            track.age = 0 if j in used else track.age + 1
+        self.tracks = [track for track in self.tracks if track.age <= self.max_age]
+
+        tracks = []
+        for i, box in enumerate(boxes):
+            track = matched.get(i)
+            if track is None:
+                track = PlateTrack(self.next_id, box)
+                self.next_id += 1
+                self.tracks.append(track)
+            track.box = box
+            tracks.append(track)
+        return tracks
+
+    def detect_plate_chars_batch(self, images, metrics=None):
+        """
+        Same output as plate_recognizer.detect_plate_chars_batch for consecutive frames:
+        one (plate, (x1, y1, x2, y2)) or (None, None) per frame.
+        """
+        return [plates[0] if plates else (None, None) for plates in self.update(images, 1, metrics)]
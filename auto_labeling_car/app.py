@@ -1,8 +1,16 @@
-from flask import Blueprint, render_template, request, jsonify
-from threading import Thread, Lock
-import time
+from flask import Blueprint, render_template, request, jsonify, Response
 import os
+import time
 from .automatic_labeling import Labeling
+from .parallel import label_images_parallel
+from .manifest import LabelingManifest
+from .writer import AnnotationWriter
+from .prefetch import stream_image_paths
+from .jobs import JobManager, LabelingJob
+from .models import warm_up
+from .metrics import to_prometheus
+from .inference_cache import get_inference_cache
+from .video import label_video, is_video_source, is_stream_source
 
 
 
@@ -22,60 +30,195 @@ automatic_labeling_app = Blueprint(
 # Point template_folder one level up to use the project’s templates
 # automatic_labeling_app = Blueprint('automatic_labeling_app', __name__, template_folder='./templates')
 
-progress = {
-    "processing": False,
-    "total": 0,
-    "processed": 0,
-    "start_time": None
-}
-progress_lock = Lock()
+# Number of images sent through each model in one forward pass.
+BATCH_SIZE = 8
+# LABELING_REUSE_CAR_BOX=1 classifies the car color on the car detector's box instead of
+# running YOLOv4 again; off by default, so CarColor is computed as before.
+REUSE_CAR_BOX = os.environ.get("LABELING_REUSE_CAR_BOX", "0") == "1"
+# Number of labeling worker processes; 1 runs the pipeline in the request's thread.
+WORKERS = int(os.environ.get("LABELING_WORKERS", 1))
+# Annotation output: "xml" (one file per image), "jsonl" or "parquet" (one file per run).
+OUTPUT_FORMAT = os.environ.get("LABELING_OUTPUT_FORMAT", "xml")
+# Threads decoding images ahead of inference in single-process mode; 0 decodes them inline.
+# Worker processes (WORKERS > 1) decode each chunk inline.
+PREFETCH_THREADS = int(os.environ.get("LABELING_PREFETCH_THREADS", 4))
+# Number of labeling jobs run at the same time; further submissions are queued.
+MAX_CONCURRENT_JOBS = int(os.environ.get("LABELING_MAX_JOBS", 1))
+
+# Video sources: only every VIDEO_STRIDE-th frame is considered, and frames whose dHash is
+# within VIDEO_DEDUPE_DISTANCE bits of the last labeled frame are skipped.
+VIDEO_STRIDE = int(os.environ.get("LABELING_VIDEO_STRIDE", 5))
+if VIDEO_STRIDE < 1:
+    raise ValueError(f"LABELING_VIDEO_STRIDE must be at least 1, got {VIDEO_STRIDE}")
+VIDEO_DEDUPE_DISTANCE = int(os.environ.get("LABELING_VIDEO_DEDUPE_DISTANCE", 4))
+# Live streams never end: a stream job stops after VIDEO_MAX_FRAMES labeled frames or
+# VIDEO_MAX_SECONDS of reading, whichever comes first (0 disables a limit; with both at 0
+# the job runs until it is cancelled). Video files are always labeled to the end.
+VIDEO_MAX_FRAMES = int(os.environ.get("LABELING_VIDEO_MAX_FRAMES", 1000))
+VIDEO_MAX_SECONDS = float(os.environ.get("LABELING_VIDEO_MAX_SECONDS", 600))
 
-def process_images(source_dir, output_dir):
-    global progress
+job_manager = JobManager(max_workers=MAX_CONCURRENT_JOBS)
+
+def process_images(source_dir, output_dir, job=None, batch_size=BATCH_SIZE, workers=WORKERS, incremental=False,
+                   output_format=OUTPUT_FORMAT):
+    """
+    Labels every image of source_dir into output_dir and reports progress on job
+    (a LabelingJob, created if not given).
+    Results are serialized by a background AnnotationWriter.
+    The directory is streamed rather than listed up front and images are decoded by
+    PREFETCH_THREADS threads while the models run, so the job's total grows as images
+    are discovered.
+    In incremental mode, images whose XML is still valid according to the run manifest
+    are skipped, so an interrupted or repeated run only labels new or changed images
+    (or all of them after a model weights change).
+    Per-stage timings are collected in job.metrics and written to
+    labeling-metrics-<job_id>.json in output_dir when the run ends.
+    Detector results are looked up in and added to the shared InferenceCache.
+    Images that cannot be decoded are listed in job.errors and skipped.
+    """
+    if job is None:
+        job = LabelingJob(source_dir, output_dir)
+        job.start()
+    manifest = None
     try:
-        labeling = Labeling(source_dir, output_dir)
-        image_extensions = [".jpg", ".jpeg", ".png", ".bmp"]
-        images = [f for f in os.listdir(source_dir) if any(f.lower().endswith(ext) for ext in image_extensions)]
-        
-        with progress_lock:
-            progress["total"] = len(images)
-            progress["processed"] = 0
-            progress["processing"] = True
-            progress["start_time"] = time.time()
-
-        for i, file in enumerate(images):
-            img_path = os.path.join(source_dir, file)
-            labeling.extract_info(img_path)
-            labeling.save_xml(file)
-            
-            with progress_lock:
-                progress["processed"] = i + 1
-
-        with progress_lock:
-            progress["processing"] = False
+        if incremental:
+            manifest = LabelingManifest(output_dir, check_outputs=(output_format == "xml"))
+
+        def discovered_paths():
+            # Paths are streamed from the directory listing; the total grows as they are found.
+            for img_path in stream_image_paths(source_dir):
+                if job.cancelled:
+                    return
+                if manifest is not None and manifest.is_up_to_date(img_path):
+                    continue
+                job.image_found()
+                yield img_path
+
+        def skip_image(img_path, error):
+            # An unreadable image is reported on the job and counted as processed so that
+            # the progress still reaches the total; the other images are labeled.
+            job.add_error(f"{os.path.basename(img_path)}: {error}")
+            job.image_done()
+
+        if workers > 1:
+            annotated = label_images_parallel(discovered_paths(), source_dir, output_dir, workers, batch_size,
+                                              REUSE_CAR_BOX, job.metrics, get_inference_cache(), skip_image)
+        else:
+            labeling = Labeling(source_dir, output_dir, reuse_car_box=REUSE_CAR_BOX, metrics=job.metrics,
+                                cache=get_inference_cache())
+            annotated = labeling.annotate_images(discovered_paths(), batch_size, PREFETCH_THREADS, skip_image)
+
+        with AnnotationWriter(output_dir, output_format, metrics=job.metrics, run_id=job.job_id) as writer:
+            for img_path, annotation in annotated:
+                # The manifest entry is recorded by the writer thread once the output is on disk.
+                on_written = (lambda path=img_path: manifest.record(path)) if manifest is not None else None
+                writer.write(os.path.basename(img_path), annotation, on_written)
+                job.image_done()
+
+        if manifest is not None:
+            manifest.save()
+
+        progress = job.to_dict()
+        job.metrics.dump(os.path.join(output_dir, f"labeling-metrics-{job.job_id}.json"),
+                         **{key: progress[key] for key in ("job_id", "source_dir", "output_dir", "total",
+                                                           "processed", "elapsed", "throughput")})
 
     except Exception as e:
-        with progress_lock:
-            progress["processing"] = False
+        if manifest is not None:
+            manifest.close()
         raise e
 
+    return job
+
+def process_video(source, output_dir, job=None, batch_size=BATCH_SIZE, output_format=OUTPUT_FORMAT):
+    """
+    Labels the sampled frames of a video file or stream URL into output_dir (see label_video)
+    and reports progress on job (a LabelingJob, created if not given). The kept frames are
+    saved next to their annotations so the output can be evaluated like an image folder.
+    A live stream is labeled for at most VIDEO_MAX_FRAMES frames and VIDEO_MAX_SECONDS seconds,
+    or until the job is cancelled.
+    """
+    if job is None:
+        job = LabelingJob(source, output_dir)
+        job.start()
+    stream = is_stream_source(source)
+    max_frames = (VIDEO_MAX_FRAMES or None) if stream else None
+    max_seconds = (VIDEO_MAX_SECONDS or None) if stream else None
+    label_video(source, output_dir, output_format, batch_size, stride=VIDEO_STRIDE,
+                dedupe_distance=VIDEO_DEDUPE_DISTANCE, max_frames=max_frames, max_seconds=max_seconds,
+                save_frames=True, reuse_car_box=REUSE_CAR_BOX, job=job)
+
+    progress = job.to_dict()
+    job.metrics.dump(os.path.join(output_dir, f"labeling-metrics-{job.job_id}.json"),
+                     **{key: progress[key] for key in ("job_id", "source_dir", "output_dir", "total",
+                                                       "processed", "elapsed", "throughput")})
+    return job
+
 @automatic_labeling_app.route('/progress')
 def get_progress():
-    with progress_lock:
-        return jsonify(progress)
+    """
+    Progress of the most recently submitted job.
+    """
+    job = job_manager.latest()
+    if job is None:
+        return jsonify({"processing": False, "total": 0, "processed": 0, "start_time": None})
+    return jsonify(job.to_dict())
+
+@automatic_labeling_app.route('/progress/<job_id>')
+def get_job_progress(job_id):
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job id"}), 404
+    return jsonify(job.to_dict())
+
+@automatic_labeling_app.route('/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """
+    Stops a queued or running job after the image or frame being labeled.
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job id"}), 404
+    job.cancel()
+    return jsonify(job.to_dict())
+
+@automatic_labeling_app.route('/metrics')
+def metrics():
+    """
+    Per-stage latency histograms and image counters of all known jobs, in the Prometheus text format.
+    """
+    return Response(to_prometheus(job_manager.list()), mimetype="text/plain; version=0.0.4")
+
+@automatic_labeling_app.route('/jobs')
+def get_jobs():
+    return jsonify([job.to_dict() for job in job_manager.list()])
+
+@automatic_labeling_app.route('/warmup', methods=['POST'])
+def warmup():
+    """
+    Loads all models now instead of on the first labeling job,
+    e.g. from a deployment hook right after a worker starts.
+    """
+    start = time.time()
+    loaded = warm_up()
+    return jsonify({"loaded": loaded, "seconds": round(time.time() - start, 3)})
 
 @automatic_labeling_app.route('/', methods=['GET', 'POST'])
 def index():
     if request.method == 'POST':
         source_dir = request.form['source_dir']
         output_dir = request.form['output_dir']
+        incremental = request.form.get('incremental') == 'on'
         
-        if not os.path.isdir(source_dir):
-            return render_template('index.html', error="Invalid image directory!")
-        
-        thread = Thread(target=process_images, args=(source_dir, output_dir))
-        thread.start()
+        if os.path.isdir(source_dir):
+            job = job_manager.submit(process_images, source_dir, output_dir, incremental=incremental)
+        elif is_video_source(source_dir) and ("://" in source_dir or os.path.isfile(source_dir)):
+            if OUTPUT_FORMAT == "parquet" and is_stream_source(source_dir):
+                return render_template('index.html', error="Parquet output is not supported for live streams!")
+            job = job_manager.submit(process_video, source_dir, output_dir)
+        else:
+            return render_template('index.html', error="Invalid image directory or video source!")
         
-        return render_template('processing.html')
+        return render_template('processing.html', job_id=job.job_id)
     
     return render_template('index.html')
\ No newline at end of file
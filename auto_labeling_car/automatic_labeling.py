@@ -1,41 +1,171 @@
 import os
-import xml.etree.ElementTree as ET
 
-from .car_color_classifier.car_color_classifier_yolo4 import detect_car_color
-from .iranian_car_detection.detection import detect_cars
-from .Iranian_Plate_Recognitiont.plate_recognizer import detect_plate_chars, process_image
+from .car_color_classifier.car_color_classifier_yolo4 import detect_car_colors, detect_car_colors_in_boxes
+from .iranian_car_detection.detection import detect_cars_images
+from .Iranian_Plate_Recognitiont.plate_recognizer import detect_plate_chars_batch
+from .frame import Frame
+from .prefetch import prefetch_frames
+from .metrics import profile
+from .inference_cache import CAR, PLATE, COLOR_YOLOV4, COLOR_CAR_BOX
+from .writer import write_xml
 
 class Labeling:
-    def __init__(self, source_dir: str, output_dir: str):
+    def __init__(self, source_dir: str, output_dir: str, reuse_car_box: bool = False, metrics=None, cache=None,
+                 plate_tracker=None):
+        """
+        Parameters:
+          - source_dir: Directory containing the images to label.
+          - output_dir: Directory the XML files are written to.
+          - reuse_car_box: If True, the car color is classified on the crop of the box found
+            by the YOLOv5 car detector instead of running YOLOv4 to find the car again.
+            YOLOv4 is then only used when the car detector finds nothing.
+          - metrics: Optional StageMetrics receiving the wall time of every pipeline stage.
+          - cache: Optional InferenceCache; cached car, plate and color results are reused
+            and a model only runs on the images it has no result for.
+          - plate_tracker: Optional PlateTracker for images that are consecutive frames of one
+            video; plates are then tracked across frames and read once per vehicle.
+            Tracked plates depend on the previous frames, so they are not cached.
+        """
         self.source_dir = source_dir
         self.output_dir = output_dir
-    def extract_info(self, img_path: str) -> None:
+        self.reuse_car_box = reuse_car_box
+        self.metrics = metrics
+        self.cache = cache
+        self.plate_tracker = plate_tracker
+
+    def extract_info(self, img_path: str, frame: Frame = None) -> None:
         """
         Runs detection on the given image and stores attributes as instance variables.
+        The image is decoded once (unless an already decoded frame is given) and the
+        same frame is shared by all detectors.
         """
-        self.img_path = img_path
+        if frame is None:
+            frame = self._decode(img_path)
+        for _ in self._extract_frame_batch([(img_path, frame)]):
+            pass
 
-        # Detect car color.
-        self.color = detect_car_color(self.img_path)
+    def extract_batch(self, img_paths: list, batch_size: int = 8, on_error=None):
+        """
+        Batched extract_info. Images are decoded batch_size at a time and every stage
+        (color, car detection, plate detection, character recognition) runs once per batch.
 
-        # Detect car and get car coordinates along with its model.
-        # Expected to return a tuple: (car_model, (x1, y1, x2, y2))
-        self.car_model, (x1_car, y1_car, x2_car, y2_car) = detect_cars(self.img_path, save_output=False)
-        self.car_coordinates = {
-            "X": x1_car,
-            "Y": y1_car,
-            "Width": x2_car - x1_car,
-            "Height": y2_car - y1_car
-        }
+        This is a generator: after each image's attributes are set on the instance, its
+        path is yielded so the caller can call save_xml before the next image is loaded.
+        An image that cannot be decoded raises, unless on_error is given: on_error(img_path,
+        error) is then called and the image is skipped.
+        """
+        return self.extract_frames(self._decode_all(img_paths, on_error), batch_size)
+
+    def _decode_all(self, img_paths, on_error=None):
+        for img_path in img_paths:
+            try:
+                frame = self._decode(img_path)
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(img_path, e)
+                continue
+            yield img_path, frame
+
+    def _decode(self, img_path: str) -> Frame:
+        with profile(self.metrics, "decode"):
+            return Frame.from_path(img_path)
 
-        # Recognize license plate and get its coordinates.
-        # Expected to return a tuple: (plate_number, (x1, y1, x2, y2))
-        self.plate_number, (x1_plate, y1_plate, x2_plate, y2_plate) = process_image(self.img_path)
-        self.plate_coordinates = {
-            "X": x1_plate,
-            "Y": y1_plate,
-            "Width": x2_plate - x1_plate,
-            "Height": y2_plate - y1_plate
+    def extract_frames(self, frames, batch_size: int = 8):
+        """
+        Same as extract_batch for an iterable of already decoded (img_path, Frame) pairs,
+        e.g. the output of prefetch_frames. The iterable is consumed lazily, batch by batch.
+        """
+        batch = []
+        for item in frames:
+            batch.append(item)
+            if len(batch) == batch_size:
+                yield from self._extract_frame_batch(batch)
+                batch = []
+        if batch:
+            yield from self._extract_frame_batch(batch)
+
+    def _extract_frame_batch(self, batch: list):
+        paths = [path for path, _ in batch]
+        frames = [frame for _, frame in batch]
+
+        keys = [self.cache.image_key(path) for path in paths] if self.cache is not None else None
+        found = self.cache.get_many(keys) if keys is not None else [{} for _ in paths]
+
+        def detect_cars(indices):
+            with profile(self.metrics, "car_detection", len(indices)):
+                return detect_cars_images([frames[i].rgb for i in indices])
+        cars = self._cached(keys, found, CAR, detect_cars)
+
+        if self.reuse_car_box:
+            colors = self._cached(keys, found, COLOR_CAR_BOX, lambda indices: detect_car_colors_in_boxes(
+                [frames[i].bgr for i in indices], [cars[i][1] for i in indices], metrics=self.metrics))
+        else:
+            colors = self._cached(keys, found, COLOR_YOLOV4, lambda indices: detect_car_colors(
+                [frames[i].bgr for i in indices], metrics=self.metrics))
+        if self.plate_tracker is not None:
+            plates = self.plate_tracker.detect_plate_chars_batch([frame.rgb for frame in frames], self.metrics)
+        else:
+            plates = self._cached(keys, found, PLATE, lambda indices: detect_plate_chars_batch(
+                [frames[i].rgb for i in indices], self.metrics))
+
+        for path, color, (car_model, car_box), (plate_number, plate_box) in zip(paths, colors, cars, plates):
+            self.img_path = path
+            self.set_info(color, car_model, car_box, plate_number, plate_box)
+            yield path
+
+    def _cached(self, keys, found, field, compute) -> list:
+        """
+        Returns the field result of every image of a batch. Results missing from found
+        (the cache lookup of the batch) are computed with compute(indices) in one call
+        and stored in the cache.
+        """
+        values = [entry.get(field) for entry in found]
+        missing = [i for i, entry in enumerate(found) if field not in entry]
+        if missing:
+            computed = compute(missing)
+            for i, value in zip(missing, computed):
+                values[i] = value
+            if self.cache is not None:
+                self.cache.put_many([(keys[i], field, value) for i, value in zip(missing, computed)])
+        return values
+
+    def annotate_images(self, img_paths, batch_size: int = 8, prefetch_threads: int = 0, on_error=None):
+        """
+        Labels img_paths with extract_batch.
+        Yields an (img_path, annotation) pair per image; writing is left to the caller.
+        With prefetch_threads > 0, images are decoded ahead of inference by that many
+        threads (see prefetch_frames) and img_paths may be any iterable of paths.
+        With on_error, images that cannot be decoded are reported as on_error(img_path,
+        error) and skipped instead of ending the run.
+        """
+        if prefetch_threads > 0:
+            frames = prefetch_frames(img_paths, prefetch_threads, 4 * batch_size, self.metrics, on_error)
+            img_paths = self.extract_frames(frames, batch_size)
+        else:
+            img_paths = self.extract_batch(list(img_paths), batch_size, on_error)
+        for img_path in img_paths:
+            yield img_path, self.annotation()
+
+    def set_info(self, color, car_model, car_box, plate_number, plate_box) -> None:
+        """
+        Stores detection results as instance variables, converting (x1, y1, x2, y2)
+        boxes into X/Y/Width/Height coordinates. A missing box is stored as zeros.
+        """
+        self.color = color
+        self.car_model = car_model
+        self.car_coordinates = self.box_to_coordinates(car_box)
+        self.plate_number = plate_number
+        self.plate_coordinates = self.box_to_coordinates(plate_box)
+
+    @staticmethod
+    def box_to_coordinates(box) -> dict:
+        x1, y1, x2, y2 = box if box is not None else (0, 0, 0, 0)
+        return {
+            "X": x1,
+            "Y": y1,
+            "Width": x2 - x1,
+            "Height": y2 - y1
         }
 
     def parse_plate_number(self):
@@ -77,58 +207,41 @@ class Labeling:
         return reg_prefix, candidate_series, reg_number, province_code
 
 
-    def save_xml(self, img_name: str) -> None:
+    def annotation(self) -> dict:
         """
-        Creates an XML file with the required structure containing:
+        Returns the labeling result of the current image as a dictionary mirroring the
+        CarData XML structure:
           - License plate details (parsed from the recognized plate)
           - Car model (from detection)
           - Car color (from detection)
           - License plate coordinates and car coordinates
-        The XML file is saved in the output directory using the image file's base name.
         """
         # Parse the plate number into components.
         reg_prefix, series_letter, reg_number, province_code = self.parse_plate_number()
+        return {
+            "LicensePlate": {
+                "RegistrationPrefix": reg_prefix,
+                "SeriesLetter": series_letter,
+                "RegistrationNumber": reg_number,
+                "ProvinceCode": province_code
+            },
+            # Car model and color from detection (or "Unknown" if not available).
+            "CarModel": self.car_model if self.car_model else "Unknown",
+            "CarColor": self.color if self.color else "Unknown",
+            "LicensePlateCoordinates": dict(self.plate_coordinates),
+            "CarCoordinates": dict(self.car_coordinates)
+        }
 
-        # Create XML structure.
-        root = ET.Element("CarData")
-        
-        # LicensePlate block.
-        license_plate = ET.SubElement(root, "LicensePlate")
-        ET.SubElement(license_plate, "RegistrationPrefix").text = reg_prefix
-        ET.SubElement(license_plate, "SeriesLetter").text = series_letter
-        ET.SubElement(license_plate, "RegistrationNumber").text = reg_number
-        ET.SubElement(license_plate, "ProvinceCode").text = province_code
-
-        # CarModel element: save the detected car model.
-        ET.SubElement(root, "CarModel").text = self.car_model if self.car_model else "Unknown"
-        
-        # CarColor from detection (or "Unknown" if not available).
-        ET.SubElement(root, "CarColor").text = self.color if self.color else "Unknown"
-
-        # LicensePlateCoordinates block.
-        lp_coords = ET.SubElement(root, "LicensePlateCoordinates")
-        ET.SubElement(lp_coords, "X").text = str(self.plate_coordinates.get("X", 0))
-        ET.SubElement(lp_coords, "Y").text = str(self.plate_coordinates.get("Y", 0))
-        ET.SubElement(lp_coords, "Width").text = str(self.plate_coordinates.get("Width", 0))
-        ET.SubElement(lp_coords, "Height").text = str(self.plate_coordinates.get("Height", 0))
-
-        # CarCoordinates block.
-        car_coords = ET.SubElement(root, "CarCoordinates")
-        ET.SubElement(car_coords, "X").text = str(self.car_coordinates.get("X", 0))
-        ET.SubElement(car_coords, "Y").text = str(self.car_coordinates.get("Y", 0))
-        ET.SubElement(car_coords, "Width").text = str(self.car_coordinates.get("Width", 0))
-        ET.SubElement(car_coords, "Height").text = str(self.car_coordinates.get("Height", 0))
-
+    def save_xml(self, img_name: str) -> None:
+        """
+        Creates an XML file from annotation() and saves it synchronously in the output
+        directory using the image file's base name. The labeling loops use
+        AnnotationWriter instead so that inference does not wait on the filesystem.
+        """
         # Ensure the output directory exists.
         os.makedirs(self.output_dir, exist_ok=True)
 
-        # Use the image file's base name (with .xml extension) for the XML file.
-        base_name = os.path.splitext(os.path.basename(img_name))[0]
-        xml_file_path = os.path.join(self.output_dir, base_name + ".xml")
-
-        # Write XML to file with declaration and UTF-8 encoding.
-        tree = ET.ElementTree(root)
-        tree.write(xml_file_path, encoding="utf-8", xml_declaration=True)
+        xml_file_path = write_xml(self.output_dir, img_name, self.annotation())
         print(f"XML saved: {xml_file_path}")
 
     def process_directory(self) -> None:
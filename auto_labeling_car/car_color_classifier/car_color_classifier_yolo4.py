@@ -2,67 +2,202 @@ import numpy as np
 import time
 import cv2
 import os
-from  .classifier import Classifier
+from threading import Lock
+from  .classifier import Classifier, QuantizedClassifier
+from ..metrics import profile
 
-def detect_car_color(image_path, yolo_path='./auto_labeling_car/car_color_classifier/yolov4', confidence_threshold=0.5, nms_threshold=0.3):
-    car_color_classifier = Classifier()
-    
-    # Load YOLO class labels
-    labelsPath = os.path.sep.join([yolo_path, "coco.names"])
-    LABELS = open(labelsPath).read().strip().split("\n")
-    
-    # Load YOLO model
-    weightsPath = os.path.sep.join([yolo_path, "yolov4.weights"])
-    configPath = os.path.sep.join([yolo_path, "yolov4.cfg"])
-    net = cv2.dnn.readNetFromDarknet(configPath, weightsPath)
-    
+DEFAULT_YOLO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'yolov4')
+# "int8" classifies colors with the quantized TFLite model (see quantize.py) instead of the float graph.
+COLOR_MODEL = os.environ.get("LABELING_COLOR_MODEL", "float")
+# YOLOv4 network input size; any multiple of 32 works, 416 or 320 trade recall on small cars for speed.
+DEFAULT_INPUT_SIZE = 608
+
+# Process-wide model registry: the Darknet net, its output layer names, the COCO labels
+# and the color classifier's TF session are loaded on first use and reused afterwards.
+_yolo_models = {}
+_color_classifier = None
+_models_lock = Lock()
+
+def load_yolo(yolo_path):
+    """
+    Returns (net, output_layers, labels, lock) for the YOLOv4 model in yolo_path.
+    The model is read from disk only the first time a given yolo_path is requested.
+    The returned lock must be held around setInput/forward since the net is shared.
+    """
+    with _models_lock:
+        if yolo_path not in _yolo_models:
+            # Load YOLO class labels
+            labelsPath = os.path.sep.join([yolo_path, "coco.names"])
+            LABELS = open(labelsPath).read().strip().split("\n")
+
+            # Load YOLO model
+            weightsPath = os.path.sep.join([yolo_path, "yolov4.weights"])
+            configPath = os.path.sep.join([yolo_path, "yolov4.cfg"])
+            net = cv2.dnn.readNetFromDarknet(configPath, weightsPath)
+
+            # Get YOLO output layer names
+            layer_names = net.getLayerNames()
+            output_layers = [layer_names[i - 1] for i in net.getUnconnectedOutLayers().flatten()]
+
+            _yolo_models[yolo_path] = (net, output_layers, LABELS, Lock())
+        return _yolo_models[yolo_path]
+
+def get_color_classifier():
+    """
+    Returns the shared car color classifier, creating it on first use
+    (a QuantizedClassifier when COLOR_MODEL is "int8").
+    """
+    global _color_classifier
+    with _models_lock:
+        if _color_classifier is None:
+            _color_classifier = QuantizedClassifier() if COLOR_MODEL == "int8" else Classifier()
+        return _color_classifier
+
+def detect_car_color(image_path, yolo_path=DEFAULT_YOLO_PATH, confidence_threshold=0.5, nms_threshold=0.3,
+                     input_size=DEFAULT_INPUT_SIZE, metrics=None):
     # Load input image
     image = cv2.imread(image_path)
+    return detect_car_color_image(image, yolo_path, confidence_threshold, nms_threshold, input_size, metrics)
+
+def detect_car_color_image(image, yolo_path=DEFAULT_YOLO_PATH, confidence_threshold=0.5, nms_threshold=0.3,
+                           input_size=DEFAULT_INPUT_SIZE, metrics=None):
+    """
+    Same as detect_car_color, for an already decoded BGR image.
+    input_size is the square YOLOv4 input; 416 or 320 speed up color-only detection.
+    The YOLOv4 pass and the color classification are timed in metrics (a StageMetrics) if given.
+    """
+    car_color_classifier = get_color_classifier()
+    net, output_layers, LABELS, net_lock = load_yolo(yolo_path)
     (H, W) = image.shape[:2]
     
-    # Get YOLO output layer names
-    layer_names = net.getLayerNames()
-    output_layers = [layer_names[i - 1] for i in net.getUnconnectedOutLayers().flatten()]
-    
     # Convert image to blob and perform forward pass
-    blob = cv2.dnn.blobFromImage(image, 1 / 255.0, (608, 608), swapRB=True, crop=False)
-    net.setInput(blob)
-    outputs = net.forward(output_layers)
+    with profile(metrics, "yolov4"):
+        blob = cv2.dnn.blobFromImage(image, 1 / 255.0, (input_size, input_size), swapRB=True, crop=False)
+        with net_lock:
+            net.setInput(blob)
+            outputs = net.forward(output_layers)
     
-    # Initialize bounding box lists
-    boxes, confidences, classIDs = [], [], []
+    box = find_car_box(outputs, W, H, confidence_threshold, nms_threshold)
+    if box is not None:
+        x, y, w, h = box
+        car_crop = image[max(y, 0):y + h, max(x, 0):x + w]
+        
+        # Predict car color
+        with profile(metrics, "color_classification"):
+            result = car_color_classifier.predict(car_crop)
+        return result[0]['color']
     
-    # Process detections
-    for output in outputs:
-        for detection in output:
-            scores = detection[5:]
-            classID = np.argmax(scores)
-            confidence = scores[classID]
-            
-            if confidence > confidence_threshold:
-                box = detection[0:4] * np.array([W, H, W, H])
-                (centerX, centerY, width, height) = box.astype("int")
-                x, y = int(centerX - (width / 2)), int(centerY - (height / 2))
-                
-                boxes.append([x, y, int(width), int(height)])
-                confidences.append(float(confidence))
-                classIDs.append(classID)
+    return "No car detected"
+
+def detect_car_colors(images, yolo_path=DEFAULT_YOLO_PATH, confidence_threshold=0.5, nms_threshold=0.3,
+                      input_size=DEFAULT_INPUT_SIZE, metrics=None):
+    """
+    Batched detect_car_color_image: runs one YOLOv4 forward pass over all BGR images and
+    classifies every car crop found with a single Classifier.predict_batch call.
+    Returns one color (or "No car detected") per image.
+    """
+    if not images:
+        return []
+    car_color_classifier = get_color_classifier()
+    net, output_layers, LABELS, net_lock = load_yolo(yolo_path)
+    
+    with profile(metrics, "yolov4", len(images)):
+        blob = cv2.dnn.blobFromImages(images, 1 / 255.0, (input_size, input_size), swapRB=True, crop=False)
+        with net_lock:
+            net.setInput(blob)
+            outputs = net.forward(output_layers)
+    
+    crops, owners = [], []
+    for b, image in enumerate(images):
+        (H, W) = image.shape[:2]
+        # With a batched blob every output holds one (rows, 85) slice per image.
+        image_outputs = [output[b] if output.ndim == 3 else output for output in outputs]
+        box = find_car_box(image_outputs, W, H, confidence_threshold, nms_threshold)
+        if box is not None:
+            x, y, w, h = box
+            crops.append(image[max(y, 0):y + h, max(x, 0):x + w])
+            owners.append(b)
+    
+    colors = ["No car detected"] * len(images)
+    if crops:
+        with profile(metrics, "color_classification", len(crops)):
+            results = car_color_classifier.predict_batch(crops)
+        for b, result in zip(owners, results):
+            colors[b] = result[0]['color']
+    return colors
+
+def detect_car_color_in_box(image, box, yolo_path=DEFAULT_YOLO_PATH, confidence_threshold=0.5, nms_threshold=0.3,
+                            input_size=DEFAULT_INPUT_SIZE, metrics=None):
+    """
+    Classifies the color of the car inside an (x1, y1, x2, y2) box found by another
+    detector, skipping the YOLOv4 pass. Falls back to detect_car_color_image when the
+    box is empty.
+    """
+    return detect_car_colors_in_boxes([image], [box], yolo_path, confidence_threshold, nms_threshold, input_size,
+                                      metrics)[0]
+
+def detect_car_colors_in_boxes(images, boxes, yolo_path=DEFAULT_YOLO_PATH, confidence_threshold=0.5, nms_threshold=0.3,
+                               input_size=DEFAULT_INPUT_SIZE, metrics=None):
+    """
+    Batched detect_car_color_in_box: all crops go through one Classifier.predict_batch
+    call and only the images without a usable box are sent to YOLOv4.
+    """
+    crops, owners, fallback = [], [], []
+    for b, (image, box) in enumerate(zip(images, boxes)):
+        x1, y1, x2, y2 = box if box is not None else (0, 0, 0, 0)
+        x1, y1 = max(x1, 0), max(y1, 0)
+        if x2 > x1 and y2 > y1:
+            crops.append(image[y1:y2, x1:x2])
+            owners.append(b)
+        else:
+            fallback.append(b)
+
+    colors = [None] * len(images)
+    if crops:
+        with profile(metrics, "color_classification", len(crops)):
+            results = get_color_classifier().predict_batch(crops)
+        for b, result in zip(owners, results):
+            colors[b] = result[0]['color']
+    if fallback:
+        fallback_colors = detect_car_colors([images[b] for b in fallback], yolo_path, confidence_threshold, nms_threshold,
+                                            input_size, metrics)
+        for b, color in zip(fallback, fallback_colors):
+            colors[b] = color
+    return colors
+
+def find_car_box(outputs, W, H, confidence_threshold=0.5, nms_threshold=0.3):
+    """
+    Decodes the YOLOv4 outputs of one image and returns the (x, y, w, h) box of the
+    first car kept by non-maxima suppression, or None if there is no car.
+    """
+    # All rows of all output layers as one (rows, 85) array: box, objectness, class scores
+    detections = np.concatenate([output.reshape(-1, output.shape[-1]) for output in outputs])
+    scores = detections[:, 5:]
+    classIDs = scores.argmax(axis=1)
+    confidences = scores.max(axis=1)
+    
+    mask = confidences > confidence_threshold
+    if not mask.any():
+        return None
+    detections, classIDs, confidences = detections[mask], classIDs[mask], confidences[mask]
+    
+    # Center-based boxes scaled to the image, converted to top-left corner boxes
+    centerX, centerY, width, height = (detections[:, 0:4] * np.array([W, H, W, H])).astype("int").T
+    x = np.trunc(centerX - width / 2).astype("int")
+    y = np.trunc(centerY - height / 2).astype("int")
+    boxes = np.stack([x, y, width, height], axis=1)
     
     # Apply non-maxima suppression
-    idxs = cv2.dnn.NMSBoxes(boxes, confidences, confidence_threshold, nms_threshold)
+    idxs = cv2.dnn.NMSBoxes(boxes.tolist(), confidences.tolist(), confidence_threshold, nms_threshold)
     
-    # Process detections
+    # Class ID 2 corresponds to 'car'
     if len(idxs) > 0:
-        for i in idxs.flatten():
-            if classIDs[i] == 2:  # Class ID 2 corresponds to 'car'
-                x, y, w, h = boxes[i]
-                car_crop = image[max(y, 0):y + h, max(x, 0):x + w]
-                
-                # Predict car color
-                result = car_color_classifier.predict(car_crop)
-                return result[0]['color']
+        idxs = np.asarray(idxs).flatten()
+        cars = idxs[classIDs[idxs] == 2]
+        if len(cars):
+            return boxes[cars[0]].tolist()
     
-    return "No car detected"
+    return None
 
 # Example usage:
 # color = detect_car_color("test.jpg")
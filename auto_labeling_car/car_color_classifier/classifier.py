@@ -3,11 +3,10 @@
 
 import numpy as np
 import json
-#import tensorflow as tf
-import tensorflow.compat.v1 as tf   # TensorFlow 2.0
 from PIL import Image, ImageOps
 import cv2
 import io
+from threading import Lock
 from . import config
 
 model_file = config.model_file
@@ -15,8 +14,16 @@ label_file = config.label_file
 input_layer = config.input_layer
 output_layer = config.output_layer
 classifier_input_size = config.classifier_input_size
+quantized_model_file = config.quantized_model_file
+
+def import_tf():
+  # TensorFlow is imported on first use since importing it takes several seconds.
+  #import tensorflow as tf
+  import tensorflow.compat.v1 as tf   # TensorFlow 2.0
+  return tf
 
 def load_graph(model_file):
+  tf = import_tf()
   graph = tf.Graph()
   graph_def = tf.GraphDef()
 
@@ -50,29 +57,84 @@ class Classifier():
         self.input_operation = self.graph.get_operation_by_name(input_name)
         self.output_operation = self.graph.get_operation_by_name(output_name)
 
-        self.sess = tf.Session(graph=self.graph)
+        self.sess = import_tf().Session(graph=self.graph)
         self.sess.graph.finalize()  # Graph is read-only after this statement.
 
     def predict(self, img):
-        img = img[:, :, ::-1]
-        img = cv2.resize(img, classifier_input_size)
-
-        # Add a forth dimension since Tensorflow expects a list of images
-        img = np.expand_dims(img, axis=0)
+        return self.predict_batch([img])[0]
 
-        # Scale the input image to the range used in the trained network
-        img = img.astype(np.float32)
-        img /= 127.5
-        img -= 1.
+    def predict_batch(self, imgs):
+        """
+        Classifies a list of BGR car crops with a single session run.
+        Returns one list of top-3 {"color", "prob"} dicts per crop.
+        """
+        if not imgs:
+            return []
+        batch = preprocess(imgs)
 
         results = self.sess.run(self.output_operation.outputs[0], {
-            self.input_operation.outputs[0]: img
+            self.input_operation.outputs[0]: batch
         })
-        results = np.squeeze(results)
-
-        top = 3
-        top_indices = results.argsort()[-top:][::-1]
-        classes = []
-        for ix in top_indices:
-            classes.append({"color": self.labels[ix], "prob": str(results[ix])})
-        return(classes)
+        return top_predictions(results, self.labels)
+
+class QuantizedClassifier():
+    """
+    Same interface as Classifier, running the INT8 TFLite model written by quantize.py.
+    Uses tflite_runtime when it is installed and TensorFlow's interpreter otherwise.
+    """
+    def __init__(self, model_file=quantized_model_file):
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            Interpreter = import_tf().lite.Interpreter
+
+        self.interpreter = Interpreter(model_path=model_file)
+        self.labels = load_labels(label_file)
+        self.input_index = self.interpreter.get_input_details()[0]["index"]
+        self.output_index = self.interpreter.get_output_details()[0]["index"]
+        self.batch_size = None
+        # The interpreter keeps its tensors between calls, so runs must not overlap.
+        self.lock = Lock()
+
+    def predict(self, img):
+        return self.predict_batch([img])[0]
+
+    def predict_batch(self, imgs):
+        if not imgs:
+            return []
+        batch = preprocess(imgs)
+
+        with self.lock:
+            if self.batch_size != len(batch):
+                self.interpreter.resize_tensor_input(self.input_index, batch.shape)
+                self.interpreter.allocate_tensors()
+                self.batch_size = len(batch)
+            self.interpreter.set_tensor(self.input_index, batch)
+            self.interpreter.invoke()
+            results = self.interpreter.get_tensor(self.output_index)
+        return top_predictions(results, self.labels)
+
+def preprocess(imgs):
+  """
+  Resizes BGR car crops to the classifier input and scales them to [-1, 1] as a float32 batch.
+  """
+  batch = np.stack([cv2.resize(img[:, :, ::-1], classifier_input_size) for img in imgs])
+
+  # Scale the input images to the range used in the trained network
+  batch = batch.astype(np.float32)
+  batch /= 127.5
+  batch -= 1.
+  return batch
+
+def top_predictions(results, labels, top=3):
+  """
+  Turns a batch of softmax scores into one list of top {"color", "prob"} dicts per crop.
+  """
+  predictions = []
+  for scores in results:
+    top_indices = scores.argsort()[-top:][::-1]
+    classes = []
+    for ix in top_indices:
+      classes.append({"color": labels[ix], "prob": str(scores[ix])})
+    predictions.append(classes)
+  return(predictions)
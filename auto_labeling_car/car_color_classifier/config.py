@@ -1,8 +1,14 @@
 # Copyright © 2020 by Spectrico
 # Licensed under the MIT License
 
-model_file = "./auto_labeling_car/car_color_classifier/model-weights-spectrico-car-colors-recognition-mobilenet_v3-224x224-180420.pb"  # path to the car color classifier
-label_file = "./auto_labeling_car/car_color_classifier/labels.txt"   # path to the text file, containing list with the supported makes and models
+import os
+
+# Paths are relative to this file so the classifier loads from any working directory
+# (the labeling app runs from the repository root, the evaluation app from its own folder).
+base_dir = os.path.dirname(os.path.abspath(__file__))
+model_file = os.path.join(base_dir, "model-weights-spectrico-car-colors-recognition-mobilenet_v3-224x224-180420.pb")  # path to the car color classifier
+label_file = os.path.join(base_dir, "labels.txt")   # path to the text file, containing list with the supported makes and models
 input_layer = "input_1"
 output_layer = "Predictions/Softmax/Softmax"
 classifier_input_size = (224, 224) # input size of the classifier
+quantized_model_file = os.path.join(base_dir, "model-weights-spectrico-car-colors-recognition-mobilenet_v3-224x224-180420-int8.tflite")  # INT8 model written by quantize.py
@@ -0,0 +1,122 @@
+import os
+import json
+import argparse
+import cv2
+
+from . import config
+from .classifier import Classifier, QuantizedClassifier, import_tf, preprocess
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+# Minimum share of crops on which the quantized model must agree with the float model.
+MIN_AGREEMENT = 0.98
+
+def load_crops(folder, limit=None):
+    """
+    Reads the car crops of folder as BGR images.
+    Crops stored in sub-folders are labeled with the sub-folder name (e.g. red/001.jpg),
+    crops directly in folder are unlabeled (None).
+    Returns a list of (crop, label) pairs.
+    """
+    crops = []
+    for root, _, files in sorted(os.walk(folder)):
+        label = None if os.path.samefile(root, folder) else os.path.basename(root)
+        for file in sorted(files):
+            if not file.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+            image = cv2.imread(os.path.join(root, file))
+            if image is None:
+                continue
+            crops.append((image, label))
+            if limit is not None and len(crops) >= limit:
+                return crops
+    return crops
+
+def quantize(calibration_dir, output_file=config.quantized_model_file, num_calibration=200):
+    """
+    Converts the frozen float graph to a TFLite model with INT8 weights and activations.
+    Activation ranges are calibrated on up to num_calibration crops of calibration_dir.
+    Input and output stay float32, so the model is a drop-in for Classifier.
+    Returns output_file.
+    """
+    tf = import_tf()
+    crops = load_crops(calibration_dir, num_calibration)
+    if not crops:
+        raise ValueError(f"No calibration images found in {calibration_dir}")
+
+    def representative_dataset():
+        for crop, _ in crops:
+            yield [preprocess([crop])]
+
+    size = config.classifier_input_size
+    converter = tf.lite.TFLiteConverter.from_frozen_graph(
+        config.model_file, [config.input_layer], [config.output_layer],
+        input_shapes={config.input_layer: [1, size[1], size[0], 3]})
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = representative_dataset
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+
+    with open(output_file, "wb") as f:
+        f.write(converter.convert())
+    return output_file
+
+def compare(eval_dir, quantized_file=config.quantized_model_file, batch_size=32, min_agreement=MIN_AGREEMENT):
+    """
+    Runs the float and the quantized model over the crops of eval_dir.
+    Reports top-1 agreement between the two and, for labeled crops (see load_crops),
+    the accuracy of each model. The quantized model is accepted when the agreement
+    is at least min_agreement.
+    """
+    crops = load_crops(eval_dir)
+    if not crops:
+        raise ValueError(f"No evaluation images found in {eval_dir}")
+    float_model, quantized_model = Classifier(), QuantizedClassifier(quantized_file)
+
+    float_colors, quantized_colors = [], []
+    for start in range(0, len(crops), batch_size):
+        batch = [crop for crop, _ in crops[start:start + batch_size]]
+        float_colors += [result[0]["color"] for result in float_model.predict_batch(batch)]
+        quantized_colors += [result[0]["color"] for result in quantized_model.predict_batch(batch)]
+
+    labels = [label for _, label in crops]
+    labeled = [i for i, label in enumerate(labels) if label is not None]
+    agreement = sum(f == q for f, q in zip(float_colors, quantized_colors)) / len(crops)
+    report = {
+        "images": len(crops),
+        "labeled_images": len(labeled),
+        "top1_agreement": agreement,
+        "float_accuracy": None,
+        "quantized_accuracy": None,
+        "accepted": agreement >= min_agreement,
+    }
+    if labeled:
+        report["float_accuracy"] = sum(float_colors[i] == labels[i] for i in labeled) / len(labeled)
+        report["quantized_accuracy"] = sum(quantized_colors[i] == labels[i] for i in labeled) / len(labeled)
+    return report
+
+if __name__ == "__main__":
+    # python -m auto_labeling_car.car_color_classifier.quantize --calibration-dir crops/ --eval-dir crops_eval/
+    ap = argparse.ArgumentParser(description="INT8 quantization of the car color classifier")
+    ap.add_argument("--calibration-dir", required=True, help="folder of car crops used for calibration")
+    ap.add_argument("--eval-dir", required=True,
+                    help="folder of car crops used for the float/INT8 comparison, distinct from calibration-dir")
+    ap.add_argument("--output", default=config.quantized_model_file, help="path of the INT8 .tflite model")
+    ap.add_argument("--num-calibration", type=int, default=200, help="number of calibration crops")
+    ap.add_argument("--min-agreement", type=float, default=MIN_AGREEMENT, help="minimum top-1 agreement to accept")
+    args = ap.parse_args()
+    if os.path.realpath(args.eval_dir) == os.path.realpath(args.calibration_dir):
+        ap.error("--eval-dir must differ from --calibration-dir")
+
+    # The candidate is written next to the output and only replaces it once accepted,
+    # so a rejected run keeps the previously accepted model.
+    candidate = args.output + ".tmp"
+    try:
+        quantize(args.calibration_dir, candidate, args.num_calibration)
+        report = compare(args.eval_dir, candidate, min_agreement=args.min_agreement)
+        print(json.dumps(report, indent=2))
+        if report["accepted"]:
+            os.replace(candidate, args.output)
+        else:
+            print(f"Quantized model rejected, {args.output} left unchanged")
+    finally:
+        if os.path.exists(candidate):
+            os.remove(candidate)
@@ -0,0 +1,28 @@
+import cv2
+
+class Frame:
+    """
+    A decoded image shared by every detector of the labeling pipeline.
+
+    The file is decoded once with OpenCV. `bgr` is the decoded array and `rgb` is a
+    channel-reversed view of the same memory (no copy), for detectors expecting RGB input.
+    """
+    def __init__(self, bgr, path: str = None):
+        self.path = path
+        self.bgr = bgr
+        self.rgb = bgr[:, :, ::-1]
+
+    @classmethod
+    def from_path(cls, path: str) -> "Frame":
+        image = cv2.imread(path)
+        if image is None:
+            raise ValueError(f"Error loading image from path: {path}")
+        return cls(image, path)
+
+    @property
+    def height(self) -> int:
+        return self.bgr.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.bgr.shape[1]
@@ -0,0 +1,152 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+from threading import Lock
+
+from .manifest import file_hash, weights_file_hash, model_weights_paths
+
+# Shared by the labeling pipeline and the semantic accuracy evaluation.
+DEFAULT_CACHE_PATH = os.environ.get(
+    "INFERENCE_CACHE_PATH", os.path.join(os.path.expanduser("~"), ".cache", "data-validation", "inference.sqlite3"))
+# Maximum number of cached results (one per image and field) kept before the least recently used are evicted.
+DEFAULT_MAX_ENTRIES = int(os.environ.get("INFERENCE_CACHE_MAX_ENTRIES", 1_000_000))
+# INFERENCE_CACHE=0 disables the cache in both subsystems.
+CACHE_ENABLED = os.environ.get("INFERENCE_CACHE", "1") != "0"
+
+# Cached fields. Both color fields exist because the color is either classified on the
+# car detector's box (reuse_car_box) or on the car found by YOLOv4.
+CAR = "car"                         # [car_model, [x1, y1, x2, y2]]
+PLATE = "plate"                     # [plate_number, [x1, y1, x2, y2]] or [null, null]
+COLOR_YOLOV4 = "color:yolov4"       # color of the YOLOv4 car crop
+COLOR_CAR_BOX = "color:car_box"     # color of the car detector's box
+
+def models_digest(paths: list = None) -> str:
+    """
+    Combines the content hashes of the model weight files into a single digest.
+    Unlike manifest.weights_hash, only file names and contents are used, so identical
+    weights give the same digest wherever they are stored.
+    """
+    digest = hashlib.sha256()
+    for path in paths if paths is not None else model_weights_paths():
+        digest.update(os.path.basename(path).encode("utf-8"))
+        digest.update(weights_file_hash(path).encode("ascii") if os.path.exists(path) else b"missing")
+    return digest.hexdigest()
+
+_default_cache = None
+_default_cache_lock = Lock()
+
+def get_inference_cache():
+    """
+    Returns the process-wide InferenceCache of the labeling pipeline, opened on first use,
+    or None when the cache is disabled.
+    """
+    global _default_cache
+    if not CACHE_ENABLED:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = InferenceCache()
+        return _default_cache
+
+class InferenceCache:
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 weights_digest: str = None):
+        """
+        On-disk cache of detector results keyed by image content hash and model-weights hash,
+        so an image labeled once is never run through the same models again, whichever
+        subsystem (labeling or evaluation) asks for it.
+
+        Results are stored per field (see CAR, PLATE, COLOR_*) as JSON in a SQLite database.
+        Every read refreshes an entry's last use time and the least recently used entries
+        are evicted once more than max_entries are stored. SQLite's WAL mode lets several
+        processes (e.g. labeling workers) share the file.
+
+        Parameters:
+          - path: SQLite database file, created if needed.
+          - max_entries: Maximum number of (image, field) results kept.
+          - weights_digest: Hash of the models producing the results (see models_digest);
+            computed from the labeling pipeline's weights when not given.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.weights_digest = weights_digest or models_digest()
+        self.lock = Lock()
+        self._puts = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " image_hash TEXT NOT NULL, weights_hash TEXT NOT NULL, field TEXT NOT NULL,"
+                " value TEXT NOT NULL, last_used REAL NOT NULL,"
+                " PRIMARY KEY (image_hash, weights_hash, field))")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+
+    def image_key(self, img_path: str) -> str:
+        """
+        Content hash of an image file, the key of its results.
+        """
+        return file_hash(img_path)
+
+    def get(self, image_hash: str) -> dict:
+        """
+        Returns the cached results of one image as a {field: value} dict.
+        """
+        return self.get_many([image_hash])[0]
+
+    def get_many(self, image_hashes: list) -> list:
+        """
+        Returns one {field: value} dict of cached results per image hash (empty if none).
+        """
+        if not image_hashes:
+            return []
+        found = {image_hash: {} for image_hash in image_hashes}
+        marks = ",".join("?" * len(found))
+        with self.lock, self.conn:
+            rows = self.conn.execute(
+                f"SELECT image_hash, field, value FROM results WHERE weights_hash = ? AND image_hash IN ({marks})",
+                [self.weights_digest, *found]).fetchall()
+            if rows:
+                self.conn.execute(
+                    f"UPDATE results SET last_used = ? WHERE weights_hash = ? AND image_hash IN ({marks})",
+                    [time.time(), self.weights_digest, *found])
+        for image_hash, field, value in rows:
+            found[image_hash][field] = json.loads(value)
+        return [found[image_hash] for image_hash in image_hashes]
+
+    def put(self, image_hash: str, field: str, value) -> None:
+        self.put_many([(image_hash, field, value)])
+
+    def put_many(self, items: list) -> None:
+        """
+        Stores (image_hash, field, value) results; values must be JSON serializable.
+        """
+        if not items:
+            return
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO results (image_hash, weights_hash, field, value, last_used)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [(image_hash, self.weights_digest, field, json.dumps(value, ensure_ascii=False), now)
+                 for image_hash, field, value in items])
+            self._puts += len(items)
+            # The size bound is checked every 1000 writes rather than on each one.
+            if self._puts >= 1000:
+                self._puts = 0
+                self._evict()
+
+    def _evict(self) -> None:
+        count = self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        if count > self.max_entries:
+            self.conn.execute(
+                "DELETE FROM results WHERE rowid IN (SELECT rowid FROM results ORDER BY last_used LIMIT ?)",
+                (count - self.max_entries,))
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
@@ -1,39 +1,70 @@
 import os
 import warnings
-import torch
 import numpy as np
-from PIL import Image
 import cv2
 
 warnings.filterwarnings("ignore", category=FutureWarning)
 
-# Load YOLOv5 model
-model = torch.hub.load('ultralytics/yolov5', 'custom', path='./auto_labeling_car/iranian_car_detection/weights/best.pt')
+WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'weights', 'best.pt')
+
+from ..models import load_yolov5
+
+def get_model():
+    """
+    Returns the car YOLOv5 model, loaded on first use.
+    """
+    return load_yolov5(WEIGHTS_PATH)
 
 def detect_cars(img_path, save_output=True):
-    results = model(img_path)
-    predictions = results.pandas().xyxy[0]
-    
-    img = np.array(Image.open(img_path))
-    
-    # Check if predictions exist; if not, set default values.
-    if predictions.empty:
-        label = "Unknown"
-        x1, y1, x2, y2 = 0, 0, 0, 0
-    else:
-        # Option: select the detection with the highest confidence
-        best_row = predictions.iloc[predictions['confidence'].idxmax()]
-        x1, y1, x2, y2 = int(best_row['xmin']), int(best_row['ymin']), int(best_row['xmax']), int(best_row['ymax'])
-        label = best_row['name']
-        confidence = float(best_row['confidence'])
-        
-        cv2.rectangle(img, (x1, y1), (x2, y2), (0, 255, 0), 2)
-        cv2.putText(img, f"{label} {confidence:.2f}", 
-                    (x1, y1-10), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (36,255,12), 2)
-    
+    img = cv2.cvtColor(cv2.imread(img_path), cv2.COLOR_BGR2RGB)
+    output_path = 'detected_' + os.path.basename(img_path)
+    return detect_cars_image(img, save_output, output_path)
+
+def detect_cars_image(image, save_output=True, output_path='detected.jpg'):
+    """
+    Same as detect_cars, for an already decoded RGB image.
+    The image is not modified; drawing happens on a copy, and only when save_output is set.
+    """
+    results = get_model()(image)
+    label, (x1, y1, x2, y2), confidence = best_detection(results.xyxy[0], results.names)
+
     if save_output:
-        output_path = 'detected_' + os.path.basename(img_path)
+        img = np.array(image)
+        if confidence > 0:
+            cv2.rectangle(img, (x1, y1), (x2, y2), (0, 255, 0), 2)
+            cv2.putText(img, f"{label} {confidence:.2f}", 
+                        (x1, y1-10), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (36,255,12), 2)
         cv2.imwrite(output_path, cv2.cvtColor(img, cv2.COLOR_RGB2BGR))
         print(f"Saved result to {output_path}")
     
     return label, (x1, y1, x2, y2)
+
+def detect_cars_images(images):
+    """
+    Batched detect_cars_image without drawing: all RGB images go through a single
+    YOLOv5 forward pass. Returns one (label, (x1, y1, x2, y2)) tuple per image.
+    """
+    if not images:
+        return []
+    results = get_model()(list(images))
+    detections = []
+    for predictions in results.xyxy:
+        label, box, _ = best_detection(predictions, results.names)
+        detections.append((label, box))
+    return detections
+
+def best_detection(predictions, names):
+    """
+    Returns (label, (x1, y1, x2, y2), confidence) of the highest-confidence detection of
+    an image, or ("Unknown", (0, 0, 0, 0), 0.0) if there are no predictions.
+    predictions is the image's n x 6 (x1, y1, x2, y2, confidence, class) tensor of
+    Detections.xyxy, read directly instead of through Detections.pandas(), and names
+    maps class indices to labels.
+    """
+    # Check if predictions exist; if not, set default values.
+    if not len(predictions):
+        return "Unknown", (0, 0, 0, 0), 0.0
+    # Option: select the detection with the highest confidence
+    *xyxy, confidence, cls = predictions[predictions[:, 4].argmax()].tolist()
+    x1, y1, x2, y2 = map(int, xyxy)
+    return names[int(cls)], (x1, y1, x2, y2), float(confidence)
@@ -0,0 +1,162 @@
+import time
+import uuid
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from .metrics import StageMetrics
+
+class LabelingJob:
+    """
+    Progress of one labeling submission (one source folder into one output folder).
+
+    The counters are updated by the job's thread and read by the /progress routes,
+    so every access goes through the job's lock.
+    """
+    def __init__(self, source_dir: str, output_dir: str, job_id: str = None):
+        self.job_id = job_id or uuid.uuid4().hex
+        self.source_dir = source_dir
+        self.output_dir = output_dir
+        self.status = "queued"
+        self.total = 0
+        self.processed = 0
+        self.errors = []
+        self.submit_time = time.time()
+        self.start_time = None
+        self.end_time = None
+        self.cancel_requested = False
+        self.metrics = StageMetrics()
+        self.lock = Lock()
+
+    def start(self) -> None:
+        with self.lock:
+            self.status = "running"
+            self.start_time = time.time()
+
+    def image_found(self) -> None:
+        with self.lock:
+            self.total += 1
+
+    def image_done(self) -> None:
+        with self.lock:
+            self.processed += 1
+
+    def add_error(self, message: str) -> None:
+        with self.lock:
+            self.errors.append(message)
+
+    def cancel(self) -> None:
+        """
+        Asks the job to stop. The labeling loops check cancelled between images (or video
+        frames) and end the run early; what was labeled so far is written as usual.
+        """
+        with self.lock:
+            self.cancel_requested = True
+
+    @property
+    def cancelled(self) -> bool:
+        with self.lock:
+            return self.cancel_requested
+
+    def finish(self, error: Exception = None) -> None:
+        with self.lock:
+            self.end_time = time.time()
+            if error is not None:
+                self.status = "failed"
+                self.errors.append(f"{type(error).__name__}: {error}")
+            elif self.cancel_requested:
+                self.status = "cancelled"
+            else:
+                self.status = "done"
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed", "cancelled")
+
+    def to_dict(self) -> dict:
+        """
+        Snapshot of the job for the /progress routes. throughput is in images per second
+        and eta in seconds (None until the first image is labeled); stages holds the
+        per-stage timings (see StageMetrics.summary).
+        """
+        stages = self.metrics.summary()
+        with self.lock:
+            elapsed = ((self.end_time or time.time()) - self.start_time) if self.start_time else 0.0
+            throughput = self.processed / elapsed if elapsed > 0 else 0.0
+            remaining = max(self.total - self.processed, 0)
+            eta = remaining / throughput if throughput > 0 and not self.finished else None
+            return {
+                "job_id": self.job_id,
+                "source_dir": self.source_dir,
+                "output_dir": self.output_dir,
+                "status": self.status,
+                # Kept for clients of the old single-job /progress route.
+                "processing": not self.finished,
+                "total": self.total,
+                "processed": self.processed,
+                "submit_time": self.submit_time,
+                "start_time": self.start_time,
+                "end_time": self.end_time,
+                "elapsed": elapsed,
+                "throughput": throughput,
+                "eta": eta,
+                "errors": list(self.errors),
+                "stages": stages,
+            }
+
+class JobManager:
+    """
+    Runs labeling jobs on a bounded thread pool.
+
+    All jobs run in this process and share its loaded models; max_workers caps how many
+    jobs use them at the same time, the others wait in the executor's queue.
+    At most max_history finished jobs are kept for the /progress routes.
+    """
+    def __init__(self, max_workers: int = 1, max_history: int = 100):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="labeling-job")
+        self.max_history = max_history
+        self.jobs = OrderedDict()
+        self.lock = Lock()
+
+    def submit(self, target, source_dir: str, output_dir: str, **kwargs) -> LabelingJob:
+        """
+        Queues target(source_dir, output_dir, job=job, **kwargs) and returns the job.
+        """
+        job = LabelingJob(source_dir, output_dir)
+        with self.lock:
+            self.jobs[job.job_id] = job
+            self._prune()
+        self.executor.submit(self._run, job, target, kwargs)
+        return job
+
+    def _run(self, job: LabelingJob, target, kwargs: dict) -> None:
+        if job.cancelled:
+            # Cancelled while queued.
+            job.finish()
+            return
+        job.start()
+        try:
+            target(job.source_dir, job.output_dir, job=job, **kwargs)
+        except Exception as e:
+            traceback.print_exc()
+            job.finish(e)
+        else:
+            job.finish()
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[:max(len(finished) - self.max_history, 0)]:
+            del self.jobs[job_id]
+
+    def get(self, job_id: str) -> LabelingJob:
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def latest(self) -> LabelingJob:
+        with self.lock:
+            return next(reversed(self.jobs.values()), None)
+
+    def list(self) -> list:
+        with self.lock:
+            return list(self.jobs.values())
@@ -0,0 +1,165 @@
+import os
+import json
+import hashlib
+from threading import Lock
+
+from .car_color_classifier import config as color_config
+from .car_color_classifier.car_color_classifier_yolo4 import DEFAULT_YOLO_PATH, COLOR_MODEL
+from .iranian_car_detection.detection import WEIGHTS_PATH as CAR_WEIGHTS_PATH
+from .Iranian_Plate_Recognitiont.weights.parser import get_path_model_object, get_path_model_char
+
+MANIFEST_NAME = ".labeling_manifest.jsonl"
+
+# Content hashes of weight files by (path, size, mtime): every job checks the weights, but
+# they are only read again when they changed.
+_weights_hashes = {}
+_weights_hashes_lock = Lock()
+
+def file_hash(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Returns the SHA-256 hex digest of a file, read in chunks.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def weights_file_hash(path: str) -> str:
+    """
+    file_hash of a model weight file, memoized by the file's path, size and mtime.
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    with _weights_hashes_lock:
+        if key in _weights_hashes:
+            return _weights_hashes[key]
+    digest = file_hash(path)
+    with _weights_hashes_lock:
+        _weights_hashes[key] = digest
+    return digest
+
+def model_weights_paths() -> list:
+    """
+    Lists the weight files of every model used by the labeling pipeline.
+    """
+    return [
+        get_path_model_object(),
+        get_path_model_char(),
+        CAR_WEIGHTS_PATH,
+        os.path.join(DEFAULT_YOLO_PATH, "yolov4.weights"),
+        os.path.join(DEFAULT_YOLO_PATH, "yolov4.cfg"),
+        color_config.quantized_model_file if COLOR_MODEL == "int8" else color_config.model_file,
+    ]
+
+def weights_hash(paths: list = None) -> str:
+    """
+    Combines the content hashes of all model weight files into a single digest.
+    Missing files contribute their path only, so adding them later changes the digest.
+    """
+    digest = hashlib.sha256()
+    for path in paths if paths is not None else model_weights_paths():
+        digest.update(path.encode("utf-8"))
+        if os.path.exists(path):
+            digest.update(weights_file_hash(path).encode("ascii"))
+    return digest.hexdigest()
+
+
+class LabelingManifest:
+    def __init__(self, output_dir: str, weights_digest: str = None, check_outputs: bool = True):
+        """
+        Tracks which images of a labeling run already have an up-to-date XML file.
+
+        The manifest is an append-only JSON Lines file in output_dir holding, for each
+        labeled image, its path, size, mtime, content hash and the model-weights hash
+        used to label it. Every entry is flushed as soon as the image's XML is written,
+        so a crashed run resumes from the last labeled image. Later lines override
+        earlier ones; the file is compacted by save().
+
+        Parameters:
+          - output_dir: Directory the XML files (and the manifest) are written to.
+          - weights_digest: Hash of the current model weights (computed if not given).
+          - check_outputs: Also require the image's XML file to exist. Disable it when
+            annotations go to a consolidated per-run file instead.
+        """
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, MANIFEST_NAME)
+        self.weights_digest = weights_digest if weights_digest is not None else weights_hash()
+        self.check_outputs = check_outputs
+        self.entries = {}
+        self._log = None
+        self.load()
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave the last line truncated.
+                    continue
+                self.entries[entry["path"]] = entry
+
+    def xml_path(self, img_path: str) -> str:
+        base_name = os.path.splitext(os.path.basename(img_path))[0]
+        return os.path.join(self.output_dir, base_name + ".xml")
+
+    def is_up_to_date(self, img_path: str) -> bool:
+        """
+        An image is up to date if it was labeled with the current weights, its XML file
+        still exists (when check_outputs is set) and its content is unchanged. The content hash is only recomputed
+        when size or mtime differ from the recorded ones.
+        """
+        entry = self.entries.get(os.path.abspath(img_path))
+        if entry is None or entry["weights_hash"] != self.weights_digest:
+            return False
+        if self.check_outputs and not os.path.exists(self.xml_path(img_path)):
+            return False
+        stat = os.stat(img_path)
+        if stat.st_size == entry["size"] and stat.st_mtime == entry["mtime"]:
+            return True
+        return stat.st_size == entry["size"] and file_hash(img_path) == entry["hash"]
+
+    def pending(self, img_paths: list) -> list:
+        """
+        Returns the images of img_paths that are new, changed or labeled with other weights.
+        """
+        return [img_path for img_path in img_paths if not self.is_up_to_date(img_path)]
+
+    def record(self, img_path: str) -> None:
+        """
+        Records that img_path has just been labeled and appends the entry to the manifest.
+        """
+        stat = os.stat(img_path)
+        entry = {
+            "path": os.path.abspath(img_path),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "hash": file_hash(img_path),
+            "weights_hash": self.weights_digest,
+        }
+        self.entries[entry["path"]] = entry
+        if self._log is None:
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._log = open(self.path, "a", encoding="utf-8")
+        self._log.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._log.flush()
+
+    def save(self) -> None:
+        """
+        Rewrites the manifest with one line per image.
+        """
+        self.close()
+        os.makedirs(self.output_dir, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in self.entries.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def close(self) -> None:
+        if self._log is not None:
+            self._log.close()
+            self._log = None
@@ -0,0 +1,153 @@
+import json
+import time
+import contextlib
+from threading import Lock
+
+# Pipeline stages timed by StageMetrics, in pipeline order.
+STAGES = ("decode", "car_detection", "yolov4", "color_classification", "plate_detection", "char_ocr", "write")
+# Upper bounds (seconds) of the latency histogram buckets, Prometheus style.
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+class Profile(contextlib.ContextDecorator):
+    """
+    Same interface as YOLOv5's utils.general.Profile (t accumulates, dt is the last delta),
+    which cannot be imported here without pulling in torch. On exit, the delta is also
+    recorded as one call of stage covering images images in metrics.
+    """
+    def __init__(self, metrics, stage, images=1, t=0.0):
+        self.metrics = metrics
+        self.stage = stage
+        self.images = images
+        self.t = t
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.dt = time.perf_counter() - self.start  # delta-time
+        self.t += self.dt  # accumulate dt
+        self.metrics.observe(self.stage, self.dt, self.images)
+
+def profile(metrics, stage, images=1):
+    """
+    metrics.stage(stage, images), or a no-op context when metrics is None.
+    """
+    return metrics.stage(stage, images) if metrics is not None else contextlib.nullcontext()
+
+class StageMetrics:
+    """
+    Wall time histograms and counters per pipeline stage, for one labeling job.
+
+    Batched stages are recorded once per batch: calls counts the batches and images the
+    images they covered, so seconds / images is the per-image cost.
+    """
+    def __init__(self):
+        self.stages = {}
+        self.lock = Lock()
+
+    def stage(self, stage, images=1):
+        """
+        Context manager timing one call of stage.
+        """
+        return Profile(self, stage, images)
+
+    def observe(self, stage, seconds, images=1):
+        with self.lock:
+            entry = self.stages.get(stage)
+            if entry is None:
+                entry = self.stages[stage] = {"calls": 0, "images": 0, "seconds": 0.0, "max_seconds": 0.0,
+                                              "buckets": [0] * len(BUCKETS)}
+            entry["calls"] += 1
+            entry["images"] += images
+            entry["seconds"] += seconds
+            entry["max_seconds"] = max(entry["max_seconds"], seconds)
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    entry["buckets"][i] += 1
+                    break
+
+    def state(self) -> dict:
+        """
+        Picklable copy of the raw counters, e.g. to send them from a worker process to merge().
+        """
+        with self.lock:
+            return {stage: dict(entry, buckets=list(entry["buckets"])) for stage, entry in self.stages.items()}
+
+    def merge(self, state: dict) -> None:
+        """
+        Adds the counters of another StageMetrics' state() to this one.
+        """
+        with self.lock:
+            for stage, other in state.items():
+                entry = self.stages.setdefault(stage, {"calls": 0, "images": 0, "seconds": 0.0, "max_seconds": 0.0,
+                                                       "buckets": [0] * len(BUCKETS)})
+                for key in ("calls", "images", "seconds"):
+                    entry[key] += other[key]
+                entry["max_seconds"] = max(entry["max_seconds"], other["max_seconds"])
+                entry["buckets"] = [a + b for a, b in zip(entry["buckets"], other["buckets"])]
+
+    def summary(self) -> dict:
+        """
+        Per-stage counters, mean and per-image times and the cumulative latency histogram.
+        """
+        summary = {}
+        for stage, entry in sorted(self.state().items(), key=lambda item: _stage_order(item[0])):
+            cumulative, histogram = 0, {}
+            for bound, count in zip(BUCKETS, entry["buckets"]):
+                cumulative += count
+                histogram["+Inf" if bound == float("inf") else str(bound)] = cumulative
+            summary[stage] = {
+                "calls": entry["calls"],
+                "images": entry["images"],
+                "seconds": entry["seconds"],
+                "mean_seconds": entry["seconds"] / entry["calls"] if entry["calls"] else 0.0,
+                "seconds_per_image": entry["seconds"] / entry["images"] if entry["images"] else 0.0,
+                "max_seconds": entry["max_seconds"],
+                "histogram": histogram,
+            }
+        return summary
+
+    def dump(self, path: str, **extra) -> None:
+        """
+        Writes the summary (and any extra fields, e.g. the job's progress) as JSON.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({**extra, "stages": self.summary()}, f, ensure_ascii=False, indent=2)
+
+def _stage_order(stage):
+    return STAGES.index(stage) if stage in STAGES else len(STAGES)
+
+def to_prometheus(jobs) -> str:
+    """
+    Renders the stage metrics of jobs (LabelingJob instances) in the Prometheus text format,
+    labeled by job id and stage.
+    """
+    lines = [
+        "# HELP labeling_stage_seconds Wall time of one call of a labeling pipeline stage.",
+        "# TYPE labeling_stage_seconds histogram",
+    ]
+    counters = {
+        "labeling_stage_images_total": "Images processed by a labeling pipeline stage.",
+        "labeling_images_total": "Images discovered by a labeling job.",
+        "labeling_images_processed_total": "Images labeled by a labeling job.",
+    }
+    images, discovered, processed = [], [], []
+    for job in jobs:
+        job_label = f'job_id="{job.job_id}"'
+        for stage, entry in job.metrics.summary().items():
+            labels = f'{job_label},stage="{stage}"'
+            for bound, count in entry["histogram"].items():
+                lines.append(f'labeling_stage_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'labeling_stage_seconds_sum{{{labels}}} {entry["seconds"]}')
+            lines.append(f'labeling_stage_seconds_count{{{labels}}} {entry["calls"]}')
+            images.append(f'labeling_stage_images_total{{{labels}}} {entry["images"]}')
+        progress = job.to_dict()
+        discovered.append(f'labeling_images_total{{{job_label}}} {progress["total"]}')
+        processed.append(f'labeling_images_processed_total{{{job_label}}} {progress["processed"]}')
+
+    for name, samples in zip(counters, (images, discovered, processed)):
+        lines.append(f"# HELP {name} {counters[name]}")
+        lines.append(f"# TYPE {name} counter")
+        lines.extend(samples)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,97 @@
+import os
+import sys
+from pathlib import Path
+from threading import Lock
+
+# The vendored YOLOv5 repository at the project root; models are loaded from it
+# with torch.hub's local source, so no network access or hub cache is needed.
+YOLOV5_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'yolov5')
+
+# Inference backend of the YOLOv5 detectors: "pytorch" runs the .pt weights eagerly,
+# "onnx" (ONNX Runtime) and "openvino" run a model exported next to the weights.
+BACKEND = os.environ.get("LABELING_BACKEND", "pytorch")
+BACKENDS = ("pytorch", "onnx", "openvino")
+# Input size of the exported models; AutoShape letterboxes every image to it.
+EXPORT_IMGSZ = 640
+
+# Process-wide YOLOv5 registry: each (weights, backend) pair is loaded on first use and reused afterwards.
+_yolov5_models = {}
+_yolov5_lock = Lock()
+
+def load_yolov5(weights_path: str, backend: str = None):
+    """
+    Returns the AutoShape YOLOv5 model for weights_path, loading it from the vendored
+    yolov5 directory the first time it is requested. Safe to call from several threads.
+
+    With the onnx or openvino backend, the weights are exported once (see exported_weights)
+    and the exported model is run through DetectMultiBackend.
+    """
+    backend = backend or BACKEND
+    with _yolov5_lock:
+        key = (weights_path, backend)
+        if key not in _yolov5_models:
+            import torch
+            path = exported_weights(weights_path, backend)
+            _yolov5_models[key] = torch.hub.load(YOLOV5_DIR, 'custom', path=path, source='local')
+        return _yolov5_models[key]
+
+def exported_weights(weights_path: str, backend: str = None) -> str:
+    """
+    Returns the model path to load for backend: weights_path itself for pytorch, otherwise
+    the .onnx file or _openvino_model directory next to it. The export is only run when
+    that file is missing or older than the weights.
+    """
+    backend = backend or BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+    if backend == "pytorch":
+        return weights_path
+
+    weights = Path(weights_path)
+    if backend == "onnx":
+        exported = weights.with_suffix(".onnx")
+        marker = exported
+    else:
+        exported = weights.parent / (weights.stem + "_openvino_model")
+        marker = exported / weights.with_suffix(".xml").name
+
+    if not marker.exists() or marker.stat().st_mtime < weights.stat().st_mtime:
+        if YOLOV5_DIR not in sys.path:
+            sys.path.append(YOLOV5_DIR)
+        import export
+        # Dynamic axes so that AutoShape can still send whole batches through the model.
+        export.run(weights=weights, imgsz=(EXPORT_IMGSZ, EXPORT_IMGSZ), device="cpu",
+                   include=("onnx",) if backend == "onnx" else ("openvino",), dynamic=True)
+    return str(exported)
+
+def detector_weights_paths() -> list:
+    """
+    Weights of the YOLOv5 car, plate and character detectors.
+    """
+    from .iranian_car_detection.detection import WEIGHTS_PATH
+    from .Iranian_Plate_Recognitiont.weights.parser import get_path_model_object, get_path_model_char
+    return [WEIGHTS_PATH, get_path_model_object(), get_path_model_char()]
+
+def export_detectors(backend: str = None) -> list:
+    """
+    Exports the YOLOv5 detectors for backend if needed and returns the exported paths.
+    Run it once in the parent before starting worker processes so they do not export concurrently.
+    """
+    return [exported_weights(path, backend) for path in detector_weights_paths()]
+
+def warm_up() -> list:
+    """
+    Loads every model of the labeling pipeline (car, plate and character detectors,
+    YOLOv4 and the color classifier) so that the first request does not pay for it.
+    Returns the names of the loaded models.
+    """
+    from .iranian_car_detection.detection import get_model
+    from .Iranian_Plate_Recognitiont.plate_recognizer import get_plate_model, get_char_model
+    from .car_color_classifier.car_color_classifier_yolo4 import DEFAULT_YOLO_PATH, get_color_classifier, load_yolo
+
+    get_model()
+    get_plate_model()
+    get_char_model()
+    load_yolo(DEFAULT_YOLO_PATH)
+    get_color_classifier()
+    return ["car", "plate", "chars", "yolov4", "color"]
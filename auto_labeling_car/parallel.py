@@ -0,0 +1,100 @@
+import os
+import multiprocessing
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from .models import export_detectors
+from .metrics import StageMetrics
+
+# Labeling instance owned by the current worker process (set by _init_worker).
+_labeling = None
+
+def _init_worker(source_dir: str, output_dir: str, reuse_car_box: bool, threads_per_worker: int,
+                 cache_args: tuple = None) -> None:
+    """
+    Runs once in every worker process: limits intra-op threads so workers do not
+    oversubscribe the cores, then loads all models so the first task does not pay for it.
+    cache_args are the (path, max_entries, weights_digest) of the parent's InferenceCache,
+    opened again here since SQLite connections cannot be shared between processes.
+    """
+    global _labeling
+    import cv2
+    import torch
+    torch.set_num_threads(threads_per_worker)
+    cv2.setNumThreads(threads_per_worker)
+
+    from .automatic_labeling import Labeling
+    from .models import warm_up
+    from .inference_cache import InferenceCache
+
+    warm_up()
+    cache = InferenceCache(*cache_args) if cache_args is not None else None
+    _labeling = Labeling(source_dir, output_dir, reuse_car_box=reuse_car_box, cache=cache)
+
+def _label_chunk(img_paths: list, batch_size: int) -> tuple:
+    """
+    Labels a chunk of images in the worker.
+    Returns an (img_path, annotation) pair per image, writing is done by the parent,
+    the (img_path, error) pairs of the images that could not be decoded and the stage
+    metrics state of the chunk.
+    """
+    _labeling.metrics = StageMetrics()
+    errors = []
+    # A chunk is a single batch, so a prefetch pipeline could not overlap decoding with
+    # inference here; the images are decoded by extract_batch and the other workers keep
+    # the cores busy meanwhile.
+    annotated = list(_labeling.annotate_images(img_paths, batch_size,
+                                               on_error=lambda img_path, e: errors.append((img_path, e))))
+    return annotated, errors, _labeling.metrics.state()
+
+def label_images_parallel(img_paths, source_dir: str, output_dir: str, workers: int = None,
+                          batch_size: int = 8, reuse_car_box: bool = False, metrics=None, cache=None,
+                          on_error=None):
+    """
+    Labels img_paths on a pool of worker processes, each holding its own copy of the models.
+
+    Images are fanned out in chunks of batch_size so every worker still runs batched
+    inference. Workers are started with the "spawn" method since TensorFlow sessions and
+    PyTorch thread pools do not survive a fork.
+
+    This is a generator yielding an (img_path, annotation) pair per image as chunks
+    finish, like Labeling.annotate_images. img_paths may be any iterable; it is read
+    lazily so that at most two chunks per worker are in flight.
+
+    Parameters:
+      - workers: Number of worker processes (defaults to the number of CPUs).
+      - metrics: Optional StageMetrics the workers' stage timings are merged into.
+      - cache: Optional InferenceCache shared with the workers (see Labeling).
+      - on_error: Optional callback; images that cannot be decoded are then reported as
+        on_error(img_path, error) and skipped instead of ending the run.
+    """
+    workers = workers or os.cpu_count() or 1
+    threads_per_worker = max(1, (os.cpu_count() or 1) // workers)
+    img_paths = iter(img_paths)
+    export_detectors()
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(source_dir, output_dir, reuse_car_box, threads_per_worker,
+                  (cache.path, cache.max_entries, cache.weights_digest) if cache is not None else None),
+    ) as executor:
+        pending = set()
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = list(islice(img_paths, batch_size))
+                if not chunk:
+                    break
+                pending.add(executor.submit(_label_chunk, chunk, batch_size))
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                annotated, errors, chunk_metrics = future.result()
+                if metrics is not None:
+                    metrics.merge(chunk_metrics)
+                for img_path, error in errors:
+                    if on_error is None:
+                        raise error
+                    on_error(img_path, error)
+                yield from annotated
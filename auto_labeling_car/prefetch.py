@@ -0,0 +1,93 @@
+import os
+import queue
+from threading import Thread, Lock
+
+from .frame import Frame
+from .metrics import profile
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+def stream_image_paths(source_dir: str, extensions: tuple = IMAGE_EXTENSIONS):
+    """
+    Yields the paths of the image files in source_dir as the directory is read,
+    using os.scandir so that huge folders do not have to be listed up front.
+    """
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(extensions) and entry.is_file():
+                yield entry.path
+
+def prefetch_frames(img_paths, num_threads: int = 4, queue_size: int = 32, metrics=None, on_error=None):
+    """
+    Decodes images ahead of inference.
+
+    img_paths may be any iterable (e.g. stream_image_paths); it is consumed by a feeder
+    thread. num_threads decode threads turn paths into Frames and put them on a bounded
+    queue of queue_size frames, which this generator drains. (path, Frame) pairs are
+    yielded in completion order, not in the order of img_paths.
+
+    A decoding error is re-raised in the consumer when its frame is reached, unless
+    on_error is given: on_error(img_path, error) is then called and the image is skipped.
+    Decode times are recorded in metrics (a StageMetrics) if given.
+    """
+    path_queue = queue.Queue(maxsize=queue_size)
+    frame_queue = queue.Queue(maxsize=queue_size)
+    stop = object()
+    state = {"running": num_threads, "cancelled": False}
+    state_lock = Lock()
+
+    def feed():
+        try:
+            for img_path in img_paths:
+                if state["cancelled"]:
+                    break
+                path_queue.put(img_path)
+        except Exception as e:
+            frame_queue.put((None, e))
+        finally:
+            for _ in range(num_threads):
+                path_queue.put(stop)
+
+    def decode():
+        while True:
+            img_path = path_queue.get()
+            if img_path is stop:
+                break
+            if state["cancelled"]:
+                continue
+            try:
+                with profile(metrics, "decode"):
+                    frame = Frame.from_path(img_path)
+                frame_queue.put((img_path, frame))
+            except Exception as e:
+                frame_queue.put((img_path, e))
+        with state_lock:
+            state["running"] -= 1
+            if state["running"] == 0:
+                frame_queue.put(stop)
+
+    threads = [Thread(target=feed, daemon=True)]
+    threads += [Thread(target=decode, daemon=True) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            item = frame_queue.get()
+            if item is stop:
+                return
+            img_path, frame = item
+            if isinstance(frame, Exception):
+                if on_error is None or img_path is None:
+                    raise frame
+                on_error(img_path, frame)
+                continue
+            yield img_path, frame
+    finally:
+        # Release threads blocked on the full frame queue if the consumer stops early.
+        state["cancelled"] = True
+        while any(thread.is_alive() for thread in threads[1:]):
+            try:
+                frame_queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
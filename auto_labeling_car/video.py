@@ -0,0 +1,180 @@
+import os
+import time
+import argparse
+import cv2
+import numpy as np
+
+from .frame import Frame
+from .automatic_labeling import Labeling
+from .Iranian_Plate_Recognitiont.plate_tracker import PlateTracker
+from .writer import AnnotationWriter, OUTPUT_FORMATS
+
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv", ".mpg", ".mpeg", ".wmv", ".m4v", ".ts")
+STREAM_PREFIXES = ("rtsp://", "rtmp://", "http://", "https://")
+
+def is_video_source(source: str) -> bool:
+    """
+    True for a video file or a stream URL (rtsp, rtmp or http(s)).
+    """
+    return source.lower().startswith(STREAM_PREFIXES) or source.lower().endswith(VIDEO_EXTENSIONS)
+
+def is_stream_source(source: str) -> bool:
+    """
+    True for a live source that has no end: a stream URL or a camera index.
+    """
+    return source.lower().startswith(STREAM_PREFIXES) or source.isdigit()
+
+def dhash(image, hash_size: int = 8) -> int:
+    """
+    Difference hash of a BGR image: the sign of horizontal gradients of a
+    (hash_size + 1) x hash_size grayscale thumbnail, packed into an integer.
+    Near-duplicate frames have hashes a few bits apart.
+    """
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    thumb = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    bits = (thumb[:, 1:] > thumb[:, :-1]).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+def motion_delta(previous, current, size: int = 64) -> float:
+    """
+    Mean absolute difference (0-255) between two BGR frames, on small grayscale thumbnails.
+    """
+    def thumb(image):
+        return cv2.resize(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY), (size, size), interpolation=cv2.INTER_AREA)
+    return float(cv2.absdiff(thumb(previous), thumb(current)).mean())
+
+def sample_frames(source: str, stride: int = 1, motion_threshold: float = None, dedupe_distance: int = 4,
+                  max_frames: int = None, max_seconds: float = None, should_stop=None):
+    """
+    Reads a video file or stream with OpenCV and yields (frame_index, timestamp_ms, Frame)
+    for the frames worth labeling:
+      - only every stride-th frame is considered (frames in between are grabbed, not decoded);
+      - with motion_threshold, a frame is kept only if its motion_delta from the last kept
+        frame exceeds it;
+      - a frame whose dhash is within dedupe_distance bits of the last kept frame's is
+        skipped as a near-duplicate (dedupe_distance < 0 disables this).
+    Stops at the end of the video, when the stream closes, after max_frames kept frames,
+    after max_seconds of reading or once should_stop() returns True. The time limit and
+    should_stop are checked on every frame read, kept or not, so a static stream whose
+    frames are all near-duplicates still stops.
+    """
+    if stride < 1:
+        raise ValueError(f"stride must be at least 1, got {stride}")
+    capture = cv2.VideoCapture(int(source) if source.isdigit() else source)
+    if not capture.isOpened():
+        raise ValueError(f"Error opening video source: {source}")
+
+    kept, index = 0, -1
+    last_image, last_hash = None, None
+    deadline = time.monotonic() + max_seconds if max_seconds is not None else None
+    try:
+        while max_frames is None or kept < max_frames:
+            if should_stop is not None and should_stop():
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            index += 1
+            if index % stride:
+                # grab() skips the frame without decoding it.
+                if not capture.grab():
+                    break
+                continue
+            ok, image = capture.read()
+            if not ok:
+                break
+
+            if motion_threshold is not None and last_image is not None:
+                if motion_delta(last_image, image) <= motion_threshold:
+                    continue
+            image_hash = dhash(image)
+            if last_hash is not None and hamming(image_hash, last_hash) <= dedupe_distance:
+                continue
+
+            last_image, last_hash = image, image_hash
+            kept += 1
+            yield index, capture.get(cv2.CAP_PROP_POS_MSEC), Frame(image)
+    finally:
+        capture.release()
+
+def frame_name(source: str, frame_index: int) -> str:
+    """
+    Image name of a video frame, e.g. dashcam_000123.jpg; the XML file is named after it.
+    """
+    stem = os.path.splitext(os.path.basename(source.rstrip("/")))[0] or "stream"
+    return f"{stem}_{frame_index:06d}.jpg"
+
+def label_video(source: str, output_dir: str, output_format: str = "xml", batch_size: int = 8, stride: int = 1,
+                motion_threshold: float = None, dedupe_distance: int = 4, max_frames: int = None,
+                max_seconds: float = None, save_frames: bool = False, reuse_car_box: bool = False, track_plates: bool = True,
+                ocr_every: int = None, job=None) -> int:
+    """
+    Labels the sampled frames (see sample_frames) of a video file or stream into output_dir,
+    one annotation per kept frame, without extracting the frames to disk first.
+
+    With save_frames, every kept frame is also written as a JPEG next to its annotation so
+    the output folder can be evaluated like a labeled image folder. With track_plates, plates
+    are tracked across the kept frames and each vehicle's plate is read once, or every
+    ocr_every-th frame (see PlateTracker), instead of on every frame. Progress is reported on
+    job (a LabelingJob) if given, and reading stops once the job is cancelled (see the
+    should_stop of sample_frames). Returns the number of labeled frames.
+
+    Parquet output is only written when the run ends, so it is rejected for live streams
+    (see is_stream_source); use xml or jsonl, which are written frame by frame.
+    """
+    if output_format == "parquet" and is_stream_source(source):
+        raise ValueError(f"Parquet output is not supported for live streams: {source}")
+    os.makedirs(output_dir, exist_ok=True)
+    metrics = job.metrics if job is not None else None
+    plate_tracker = PlateTracker(ocr_every=ocr_every) if track_plates else None
+    labeling = Labeling(source, output_dir, reuse_car_box=reuse_car_box, metrics=metrics, plate_tracker=plate_tracker)
+    timestamps = {}
+
+    def frames():
+        should_stop = (lambda: job.cancelled) if job is not None else None
+        for frame_index, timestamp, frame in sample_frames(source, stride, motion_threshold, dedupe_distance,
+                                                           max_frames, max_seconds, should_stop):
+            name = frame_name(source, frame_index)
+            timestamps[name] = (frame_index, timestamp)
+            if save_frames:
+                cv2.imwrite(os.path.join(output_dir, name), frame.bgr)
+            if job is not None:
+                job.image_found()
+            yield name, frame
+
+    labeled = 0
+    with AnnotationWriter(output_dir, output_format, metrics=metrics,
+                          run_id=job.job_id if job is not None else None) as writer:
+        for name in labeling.extract_frames(frames(), batch_size):
+            frame_index, timestamp = timestamps.pop(name)
+            # Only the JSONL and Parquet outputs carry the frame position; the XML layout is unchanged.
+            annotation = dict(labeling.annotation(), Source=source, FrameIndex=frame_index, TimestampMs=timestamp)
+            writer.write(name, annotation)
+            labeled += 1
+            if job is not None:
+                job.image_done()
+    return labeled
+
+if __name__ == "__main__":
+    # python -m auto_labeling_car.video dashcam.mp4 labels/ --stride 5 --format jsonl
+    ap = argparse.ArgumentParser(description="Label the frames of a video file or stream")
+    ap.add_argument("source", help="video file, stream URL (rtsp/rtmp/http) or camera index")
+    ap.add_argument("output_dir", help="folder the annotations are written to")
+    ap.add_argument("--format", default="xml", choices=OUTPUT_FORMATS, help="annotation output format")
+    ap.add_argument("--stride", type=int, default=1, help="consider every n-th frame only")
+    ap.add_argument("--motion", type=float, default=None, help="minimum mean pixel change since the last kept frame")
+    ap.add_argument("--dedupe", type=int, default=4, help="skip frames within this many dHash bits, -1 to disable")
+    ap.add_argument("--max-frames", type=int, default=None, help="stop after this many labeled frames")
+    ap.add_argument("--max-seconds", type=float, default=None, help="stop reading after this many seconds")
+    ap.add_argument("--batch-size", type=int, default=8, help="frames per inference batch")
+    ap.add_argument("--save-frames", action="store_true", help="also save the kept frames as JPEG")
+    ap.add_argument("--no-track", action="store_true", help="read the plate on every frame instead of once per track")
+    ap.add_argument("--ocr-every", type=int, default=None, help="also read a tracked plate every n-th frame")
+    args = ap.parse_args()
+
+    count = label_video(args.source, args.output_dir, args.format, args.batch_size, args.stride, args.motion,
+                        args.dedupe, args.max_frames, args.max_seconds, args.save_frames,
+                        track_plates=not args.no_track, ocr_every=args.ocr_every)
+    print(f"Labeled {count} frames")
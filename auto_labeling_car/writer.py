@@ -0,0 +1,199 @@
+import os
+import json
+import time
+import uuid
+import queue
+import xml.etree.ElementTree as ET
+from threading import Thread
+
+from .metrics import profile
+
+# Output formats supported by AnnotationWriter.
+OUTPUT_FORMATS = ("xml", "jsonl", "parquet")
+
+def build_xml(annotation: dict) -> ET.Element:
+    """
+    Builds the CarData XML tree of one image from its annotation dictionary
+    (see Labeling.annotation).
+    """
+    root = ET.Element("CarData")
+
+    # LicensePlate block.
+    license_plate = ET.SubElement(root, "LicensePlate")
+    for tag in ("RegistrationPrefix", "SeriesLetter", "RegistrationNumber", "ProvinceCode"):
+        ET.SubElement(license_plate, tag).text = annotation["LicensePlate"][tag]
+
+    ET.SubElement(root, "CarModel").text = annotation["CarModel"]
+    ET.SubElement(root, "CarColor").text = annotation["CarColor"]
+
+    # LicensePlateCoordinates and CarCoordinates blocks.
+    for block in ("LicensePlateCoordinates", "CarCoordinates"):
+        coords = ET.SubElement(root, block)
+        for tag in ("X", "Y", "Width", "Height"):
+            ET.SubElement(coords, tag).text = str(annotation[block].get(tag, 0))
+
+    return root
+
+def xml_path_for(output_dir: str, img_name: str) -> str:
+    """
+    Uses the image file's base name (with .xml extension) for the XML file.
+    """
+    base_name = os.path.splitext(os.path.basename(img_name))[0]
+    return os.path.join(output_dir, base_name + ".xml")
+
+def write_xml(output_dir: str, img_name: str, annotation: dict) -> str:
+    """
+    Writes the XML file of one image with declaration and UTF-8 encoding.
+    The output directory must already exist. Returns the written path.
+    """
+    xml_file_path = xml_path_for(output_dir, img_name)
+    tree = ET.ElementTree(build_xml(annotation))
+    tree.write(xml_file_path, encoding="utf-8", xml_declaration=True)
+    return xml_file_path
+
+
+class AnnotationWriter:
+    _STOP = object()
+
+    def __init__(self, output_dir: str, output_format: str = "xml", queue_size: int = 256, metrics=None,
+                 run_id: str = None):
+        """
+        Writes labeling results on a background thread so inference never waits on the
+        filesystem.
+
+        Results are put on a bounded queue (write blocks only when queue_size results
+        are pending) and serialized by a single writer thread. The output directory is
+        created once, when the writer starts.
+
+        Output formats:
+          - "xml": one XML file per image (the historical layout).
+          - "jsonl": one annotations-<timestamp>-<run_id>.jsonl file per run, one line per
+            image holding the image name and its annotation.
+          - "parquet": one annotations-<timestamp>-<run_id>.parquet file per run (requires
+            pyarrow), written when the writer is closed.
+        run_id (e.g. the job id, a random id if not given) keeps the files of runs started
+        in the same second apart; an existing file is never overwritten. No file is
+        created for a run without annotations.
+
+        Use as a context manager, or call close() to flush pending results. Errors raised
+        by the writer thread are re-raised by close(). Write times are recorded in metrics
+        (a StageMetrics) under the "write" stage if given.
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format '{output_format}'. Allowed formats: {OUTPUT_FORMATS}.")
+        if output_format == "parquet":
+            # Fail before labeling starts rather than when the run is over.
+            import pyarrow  # noqa: F401
+
+        self.output_dir = output_dir
+        self.output_format = output_format
+        self.run_name = f"{time.strftime('annotations-%Y%m%d-%H%M%S')}-{run_id or uuid.uuid4().hex[:8]}"
+        self.written = 0
+        self.error = None
+        self.metrics = metrics
+        self._queue = queue.Queue(maxsize=queue_size)
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def path(self) -> str:
+        """
+        Path of the consolidated annotations file (None in "xml" mode).
+        """
+        if self.output_format == "xml":
+            return None
+        return os.path.join(self.output_dir, f"{self.run_name}.{self.output_format}")
+
+    def write(self, img_name: str, annotation: dict, on_written=None) -> None:
+        """
+        Queues the annotation of img_name. on_written, if given, is called from the
+        writer thread once the annotation is on disk.
+        """
+        if self.error is not None:
+            raise self.error
+        self._queue.put((img_name, annotation, on_written))
+
+    def close(self) -> None:
+        self._stop()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # The exception of the with block wins over a writer error.
+            self._stop()
+
+    def _stop(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+
+    def _run(self) -> None:
+        try:
+            if self.output_format == "xml":
+                self._write_xml_files()
+            elif self.output_format == "jsonl":
+                self._write_jsonl()
+            else:
+                self._write_parquet()
+        except Exception as e:
+            self.error = e
+            # Keep draining so producers blocked on a full queue are released.
+            while self._queue.get() is not self._STOP:
+                pass
+
+    def _items(self):
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            yield item
+
+    def _write_xml_files(self) -> None:
+        for img_name, annotation, on_written in self._items():
+            with profile(self.metrics, "write"):
+                write_xml(self.output_dir, img_name, annotation)
+            self._done(on_written)
+
+    def _write_jsonl(self) -> None:
+        f = None
+        try:
+            for img_name, annotation, on_written in self._items():
+                with profile(self.metrics, "write"):
+                    if f is None:
+                        # Opened on the first annotation, in exclusive mode.
+                        f = open(self.path, "x", encoding="utf-8")
+                    f.write(json.dumps({"Image": img_name, **annotation}, ensure_ascii=False) + "\n")
+                    f.flush()
+                self._done(on_written)
+        finally:
+            if f is not None:
+                f.close()
+
+    def _write_parquet(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        records, callbacks = [], []
+        for img_name, annotation, on_written in self._items():
+            records.append({"Image": img_name, **annotation})
+            callbacks.append(on_written)
+        if records:
+            with profile(self.metrics, "write", len(records)):
+                if os.path.exists(self.path):
+                    raise FileExistsError(f"Annotations file already exists: {self.path}")
+                pq.write_table(pa.Table.from_pylist(records), self.path)
+        for on_written in callbacks:
+            self._done(on_written)
+
+    def _done(self, on_written) -> None:
+        self.written += 1
+        if on_written is not None:
+            on_written()
@@ -1,10 +1,8 @@
-from PIL import Image
-from PIL.ExifTags import TAGS
-import os
+from corpus.image_catalog import ImageCatalog, read_header
 import json
 
 class DataModelAccuracyIMG:
-    def __init__(self, folder_path: str, required_metadata: list) -> None:
+    def __init__(self, folder_path: str, required_metadata: list, catalog: ImageCatalog = None) -> None:
         """
         Validates if required metadata fields exist in multiple image files.
 
@@ -12,23 +10,32 @@ class DataModelAccuracyIMG:
           - folder_path: Path to the folder containing image files.
           - required_metadata: List of required metadata keys.
             Example: ["width", "height", "format", "location", "date"]
+          - catalog: Optional ImageCatalog of folder_path shared with the other evaluators.
         """
         self.folder_path = folder_path
         self.required_metadata = required_metadata
+        self.catalog = catalog
         self.results = {}
 
     def validate_images(self) -> None:
         """
         Processes all image files in the folder and checks for missing metadata.
         """
-        for filename in os.listdir(self.folder_path):
+        if self.catalog is None:
+            self.catalog = ImageCatalog(self.folder_path)
+        for row, filename in enumerate(self.catalog.files):
             if filename.lower().endswith((".png", ".jpg", ".jpeg")):
-                file_path = os.path.join(self.folder_path, filename)
-                self.results[filename] = self.validate_image(file_path)
+                self.results[filename] = self.validate_record(self.catalog.record(row))
 
     def validate_image(self, file_path: str) -> dict:
         """
-        Checks an image file for required metadata fields.
+        Checks an image file for required metadata fields (see validate_record).
+        """
+        return self.validate_record(read_header(file_path))
+
+    def validate_record(self, header: dict) -> dict:
+        """
+        Checks the header metadata of one image file (see read_header) for required metadata fields.
 
         Returns a dictionary with:
           - "fields": individual field scores (1.0 if present, 0.0 if missing),
@@ -37,27 +44,11 @@ class DataModelAccuracyIMG:
         """
         missing_metadata = []
         field_scores = {}
-        metadata = {}
-
-        try:
-            with Image.open(file_path) as img:
-                # Basic metadata from PIL
-                metadata["width"] = img.width
-                metadata["height"] = img.height
-                metadata["format"] = img.format
-
-                # Try to extract EXIF data for additional metadata
-                exif_data = img._getexif()
-                if exif_data:
-                    exif = {TAGS.get(key, key): value for key, value in exif_data.items()}
-                    # For location, check if 'GPSInfo' exists in EXIF; if present, store it
-                    if "GPSInfo" in exif:
-                        metadata["location"] = exif["GPSInfo"]
-                    # For date, check if 'DateTime' exists in EXIF
-                    if "DateTime" in exif:
-                        metadata["date"] = exif["DateTime"]
-        except Exception as e:
-            return {"error": str(e), "fields": {}, "acc": 0.0, "missing_metadata": []}
+
+        error = header["error"] or header["exif_error"]
+        if error is not None:
+            return {"error": error, "fields": {}, "acc": 0.0, "missing_metadata": []}
+        metadata = {key: header[key] for key in ("width", "height", "format", "location", "date")}
 
         # Check each required metadata field and assign score 1 if exists, 0 if missing.
         for field in self.required_metadata:
@@ -83,12 +74,18 @@ class DataModelAccuracyIMG:
 
         Returns a JSON string of the report.
         """
+        return json.dumps(self.report(), ensure_ascii=False, indent=4)
+
+    def report(self) -> dict:
+        """
+        The report of get_model_accuracy as a dictionary.
+        """
         valid_files = [res for key, res in self.results.items() if key != "summary" and "file_accuracy" in res]
         overall_accuracy = 0
         if valid_files:
             overall_accuracy = sum(res["file_accuracy"] for res in valid_files) / len(valid_files)
         self.results["summary"] = {"overall_accuracy": overall_accuracy}
-        return json.dumps(self.results, ensure_ascii=False, indent=4)
+        return self.results
 
 # --- Example Usage ---
 # required_metadata = ["width", "height", "format", "location", "date"]
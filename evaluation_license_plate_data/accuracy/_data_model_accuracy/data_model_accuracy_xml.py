@@ -3,37 +3,70 @@
         - ISO/IEC 5259, 25012, and 25024 standards.
 """
 
-import os
 import json
 import xml.etree.ElementTree as ET
+from corpus.xml_corpus import XmlCorpus
+from sharding import validate_records, SHARD_WORKERS
 
 class DataModelAccuracyXML:
-    def __init__(self, folder_path: str, required_fields: list) -> None:
+    def __init__(self, folder_path: str, required_fields: list, corpus: XmlCorpus = None,
+                 workers: int = SHARD_WORKERS) -> None:
         """
         Validates the structure of multiple XML files in a folder.
 
         Parameters:
           - folder_path: Path to the folder containing XML files.
           - required_fields: List of required XML tags in a hierarchical format.
+          - corpus: Optional XmlCorpus of folder_path shared with the other evaluators.
+          - workers: Number of processes validating the files (see validate_records).
         """
         self.folder_path = folder_path
         self.required_fields = required_fields
+        self.field_keys = {field: self._field_key(field) for field in required_fields}
+        self.corpus = corpus
+        self.workers = workers
         self.results = {}
 
     def validate_files(self) -> None:
         """
         Processes all XML files in the folder and checks for missing fields.
         """
-        for filename in os.listdir(self.folder_path):
-            if filename.endswith(".xml"):
-                file_path = os.path.join(self.folder_path, filename)
-                with open(file_path, "r", encoding="utf-8") as file:
-                    xml_content = file.read()
-                    self.results[filename] = self.validate_structure(xml_content)
+        if self.corpus is None:
+            self.corpus = XmlCorpus(self.folder_path, self.required_fields)
+        self.corpus.require(self.required_fields)
+        records = (({field: self.corpus.columns[field][row] for field in self.required_fields},)
+                   for row, filename in enumerate(self.corpus.files) if filename not in self.corpus.errors)
+        validated = iter(validate_records(self, records, self.workers))
+        for filename in self.corpus.files:
+            if filename in self.corpus.errors:
+                self.results[filename] = self.invalid_result()
+            else:
+                self.results[filename] = next(validated)
 
     def validate_structure(self, xml_content: str) -> dict:
         """
-        Checks an XML file for required fields and calculates accuracy.
+        Checks the content of one XML file for required fields (see validate_record).
+        """
+        try:
+            root = ET.fromstring(xml_content)
+        except ET.ParseError:
+            return self.invalid_result()
+        return self.validate_record(
+            {field: "" if self._check_element(root, field.split('/')) else None for field in self.required_fields})
+
+    def invalid_result(self) -> dict:
+        return {
+            "error": "Invalid XML format", 
+            "fields": {}, 
+            "file_accuracy": 0.0, 
+            "missing_fields": []
+        }
+
+    def validate_record(self, values: dict) -> dict:
+        """
+        Checks the values of one XML file for required fields and calculates accuracy.
+        values maps each required field to its text, None if the element is missing
+        (see XmlCorpus).
         
         For each required field, if it exists the score is 1, otherwise 0.
         The overall accuracy ("acc") is the average of the field scores.
@@ -43,23 +76,11 @@ class DataModelAccuracyXML:
           - "acc": overall accuracy,
           - "missing_fields": list of missing required fields.
         """
-        try:
-            root = ET.fromstring(xml_content)
-        except ET.ParseError:
-            return {
-                "error": "Invalid XML format", 
-                "fields": {}, 
-                "file_accuracy": 0.0, 
-                "missing_fields": []
-            }
-        
         field_scores = {}
         missing_fields = []
         for field in self.required_fields:
-            # Split the field path and check for its existence
-            field_path = field.split('/')
-            exists = self._check_element(root, field_path)
-            key = self._field_key(field)
+            exists = values.get(field) is not None
+            key = self.field_keys[field]
             if exists:
                 field_scores[key] = 1.0
             else:
@@ -103,6 +124,12 @@ class DataModelAccuracyXML:
         Returns:
           A JSON string of the report.
         """
+        return json.dumps(self.report(), ensure_ascii=False, indent=4)
+
+    def report(self) -> dict:
+        """
+        The report of get_model_accuracy as a dictionary.
+        """
         valid_files = [
             res for key, res in self.results.items()
             if key != "overall_accuracy" and "file_accuracy" in res
@@ -111,7 +138,7 @@ class DataModelAccuracyXML:
         if valid_files:
             overall_accuracy = sum(res["file_accuracy"] for res in valid_files) / len(valid_files)
         self.results["overall_accuracy"] = overall_accuracy
-        return json.dumps(self.results, ensure_ascii=False, indent=4)
+        return self.results
 
 
 
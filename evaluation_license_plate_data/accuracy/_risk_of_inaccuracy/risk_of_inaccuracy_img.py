@@ -1,10 +1,11 @@
 import os
 import json
-from PIL import Image
+from corpus.image_catalog import ImageCatalog, read_header
 
 class RiskOfInaccuracyImg:
     def __init__(self, image_folder: str, allowed_file_types: list = None,
-                 dimension_range: dict = None, file_size_range: dict = None) -> None:
+                 dimension_range: dict = None, file_size_range: dict = None,
+                 catalog: ImageCatalog = None) -> None:
         """
         Validate images by checking file type, dimensions, and file size.
         
@@ -15,8 +16,10 @@ class RiskOfInaccuracyImg:
                 Example: {'min_width': 800, 'max_width': 1920, 'min_height': 600, 'max_height': 1080}.
             file_size_range: Dictionary with keys min_size, max_size (in bytes).
                 Example: {'min_size': 1024, 'max_size': 5000000}.
+            catalog: Optional ImageCatalog of image_folder shared with the other evaluators.
         """
         self.image_folder = image_folder
+        self.catalog = catalog
         self.results = {}
         self.allowed_file_types = allowed_file_types if allowed_file_types is not None else ['png', 'jpg', 'jpeg']
         self.dimension_range = dimension_range if dimension_range is not None else {
@@ -35,14 +38,27 @@ class RiskOfInaccuracyImg:
         Process all image files in the specified folder and validate their file type, dimensions, and file size.
         For each file, compute a score and error message for each field as well as the overall file accuracy.
         """
-        for filename in os.listdir(self.image_folder):
-            file_path = os.path.join(self.image_folder, filename)
-            if os.path.isfile(file_path):
-                self.results[filename] = self.validate_image(file_path)
+        if self.catalog is None:
+            self.catalog = ImageCatalog(self.image_folder)
+        for row, filename in enumerate(self.catalog.files):
+            self.results[filename] = self.validate_record(filename, self.catalog.record(row))
 
     def validate_image(self, file_path: str) -> dict:
         """
-        Validate a single image file.
+        Validate a single image file (see validate_record).
+        """
+        header = read_header(file_path)
+        try:
+            header["size"] = os.path.getsize(file_path)
+        except Exception as e:
+            header["size"] = None
+            header["size_error"] = str(e)
+        return self.validate_record(os.path.basename(file_path), header)
+
+    def validate_record(self, filename: str, header: dict) -> dict:
+        """
+        Validate a single image file from its header metadata (see read_header) and its
+        size in bytes (header["size"]).
         
         Checks:
           - File type: The file extension must be in the allowed_file_types list.
@@ -59,7 +75,7 @@ class RiskOfInaccuracyImg:
         total_fields = 3  # file_type, dimensions, file_size
         
         # Validate file type
-        ext = os.path.splitext(file_path)[1].lower().replace('.', '')
+        ext = os.path.splitext(filename)[1].lower().replace('.', '')
         if ext in [ft.lower() for ft in self.allowed_file_types]:
             field_scores["file_type"] = 1
             field_errors["file_type"] = ""
@@ -68,39 +84,37 @@ class RiskOfInaccuracyImg:
             field_errors["file_type"] = f"Invalid file type '{ext}'. Allowed types: {self.allowed_file_types}."
         
         # Validate image dimensions
-        try:
-            with Image.open(file_path) as img:
-                width, height = img.size
-                if (self.dimension_range['min_width'] <= width <= self.dimension_range['max_width'] and
-                    self.dimension_range['min_height'] <= height <= self.dimension_range['max_height']):
-                    field_scores["dimensions"] = 1
-                    field_errors["dimensions"] = ""
-                else:
-                    field_scores["dimensions"] = 0
-                    field_errors["dimensions"] = (
-                        f"Image dimensions {width}x{height} are out of the allowed range: "
-                        f"width [{self.dimension_range['min_width']}, {self.dimension_range['max_width']}], "
-                        f"height [{self.dimension_range['min_height']}, {self.dimension_range['max_height']}]."
-                    )
-        except Exception as e:
+        if header["error"] is None:
+            width, height = header["width"], header["height"]
+            if (self.dimension_range['min_width'] <= width <= self.dimension_range['max_width'] and
+                self.dimension_range['min_height'] <= height <= self.dimension_range['max_height']):
+                field_scores["dimensions"] = 1
+                field_errors["dimensions"] = ""
+            else:
+                field_scores["dimensions"] = 0
+                field_errors["dimensions"] = (
+                    f"Image dimensions {width}x{height} are out of the allowed range: "
+                    f"width [{self.dimension_range['min_width']}, {self.dimension_range['max_width']}], "
+                    f"height [{self.dimension_range['min_height']}, {self.dimension_range['max_height']}]."
+                )
+        else:
             field_scores["dimensions"] = 0
-            field_errors["dimensions"] = f"Error opening image: {e}"
+            field_errors["dimensions"] = f"Error opening image: {header['error']}"
         
         # Validate file size
-        try:
-            size_bytes = os.path.getsize(file_path)
-            if self.file_size_range['min_size'] <= size_bytes <= self.file_size_range['max_size']:
-                field_scores["file_size"] = 1
-                field_errors["file_size"] = ""
-            else:
-                field_scores["file_size"] = 0
-                field_errors["file_size"] = (
-                    f"File size {size_bytes} bytes is out of the allowed range: "
-                    f"[{self.file_size_range['min_size']}, {self.file_size_range['max_size']}]."
-                )
-        except Exception as e:
+        size_bytes = header["size"]
+        if size_bytes is None:
             field_scores["file_size"] = 0
-            field_errors["file_size"] = f"Error obtaining file size: {e}"
+            field_errors["file_size"] = f"Error obtaining file size: {header.get('size_error')}"
+        elif self.file_size_range['min_size'] <= size_bytes <= self.file_size_range['max_size']:
+            field_scores["file_size"] = 1
+            field_errors["file_size"] = ""
+        else:
+            field_scores["file_size"] = 0
+            field_errors["file_size"] = (
+                f"File size {size_bytes} bytes is out of the allowed range: "
+                f"[{self.file_size_range['min_size']}, {self.file_size_range['max_size']}]."
+            )
         
         file_accuracy = sum(field_scores.values()) / total_fields
         # Remove empty error messages
@@ -116,6 +130,12 @@ class RiskOfInaccuracyImg:
           - The overall file accuracy (file_accuracy)
         Finally, an overall accuracy (overall_accuracy) is computed as the average accuracy of all files.
         """
+        return json.dumps(self.report(), ensure_ascii=False, indent=4)
+
+    def report(self) -> dict:
+        """
+        The report of get_risk_inaccuracy as a dictionary.
+        """
         valid_file_results = [
             file_data 
             for key, file_data in self.results.items() 
@@ -127,7 +147,7 @@ class RiskOfInaccuracyImg:
             overall_accuracy = sum(file_data["file_accuracy"] for file_data in valid_file_results) / total_files
         
         self.results["summary"] = {"overall_accuracy": overall_accuracy}
-        return json.dumps(self.results, ensure_ascii=False, indent=4)
+        return self.results
 
 
 # --- Example Usage ---
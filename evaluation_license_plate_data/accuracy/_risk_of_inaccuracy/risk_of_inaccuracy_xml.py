@@ -3,9 +3,16 @@ import re
 import json
 import xml.etree.ElementTree as ET
 from PIL import Image
+from corpus.xml_corpus import XmlCorpus, get_text
+from corpus.image_catalog import ImageCatalog
+from sharding import validate_records, SHARD_WORKERS
+
+NONZERO_TWO_DIGITS = re.compile(r"[1-9]{2}")
+PROVINCE_CODE = re.compile(r"[1-9]\d?")
 
 class RiskOfInaccuracyXml:
-    def __init__(self, folder_path: str, image_folder: str, required_fields: dict = None) -> None:
+    def __init__(self, folder_path: str, image_folder: str, required_fields: dict = None,
+                 corpus: XmlCorpus = None, catalog: ImageCatalog = None, workers: int = SHARD_WORKERS) -> None:
         """
         Validates the structure and data correctness of an Iranian car dataset.
         
@@ -28,9 +35,15 @@ class RiskOfInaccuracyXml:
                     - "car_coordinates_y": "CarCoordinates/Y"
                     - "car_coordinates_width": "CarCoordinates/Width"
                     - "car_coordinates_height": "CarCoordinates/Height"
+            corpus: Optional XmlCorpus of folder_path shared with the other evaluators.
+            catalog: Optional ImageCatalog of image_folder; image sizes are then read from it.
+            workers: Number of processes validating the files (see validate_records).
         """
         self.folder_path = folder_path
         self.image_folder = image_folder
+        self.corpus = corpus
+        self.catalog = catalog
+        self.workers = workers
         self.results = {}
         
         # Load valid province codes from JSON or use hardcoded version.
@@ -109,18 +122,41 @@ class RiskOfInaccuracyXml:
         Process all XML files in the folder and validate their structure and data.
         For each file, it computes the score and error message for each field as well as the overall file accuracy.
         """
-        for filename in os.listdir(self.folder_path):
-            if filename.endswith(".xml"):
-                file_path = os.path.join(self.folder_path, filename)
-                image_file = os.path.splitext(filename)[0] + ".jpg"
-                image_path = os.path.join(self.image_folder, image_file)
-                with open(file_path, "r", encoding="utf-8") as file:
-                    xml_content = file.read()
-                    self.results[filename] = self.validate_structure(xml_content, image_path)
+        if self.corpus is None:
+            self.corpus = XmlCorpus(self.folder_path, self.required_fields.values())
+        self.corpus.require(self.required_fields.values())
+        records = (({key: get_text(value) for key, value in self.corpus.record(row, self.required_fields).items()},
+                    os.path.join(self.image_folder, os.path.splitext(filename)[0] + ".jpg"))
+                   for row, filename in enumerate(self.corpus.files) if filename not in self.corpus.errors)
+        validated = iter(validate_records(self, records, self.workers))
+        for filename in self.corpus.files:
+            if filename in self.corpus.errors:
+                self.results[filename] = self.invalid_result()
+            else:
+                self.results[filename] = next(validated)
 
     def validate_structure(self, xml_content: str, image_path: str) -> dict:
         """
-        Validates the XML structure and data using the following rules:
+        Validates the content of one XML file (see validate_record).
+        """
+        try:
+            root = ET.fromstring(xml_content)
+        except ET.ParseError:
+            return self.invalid_result()
+        values = {key: self.get_text(root, path) for key, path in self.required_fields.items()}
+        return self.validate_record(values, image_path)
+
+    def invalid_result(self) -> dict:
+        return {
+            "fields": {field: 0 for field in self.required_fields},
+            "errors": {field: "Invalid XML format." for field in self.required_fields},
+            "file_accuracy": 0
+        }
+
+    def validate_record(self, values: dict, image_path: str) -> dict:
+        """
+        Validates the values of one XML file, a {field key: stripped text or None} mapping
+        over the keys of required_fields, using the following rules:
           - registration_prefix: must be exactly 2 digits (without zeros).
           - series_letter: must be exactly one English letter.
           - registration_number: must be exactly 2 digits (without zeros).
@@ -138,18 +174,9 @@ class RiskOfInaccuracyXml:
         field_errors = {}
         total_fields = len(self.required_fields)
         
-        try:
-            root = ET.fromstring(xml_content)
-        except ET.ParseError:
-            # If the XML is invalid, record an error for all fields.
-            for field in self.required_fields:
-                field_scores[field] = 0
-                field_errors[field] = "Invalid XML format."
-            return {"fields": field_scores, "errors": field_errors, "file_accuracy": 0}
-        
         # Validate registration_prefix: must be exactly 2 digits (without zeros).
-        reg_prefix = self.get_text(root, self.required_fields.get("registration_prefix"))
-        if reg_prefix and re.fullmatch(r"[1-9]{2}", reg_prefix):
+        reg_prefix = values.get("registration_prefix")
+        if reg_prefix and NONZERO_TWO_DIGITS.fullmatch(reg_prefix):
             field_scores["registration_prefix"] = 1
             field_errors["registration_prefix"] = ""
         else:
@@ -157,7 +184,7 @@ class RiskOfInaccuracyXml:
             field_errors["registration_prefix"] = f"Invalid or missing registration prefix: '{reg_prefix}' (must be exactly 2 digits without zeros)."
         
         # Validate series_letter: must be exactly one English letter.
-        series_letter = self.get_text(root, self.required_fields.get("series_letter"))
+        series_letter = values.get("series_letter")
         if series_letter and len(series_letter) == 1 and series_letter in self.valid_series_letters:
             field_scores["series_letter"] = 1
             field_errors["series_letter"] = ""
@@ -166,8 +193,8 @@ class RiskOfInaccuracyXml:
             field_errors["series_letter"] = f"Invalid or missing series letter: '{series_letter}' (must be exactly one English letter)."
         
         # Validate registration_number: must be exactly 2 digits (without zeros).
-        reg_number = self.get_text(root, self.required_fields.get("registration_number"))
-        if reg_number and re.fullmatch(r"[1-9]{2}", reg_number):
+        reg_number = values.get("registration_number")
+        if reg_number and NONZERO_TWO_DIGITS.fullmatch(reg_number):
             field_scores["registration_number"] = 1
             field_errors["registration_number"] = ""
         else:
@@ -175,8 +202,8 @@ class RiskOfInaccuracyXml:
             field_errors["registration_number"] = f"Invalid or missing registration number: '{reg_number}' (must be exactly 2 digits without zeros)."
         
         # Validate province_code: must be 1 or 2 digits and be in the valid province codes.
-        province_code = self.get_text(root, self.required_fields.get("province_code"))
-        if province_code and re.fullmatch(r"[1-9]\d?", province_code):
+        province_code = values.get("province_code")
+        if province_code and PROVINCE_CODE.fullmatch(province_code):
             try:
                 province_code_int = int(province_code)
                 if province_code_int in self.valid_province_codes:
@@ -193,7 +220,7 @@ class RiskOfInaccuracyXml:
             field_errors["province_code"] = f"Invalid province code: '{province_code}' (must be 1 or 2 digits and valid)."
         
         # Validate car_model
-        car_model = self.get_text(root, self.required_fields.get("car_model"))
+        car_model = values.get("car_model")
         if car_model in self.valid_car_models:
             field_scores["car_model"] = 1
             field_errors["car_model"] = ""
@@ -202,7 +229,7 @@ class RiskOfInaccuracyXml:
             field_errors["car_model"] = f"Unexpected car model: '{car_model}'."
         
         # Validate car_color (case insensitive)
-        car_color = self.get_text(root, self.required_fields.get("car_color"))
+        car_color = values.get("car_color")
         if car_color and car_color.lower() in self.valid_road_colors:
             field_scores["car_color"] = 1
             field_errors["car_color"] = ""
@@ -211,48 +238,47 @@ class RiskOfInaccuracyXml:
             field_errors["car_color"] = f"Unusual car color: '{car_color}'."
         
         # Validate coordinates: first check if the image exists.
-        if os.path.exists(image_path):
+        if self.image_exists(image_path):
             try:
-                with Image.open(image_path) as img:
-                    img_width, img_height = img.size
-                    
-                    # Validate license plate coordinates using individual keys
-                    license_coords = {
-                        "x": self.get_coordinate_value(root, "license_plate_coordinates_x"),
-                        "y": self.get_coordinate_value(root, "license_plate_coordinates_y"),
-                        "width": self.get_coordinate_value(root, "license_plate_coordinates_width"),
-                        "height": self.get_coordinate_value(root, "license_plate_coordinates_height")
-                    }
-                    if self.is_inside_image(license_coords, img_width, img_height):
-                        field_scores["license_plate_coordinates_x"] = 1
-                        field_scores["license_plate_coordinates_y"] = 1
-                        field_scores["license_plate_coordinates_width"] = 1
-                        field_scores["license_plate_coordinates_height"] = 1
-                    else:
-                        field_scores["license_plate_coordinates_x"] = 0
-                        field_scores["license_plate_coordinates_y"] = 0
-                        field_scores["license_plate_coordinates_width"] = 0
-                        field_scores["license_plate_coordinates_height"] = 0
-                        field_errors["license_plate_coordinates"] = "License plate coordinates are out of image bounds or invalid."
-                    
-                    # Validate car coordinates using individual keys
-                    car_coords = {
-                        "x": self.get_coordinate_value(root, "car_coordinates_x"),
-                        "y": self.get_coordinate_value(root, "car_coordinates_y"),
-                        "width": self.get_coordinate_value(root, "car_coordinates_width"),
-                        "height": self.get_coordinate_value(root, "car_coordinates_height")
-                    }
-                    if self.is_inside_image(car_coords, img_width, img_height):
-                        field_scores["car_coordinates_x"] = 1
-                        field_scores["car_coordinates_y"] = 1
-                        field_scores["car_coordinates_width"] = 1
-                        field_scores["car_coordinates_height"] = 1
-                    else:
-                        field_scores["car_coordinates_x"] = 0
-                        field_scores["car_coordinates_y"] = 0
-                        field_scores["car_coordinates_width"] = 0
-                        field_scores["car_coordinates_height"] = 0
-                        field_errors["car_coordinates"] = "Car coordinates are out of image bounds or invalid."
+                img_width, img_height = self.image_size(image_path)
+                
+                # Validate license plate coordinates using individual keys
+                license_coords = {
+                    "x": self.get_coordinate_value(values, "license_plate_coordinates_x"),
+                    "y": self.get_coordinate_value(values, "license_plate_coordinates_y"),
+                    "width": self.get_coordinate_value(values, "license_plate_coordinates_width"),
+                    "height": self.get_coordinate_value(values, "license_plate_coordinates_height")
+                }
+                if self.is_inside_image(license_coords, img_width, img_height):
+                    field_scores["license_plate_coordinates_x"] = 1
+                    field_scores["license_plate_coordinates_y"] = 1
+                    field_scores["license_plate_coordinates_width"] = 1
+                    field_scores["license_plate_coordinates_height"] = 1
+                else:
+                    field_scores["license_plate_coordinates_x"] = 0
+                    field_scores["license_plate_coordinates_y"] = 0
+                    field_scores["license_plate_coordinates_width"] = 0
+                    field_scores["license_plate_coordinates_height"] = 0
+                    field_errors["license_plate_coordinates"] = "License plate coordinates are out of image bounds or invalid."
+                
+                # Validate car coordinates using individual keys
+                car_coords = {
+                    "x": self.get_coordinate_value(values, "car_coordinates_x"),
+                    "y": self.get_coordinate_value(values, "car_coordinates_y"),
+                    "width": self.get_coordinate_value(values, "car_coordinates_width"),
+                    "height": self.get_coordinate_value(values, "car_coordinates_height")
+                }
+                if self.is_inside_image(car_coords, img_width, img_height):
+                    field_scores["car_coordinates_x"] = 1
+                    field_scores["car_coordinates_y"] = 1
+                    field_scores["car_coordinates_width"] = 1
+                    field_scores["car_coordinates_height"] = 1
+                else:
+                    field_scores["car_coordinates_x"] = 0
+                    field_scores["car_coordinates_y"] = 0
+                    field_scores["car_coordinates_width"] = 0
+                    field_scores["car_coordinates_height"] = 0
+                    field_errors["car_coordinates"] = "Car coordinates are out of image bounds or invalid."
             except Exception as e:
                 error_msg = f"Error processing image: {e}"
                 for key in ["license_plate_coordinates_x", "license_plate_coordinates_y", 
@@ -281,6 +307,20 @@ class RiskOfInaccuracyXml:
         
         return {"fields": field_scores, "errors": field_errors, "file_accuracy": file_accuracy}
 
+    def image_exists(self, image_path: str) -> bool:
+        if self.catalog is not None and self.catalog.holds(image_path):
+            return os.path.basename(image_path) in self.catalog.index
+        return os.path.exists(image_path)
+
+    def image_size(self, image_path: str) -> tuple:
+        """
+        (width, height) of an image, from the catalog when it holds the image's folder.
+        """
+        if self.catalog is not None and self.catalog.holds(image_path):
+            return self.catalog.size(self.catalog.index[os.path.basename(image_path)])
+        with Image.open(image_path) as img:
+            return img.size
+
     def get_text(self, root, path: str):
         """
         Extract text from an XML element using XPath.
@@ -288,11 +328,11 @@ class RiskOfInaccuracyXml:
         element = root.find(path)
         return element.text.strip() if element is not None and element.text else None
 
-    def get_coordinate_value(self, root, field_key: str):
+    def get_coordinate_value(self, values: dict, field_key: str):
         """
         Retrieve a coordinate value (as integer) based on the field key.
         """
-        text = self.get_text(root, self.required_fields.get(field_key))
+        text = values.get(field_key)
         return int(text) if text and text.isdigit() else None
 
     def is_inside_image(self, coords: dict, img_width: int, img_height: int) -> bool:
@@ -313,6 +353,12 @@ class RiskOfInaccuracyXml:
           - The overall file accuracy (average score)
         And finally, the overall accuracy (average accuracy of all files) is included.
         """
+        return json.dumps(self.report(), ensure_ascii=False, indent=4)
+
+    def report(self) -> dict:
+        """
+        The report of get_risk_inaccuracy as a dictionary.
+        """
         valid_file_results = [
             file_data 
             for key, file_data in self.results.items() 
@@ -324,7 +370,7 @@ class RiskOfInaccuracyXml:
             overall_accuracy = sum(file_data["file_accuracy"] for file_data in valid_file_results) / total_files
 
         self.results["summary"] = {"overall_accuracy": overall_accuracy}
-        return json.dumps(self.results, ensure_ascii=False, indent=4)
+        return self.results
 
 
 
@@ -1,14 +0,0 @@
-
-def get_char_id_dict() -> dict:
-    char_dict = {'0': '0', '1': '1', '2': '2', '3': '3', '4': '4', '5': '5', '6': '6', '7': '7', '8': '8',
-                        '9': '9',
-                        'A': '10', 'B': '11', 'P': '12', 'Taxi': '13', 'ث': '14', 'J': '15', 'چ': '16', 'ح': '17',
-                        'خ': '18',
-                        'D': '19', 'ذ': '20', 'ر': '21', 'ز': '22', 'ژ': '23', 'Sin': '24', 'ش': '25', 'Sad': '26',
-                        'ض': '27',
-                        'T': '28', 'ظ': '29', 'PuV': '30', 'غ': '31', 'ف': '32', 'Gh': '33', 'ک': '34', 'گ': '35',
-                        'L': '36',
-                        'M': '37', 'N': '38', 'H': '39', 'V': '40', 'Y': '41', 'PwD': '42'}
-
-    char_id_dict = {v: k for k, v in char_dict.items()}
-    return char_id_dict
\ No newline at end of file
@@ -1,12 +1,27 @@
 import json
-from .risk_of_inaccuracy import RiskOfInaccuracy
+from .risk_of_inaccuracy import risk_of_inaccuracy_reports
 from .semantic_accuracy import SemanticEvaluator
-from .data_model_accuracy import DataModelAccuracy
+from .data_model_accuracy import data_model_accuracy_reports
 from .syntactic_accuracy import SyntacticAccuracy
+from corpus.xml_corpus import XmlCorpus
+from corpus.image_catalog import ImageCatalog
 
-def accuracy(image_folder, xml_folder, xml_config , required_metadata, allowed_file_types, dimension_range, file_size_range):
+def accuracy(image_folder, xml_folder, xml_config , required_metadata, allowed_file_types, dimension_range, file_size_range,
+             corpus=None, catalog=None):
+    """
+    Runs the accuracy evaluation process and returns the report as a JSON string
+    (see accuracy_report for the parameters).
+    """
+    return json.dumps(accuracy_report(image_folder, xml_folder, xml_config, required_metadata, allowed_file_types,
+                                      dimension_range, file_size_range, corpus, catalog),
+                      ensure_ascii=False, indent=4)
+
+def accuracy_report(image_folder, xml_folder, xml_config , required_metadata, allowed_file_types, dimension_range,
+                    file_size_range, corpus=None, catalog=None):
     """
     Runs the accuracy evaluation process and returns the report as a JSON-compatible dictionary.
+    Every validator runs once and its report is kept as a dictionary; it is serialized only by
+    the caller.
 
     :param image_folder: Path to the folder containing images.
     :param xml_folder: Path to the folder containing XML files.
@@ -16,29 +31,36 @@ def accuracy(image_folder, xml_folder, xml_config , required_metadata, allowed_f
     :param dimension_range: Valid image dimensions range.
     :param file_size_range: Valid file size range.
     :param xpaths_syntactic_evaluator: XPath fields for syntactic accuracy evaluation.
+    :param corpus: Optional XmlCorpus of xml_folder; the folder is parsed once for all evaluations.
+    :param catalog: Optional ImageCatalog of image_folder; the images are scanned once for all evaluations.
 
     :return: Dictionary containing the results of all evaluations.
     """
 
+    if corpus is None:
+        corpus = XmlCorpus(xml_folder, xml_config.values())
+    if catalog is None:
+        catalog = ImageCatalog(image_folder)
+
     results = {}
     # 1️⃣ Data Model Accuracy
-    results["data_model_accuracy_xml"] = json.loads(DataModelAccuracy(image_folder, xml_folder, required_metadata, xml_config)[0])
-    results["data_model_accuracy_img"] = json.loads(DataModelAccuracy(image_folder, xml_folder, required_metadata, xml_config)[1])
+    results["data_model_accuracy_xml"], results["data_model_accuracy_img"] = data_model_accuracy_reports(
+        image_folder, xml_folder, required_metadata, xml_config, corpus, catalog)
 
     # 2️⃣ Risk of Inaccuracy
-    results["risk_of_inaccuracy_xml"] = json.loads(RiskOfInaccuracy(image_folder, xml_folder, allowed_file_types, dimension_range, file_size_range, xml_config)[0])
-    results["risk_of_inaccuracy_img"] = json.loads(RiskOfInaccuracy(image_folder, xml_folder, allowed_file_types, dimension_range, file_size_range, xml_config)[1])
+    results["risk_of_inaccuracy_xml"], results["risk_of_inaccuracy_img"] = risk_of_inaccuracy_reports(
+        image_folder, xml_folder, allowed_file_types, dimension_range, file_size_range, xml_config, corpus, catalog)
 
 
     # 3️⃣ Semantic Accuracy
-    semantic_evaluator = SemanticEvaluator(xml_folder, image_folder, xml_config)
-    results["semantic_accuracy"] = json.loads(semantic_evaluator.evaluate_directory())
+    semantic_evaluator = SemanticEvaluator(xml_folder, image_folder, xml_config, corpus=corpus)
+    results["semantic_accuracy"] = semantic_evaluator.report()
 
 
     # 4️⃣ Syntactic Accuracy    
-    syntactic_evaluator = SyntacticAccuracy(xml_folder, xml_config)
+    syntactic_evaluator = SyntacticAccuracy(xml_folder, xml_config, corpus)
     syntactic_evaluator.process_folder()
-    results["syntactic_accuracy"] = json.loads(syntactic_evaluator.get_syntactic_evaluator())
+    results["syntactic_accuracy"] = syntactic_evaluator.report()
 
 
-    return json.dumps(results, ensure_ascii=False, indent=4)
\ No newline at end of file
+    return results
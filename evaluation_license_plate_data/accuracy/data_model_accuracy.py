@@ -1,9 +1,10 @@
 # Import the classes for validating image metadata and XML structure from the respective modules.
 from ._data_model_accuracy.data_model_accuracy_img import DataModelAccuracyIMG
 from ._data_model_accuracy.data_model_accuracy_xml import DataModelAccuracyXML
+import json
 
 
-def DataModelAccuracy(folder_path_img, folder_path_xml, required_metadata, xml_config):
+def DataModelAccuracy(folder_path_img, folder_path_xml, required_metadata, xml_config, corpus=None, catalog=None):
     """
     Runs the data model accuracy validation on both image files and XML files.
 
@@ -14,6 +15,8 @@ def DataModelAccuracy(folder_path_img, folder_path_xml, required_metadata, xml_c
                          Example: ["width", "height", "format", "location", "date"]
       required_fields: List of required XML fields in hierarchical format for XML validation.
                        Example: ["LicensePlate/RegistrationPrefix", "LicensePlate/SeriesLetter", ...]
+      corpus: Optional XmlCorpus of folder_path_xml shared with the other evaluators.
+      catalog: Optional ImageCatalog of folder_path_img shared with the other evaluators.
 
     Process:
       1. Create an instance of DataModelAccuracyIMG with the image folder and required metadata.
@@ -23,20 +26,31 @@ def DataModelAccuracy(folder_path_img, folder_path_xml, required_metadata, xml_c
       5. Validate all XML files in the folder by checking for missing fields.
       6. Generate a JSON report for the XML accuracy.
     """
+    report_xml, report_img = data_model_accuracy_reports(folder_path_img, folder_path_xml, required_metadata,
+                                                         xml_config, corpus, catalog)
+    return (json.dumps(report_xml, ensure_ascii=False, indent=4),
+            json.dumps(report_img, ensure_ascii=False, indent=4))
+
+
+def data_model_accuracy_reports(folder_path_img, folder_path_xml, required_metadata, xml_config, corpus=None,
+                                catalog=None):
+    """
+    Same as DataModelAccuracy, returning the XML and image reports as dictionaries.
+    """
     # Instantiate the image validator with the image folder and required metadata.
-    validator = DataModelAccuracyIMG(folder_path_img, required_metadata)
+    validator = DataModelAccuracyIMG(folder_path_img, required_metadata, catalog)
     # Validate all images in the specified folder.
     validator.validate_images()
-    # Generate and store the JSON report for image metadata accuracy.
-    report_img = validator.get_model_accuracy()
+    # Generate and store the report for image metadata accuracy.
+    report_img = validator.report()
 
     # Instantiate the XML validator with the XML folder and required fields.
     required_fields = list(xml_config.values())
-    validator = DataModelAccuracyXML(folder_path_xml, required_fields)
+    validator = DataModelAccuracyXML(folder_path_xml, required_fields, corpus)
     # Validate all XML files in the specified folder.
     validator.validate_files()
-    # Generate and store the JSON report for XML structure accuracy.
-    report_xml = validator.get_model_accuracy()
+    # Generate and store the report for XML structure accuracy.
+    report_xml = validator.report()
 
     return report_xml  , report_img
 
@@ -1,8 +1,10 @@
 from ._risk_of_inaccuracy.risk_of_inaccuracy_img import RiskOfInaccuracyImg
 from ._risk_of_inaccuracy.risk_of_inaccuracy_xml import RiskOfInaccuracyXml
+import json
 
 
-def RiskOfInaccuracy(img_folder, xml_folder, allowed_file_types, dimension_range, file_size_range, required_fields):
+def RiskOfInaccuracy(img_folder, xml_folder, allowed_file_types, dimension_range, file_size_range, required_fields,
+                     corpus=None, catalog=None):
     """
     Validates both image files and XML files of a dataset using specified parameters.
     
@@ -30,33 +32,45 @@ def RiskOfInaccuracy(img_folder, xml_folder, allowed_file_types, dimension_range
                                     - "car_coordinates_y": "CarCoordinates/Y"
                                     - "car_coordinates_width": "CarCoordinates/Width"
                                     - "car_coordinates_height": "CarCoordinates/Height"
+        corpus (XmlCorpus): Optional parsed XML folder shared with the other evaluators.
+        catalog (ImageCatalog): Optional scanned image folder shared with the other evaluators.
     
     Returns:
         tuple: A tuple containing two JSON reports:
             - report_xml: JSON report for XML file validation.
             - report_img: JSON report for image file validation.
     """
-    
+    report_xml, report_img = risk_of_inaccuracy_reports(img_folder, xml_folder, allowed_file_types, dimension_range,
+                                                        file_size_range, required_fields, corpus, catalog)
+    return (json.dumps(report_xml, ensure_ascii=False, indent=4),
+            json.dumps(report_img, ensure_ascii=False, indent=4))
+
+
+def risk_of_inaccuracy_reports(img_folder, xml_folder, allowed_file_types, dimension_range, file_size_range,
+                               required_fields, corpus=None, catalog=None):
+    """
+    Same as RiskOfInaccuracy, returning the XML and image reports as dictionaries.
+    """
     # ----------------------------
     # Validate Images
     # ----------------------------
     # Create an instance of the image validator using the provided parameters.
-    image_validator = RiskOfInaccuracyImg(img_folder, allowed_file_types, dimension_range, file_size_range)
+    image_validator = RiskOfInaccuracyImg(img_folder, allowed_file_types, dimension_range, file_size_range, catalog)
     # Process and validate all image files in the folder.
     image_validator.validate_files()
-    # Get the JSON report for image validation.
-    report_img = image_validator.get_risk_inaccuracy()
+    # Get the report for image validation.
+    report_img = image_validator.report()
     
     # ----------------------------
     # Validate XML Files
     # ----------------------------
     # Create an instance of the XML validator.
     # The XML validator requires the image folder path to validate coordinate fields.
-    xml_validator = RiskOfInaccuracyXml(xml_folder, img_folder, required_fields)
+    xml_validator = RiskOfInaccuracyXml(xml_folder, img_folder, required_fields, corpus, catalog)
     # Process and validate all XML files in the specified folder.
     xml_validator.validate_files()
-    # Get the JSON report for XML validation.
-    report_xml = xml_validator.get_risk_inaccuracy()
+    # Get the report for XML validation.
+    report_xml = xml_validator.report()
 
     return report_xml, report_img
 
@@ -2,20 +2,60 @@ import os
 import json
 import xml.etree.ElementTree as ET
 from PIL import Image
-from ._semantic_accuracy.car_color_classifier.car_color_classifier_yolo4 import detect_car_color
-from ._semantic_accuracy.iranian_car_detection.detection import detect_cars
-from ._semantic_accuracy.Iranian_Plate_Recognitiont.plate_recognizer import process_image
+# The detectors are shared with the labeling pipeline, so both subsystems use one model
+# registry and load every model once per process. The repository root, which holds
+# auto_labeling_car, is put on sys.path by the entry script (evaluation_license_plate_data.py).
+from auto_labeling_car.car_color_classifier.car_color_classifier_yolo4 import detect_car_color, detect_car_color_in_box
+from auto_labeling_car.iranian_car_detection.detection import detect_cars
+from auto_labeling_car.Iranian_Plate_Recognitiont.plate_recognizer import process_image
+from auto_labeling_car.inference_cache import (InferenceCache, get_inference_cache, CAR, PLATE, COLOR_YOLOV4,
+                                               COLOR_CAR_BOX)
+from auto_labeling_car.frame import Frame
+from corpus.xml_corpus import XmlCorpus, get_text
+
+# EVALUATION_REUSE_CAR_BOX=1 classifies the car color on the car detector's box, like the
+# labeling pipeline with LABELING_REUSE_CAR_BOX=1; by default YOLOv4 finds the car first.
+REUSE_CAR_BOX = os.environ.get("EVALUATION_REUSE_CAR_BOX", "0") == "1"
 
 class GetInfo:
-    def __init__(self, image_path: str):
+    def __init__(self, image_path: str, cache: InferenceCache = None, reuse_car_box: bool = REUSE_CAR_BOX):
         self.image_path = image_path
+        self.cache = cache
+        self.reuse_car_box = reuse_car_box
     
     def extract_info(self):
-        self.color = detect_car_color(self.image_path)
-        self.car_model, car_bbox = detect_cars(self.image_path, save_output=False)
+        # Results already computed for this image content (while labeling or by an earlier
+        # evaluation) are read from the cache instead of running the models again.
+        key = self.cache.image_key(self.image_path) if self.cache is not None and os.path.exists(self.image_path) else None
+        cached = self.cache.get(key) if key is not None else {}
+        computed = []
+
+        if CAR in cached:
+            self.car_model, car_bbox = cached[CAR]
+        else:
+            self.car_model, car_bbox = detect_cars(self.image_path, save_output=False)
+            computed.append((key, CAR, [self.car_model, car_bbox]))
         self.car_coordinates = self.format_bbox(car_bbox)
-        self.plate_number, plate_bbox = process_image(self.image_path)
+        # Only the color of the configured mode is used, so the report does not depend on the
+        # mode the cache was filled with.
+        color_field = COLOR_CAR_BOX if self.reuse_car_box else COLOR_YOLOV4
+        if color_field in cached:
+            self.color = cached[color_field]
+        else:
+            if self.reuse_car_box:
+                self.color = detect_car_color_in_box(Frame.from_path(self.image_path).bgr, car_bbox)
+            else:
+                self.color = detect_car_color(self.image_path)
+            computed.append((key, color_field, self.color))
+        if PLATE in cached:
+            self.plate_number, plate_bbox = cached[PLATE]
+        else:
+            self.plate_number, plate_bbox = process_image(self.image_path)
+            computed.append((key, PLATE, [self.plate_number, plate_bbox]))
         self.plate_coordinates = self.format_bbox(plate_bbox)
+
+        if key is not None:
+            self.cache.put_many(computed)
     
     def format_bbox(self, bbox):
         if bbox is None:
@@ -35,13 +75,23 @@ class GetInfo:
 
 
 class XMLInfo:
-    def __init__(self, xml_path: str, xml_config: dict):
+    def __init__(self, xml_path: str, xml_config: dict, corpus: XmlCorpus = None):
         self.xml_path = xml_path
         self.xml_config = xml_config
+        self.corpus = corpus
         self.data = {}
         self.parse_xml()
     
     def parse_xml(self):
+        # Read the values from the shared corpus when it holds the file instead of parsing it again.
+        filename = os.path.basename(self.xml_path)
+        if self.corpus is not None and filename in self.corpus.index:
+            if filename in self.corpus.errors:
+                self.data = {"error": "Invalid XML format"}
+            else:
+                record = self.corpus.record(self.corpus.index[filename], self.xml_config)
+                self.data = {key: get_text(value) for key, value in record.items()}
+            return
         try:
             tree = ET.parse(self.xml_path)
             root = tree.getroot()
@@ -55,9 +105,13 @@ class XMLInfo:
 
 
 class SemanticEvaluator:
-    def __init__(self, xml_dir: str, image_dir: str, xml_config: dict):
+    def __init__(self, xml_dir: str, image_dir: str, xml_config: dict, cache: InferenceCache = None,
+                 corpus: XmlCorpus = None, reuse_car_box: bool = REUSE_CAR_BOX):
         self.xml_dir = xml_dir
+        self.corpus = corpus
         self.image_dir = image_dir
+        self.cache = cache if cache is not None else get_inference_cache()
+        self.reuse_car_box = reuse_car_box
         self.xml_config = {key: xml_config[key] for key in xml_config if key in {
                                                                                     "registration_prefix",
                                                                                     "series_letter",
@@ -82,10 +136,11 @@ class SemanticEvaluator:
         img_path = os.path.join(self.image_dir, base_name + ".png")
         xml_path = os.path.join(self.xml_dir, base_name + ".xml")
         
-        if not os.path.exists(xml_path):
+        in_corpus = self.corpus is not None and base_name + ".xml" in self.corpus.index
+        if not in_corpus and not os.path.exists(xml_path):
             return {"error": f"Missing XML file for {filename}"}
         
-        detector = GetInfo(img_path)
+        detector = GetInfo(img_path, self.cache, self.reuse_car_box)
         detector.extract_info()
         reg_prefix, series_letter, reg_number, province_code = detector.parse_plate_number()
         # Update predictions with individual coordinate fields.
@@ -106,7 +161,7 @@ class SemanticEvaluator:
             "car_coordinates_height": detector.car_coordinates.get("Height") if detector.car_coordinates else None
         }
         
-        xml_info = XMLInfo(xml_path, self.xml_config)
+        xml_info = XMLInfo(xml_path, self.xml_config, self.corpus)
         gt_data = xml_info.data
         
         field_scores = {}
@@ -131,7 +186,13 @@ class SemanticEvaluator:
             "errors": errors
         }
     
-    def evaluate_directory(self) -> dict:
+    def evaluate_directory(self) -> str:
+        return json.dumps(self.report(), ensure_ascii=False, indent=4)
+
+    def report(self) -> dict:
+        """
+        Evaluates every image of image_dir and returns the per-file results with their summary.
+        """
         for filename in os.listdir(self.image_dir):
             if filename.lower().endswith((".jpg", ".jpeg", ".png")):
                 self.results[filename] = self.evaluate_file(filename)
@@ -140,7 +201,7 @@ class SemanticEvaluator:
         overall_accuracy = (sum(res["file_accuracy"] for res in valid_files) / len(valid_files)
                             if valid_files else 0)
         self.results["summary"] = {"overall_accuracy": overall_accuracy}
-        return json.dumps(self.results, ensure_ascii=False, indent=4)
+        return self.results
 
 
 # xml_folder = "/home/reza/Desktop/data-validation/evaluation_license_plate_data/assets/xml"  # Folder containing XML files.
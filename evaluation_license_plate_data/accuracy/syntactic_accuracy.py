@@ -1,10 +1,17 @@
-import os
 import re
 import json
 import xml.etree.ElementTree as ET
+from corpus.xml_corpus import XmlCorpus, get_text
+from sharding import validate_records, SHARD_WORKERS
+
+REGISTRATION_PREFIX = re.compile(r"\d{2}")
+SERIES_LETTER = re.compile(r"[A-Za-z]+")
+REGISTRATION_NUMBER = re.compile(r"\d{3}")
+PROVINCE_CODE = re.compile(r"\d{1,2}")
 
 class SyntacticAccuracy:
-    def __init__(self, xml_folder: str, xml_config: dict) -> None:
+    def __init__(self, xml_folder: str, xml_config: dict, corpus: XmlCorpus = None,
+                 workers: int = SHARD_WORKERS) -> None:
         """
         Initializes the evaluator with the folder containing XML files and the XML paths
         for the required fields.
@@ -17,8 +24,12 @@ class SyntacticAccuracy:
                       - "series_letter": e.g. "LicensePlate/SeriesLetter"
                       - "registration_number": e.g. "LicensePlate/RegistrationNumber"
                       - "province_code": e.g. "LicensePlate/ProvinceCode"
+            corpus: Optional XmlCorpus of xml_folder shared with the other evaluators.
+            workers: Number of processes validating the files (see validate_records).
         """
         self.xml_folder = xml_folder
+        self.corpus = corpus
+        self.workers = workers
         self.xpaths = {key: xml_config[key] for key in xml_config if key in {
                                                                                     "registration_prefix",
                                                                                     "series_letter",
@@ -28,9 +39,23 @@ class SyntacticAccuracy:
         self.results = {}
 
     def compute_accuracy(self, xml_content: str) -> dict:
+        """
+        Computes the syntactic accuracy of one XML string (see validate_record).
+        """
+        try:
+            root = ET.fromstring(xml_content)
+        except ET.ParseError as e:
+            return {"error": f"Invalid XML format: {e}"}
+        values = {}
+        for key, path in self.xpaths.items():
+            element = root.find(path)
+            values[key] = element.text.strip() if element is not None and element.text else None
+        return self.validate_record(values)
+
+    def validate_record(self, values: dict) -> dict:
         """
         Computes the syntactic accuracy for Iranian vehicle license plate components
-        based on an XML string.
+        from the values of one XML file, a {field key: stripped text or None} mapping.
 
         Checks:
           - RegistrationPrefix must match exactly 2 digits.
@@ -52,45 +77,36 @@ class SyntacticAccuracy:
               - "acc": overall syntactic accuracy,
               - "errors": error messages for fields with issues.
         """
-        try:
-            root = ET.fromstring(xml_content)
-        except ET.ParseError as e:
-            return {"error": f"Invalid XML format: {e}"}
-        
         field_scores = {}
         errors = {}
 
         # Check RegistrationPrefix (exactly 2 digits)
-        reg_prefix_elem = root.find(self.xpaths.get("registration_prefix"))
-        reg_prefix = reg_prefix_elem.text.strip() if reg_prefix_elem is not None and reg_prefix_elem.text else ""
-        if re.fullmatch(r"\d{2}", reg_prefix):
+        reg_prefix = values.get("registration_prefix") or ""
+        if REGISTRATION_PREFIX.fullmatch(reg_prefix):
             field_scores["registration_prefix_accuracy"] = 1.0
         else:
             field_scores["registration_prefix_accuracy"] = 0.0
             errors["registration_prefix"] = f"'{reg_prefix}' is not exactly 2 digits."
 
         # Check SeriesLetter (only English letters)
-        series_letter_elem = root.find(self.xpaths.get("series_letter"))
-        series_letter = series_letter_elem.text.strip() if series_letter_elem is not None and series_letter_elem.text else ""
-        if re.fullmatch(r"[A-Za-z]+", series_letter):
+        series_letter = values.get("series_letter") or ""
+        if SERIES_LETTER.fullmatch(series_letter):
             field_scores["series_letter_accuracy"] = 1.0
         else:
             field_scores["series_letter_accuracy"] = 0.0
             errors["series_letter"] = f"'{series_letter}' does not contain only English letters."
 
         # Check RegistrationNumber (exactly 3 digits)
-        reg_number_elem = root.find(self.xpaths.get("registration_number"))
-        reg_number = reg_number_elem.text.strip() if reg_number_elem is not None and reg_number_elem.text else ""
-        if re.fullmatch(r"\d{3}", reg_number):
+        reg_number = values.get("registration_number") or ""
+        if REGISTRATION_NUMBER.fullmatch(reg_number):
             field_scores["registration_number_accuracy"] = 1.0
         else:
             field_scores["registration_number_accuracy"] = 0.0
             errors["registration_number"] = f"'{reg_number}' is not exactly 3 digits."
 
         # Check ProvinceCode (1 or 2 digits)
-        province_code_elem = root.find(self.xpaths.get("province_code"))
-        province_code = province_code_elem.text.strip() if province_code_elem is not None and province_code_elem.text else ""
-        if re.fullmatch(r"\d{1,2}", province_code):
+        province_code = values.get("province_code") or ""
+        if PROVINCE_CODE.fullmatch(province_code):
             field_scores["province_code_accuracy"] = 1.0
         else:
             field_scores["province_code_accuracy"] = 0.0
@@ -111,12 +127,17 @@ class SyntacticAccuracy:
         Processes all XML files in the folder, computing the syntactic accuracy for each file,
         and storing the results in a dictionary mapping each filename to its results.
         """
-        for filename in os.listdir(self.xml_folder):
-            if filename.lower().endswith(".xml"):
-                xml_path = os.path.join(self.xml_folder, filename)
-                with open(xml_path, "r", encoding="utf-8") as f:
-                    xml_content = f.read()
-                self.results[filename] = self.compute_accuracy(xml_content)
+        if self.corpus is None:
+            self.corpus = XmlCorpus(self.xml_folder, self.xpaths.values())
+        self.corpus.require(self.xpaths.values())
+        records = (({key: get_text(value) for key, value in self.corpus.record(row, self.xpaths).items()},)
+                   for row, filename in enumerate(self.corpus.files) if filename not in self.corpus.errors)
+        validated = iter(validate_records(self, records, self.workers))
+        for filename in self.corpus.files:
+            if filename in self.corpus.errors:
+                self.results[filename] = {"error": f"Invalid XML format: {self.corpus.errors[filename]}"}
+            else:
+                self.results[filename] = next(validated)
 
     def get_syntactic_evaluator(self) -> str:
         """
@@ -129,6 +150,12 @@ class SyntacticAccuracy:
         Returns:
             A JSON string of the report.
         """
+        return json.dumps(self.report(), indent=4)
+
+    def report(self) -> dict:
+        """
+        The report of get_syntactic_evaluator as a dictionary.
+        """
         valid_files = [
             res for key, res in self.results.items()
             if key != "summary" and "file_accuracy" in res
@@ -137,7 +164,7 @@ class SyntacticAccuracy:
         if valid_files:
             overall_accuracy = sum(res["file_accuracy"] for res in valid_files) / len(valid_files)
         self.results["summary"] = {"overall_accuracy": overall_accuracy}
-        return json.dumps(self.results, indent=4)
+        return self.results
 
 # --- Example Usage ---
 # xml_folder = "/home/reza/Desktop/data-validation/evaluation_license_plate_data/assets/xml"
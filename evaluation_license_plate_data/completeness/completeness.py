@@ -1,9 +1,10 @@
 from .feature_completeness import FeatureCompleteness
 from .record_completeness import RecordCompleteness
 from .value_occurrence_completeness import ValueOccurrenceCompleteness
+from corpus.xml_corpus import XmlCorpus
 import json
 
-def completeness(xml_folder: str, xml_config: dict, expected_counts: dict) -> dict:
+def completeness(xml_folder: str, xml_config: dict, expected_counts: dict, corpus=None) -> dict:
     """
     Runs three completeness evaluations on the XML files in the specified folder:
       1. Feature Completeness Evaluation:
@@ -22,6 +23,7 @@ def completeness(xml_folder: str, xml_config: dict, expected_counts: dict) -> di
         required_fields: List of required XPath strings for Record Completeness evaluation.
         expected_counts: Dictionary mapping field names to dictionaries of expected value counts.
         field_xpaths: Dictionary mapping field names to their XPath in the XML for Value Occurrence Completeness.
+        corpus: Optional XmlCorpus of xml_folder; the folder is parsed once for all three evaluations.
         
     Returns:
         A dictionary containing:
@@ -29,12 +31,15 @@ def completeness(xml_folder: str, xml_config: dict, expected_counts: dict) -> di
             - "record_completeness": Result from RecordCompleteness.
             - "value_occurrence_completeness": Result from ValueOccurrenceCompleteness.
     """
-    # 1. Feature Completeness Evaluation
     features = list(xml_config.values())
-    feature_report = FeatureCompleteness(xml_folder, features)
+    if corpus is None:
+        corpus = XmlCorpus(xml_folder, features)
+
+    # 1. Feature Completeness Evaluation
+    feature_report = FeatureCompleteness(xml_folder, features, corpus)
     
     # 2. Record Completeness Evaluation
-    record_report = RecordCompleteness(xml_folder, features)
+    record_report = RecordCompleteness(xml_folder, features, corpus)
     
     # 3. Value Occurrence Completeness Evaluation
     counts_x_path = {key: xml_config[key] for key in xml_config if key in {
@@ -42,7 +47,7 @@ def completeness(xml_folder: str, xml_config: dict, expected_counts: dict) -> di
                                                                                             "CarColor"    
                                                                                 }}
     
-    value_occurrence_report = ValueOccurrenceCompleteness(xml_folder, expected_counts, counts_x_path)
+    value_occurrence_report = ValueOccurrenceCompleteness(xml_folder, expected_counts, counts_x_path, corpus)
     
     # Combine all results into a single dictionary.
     all_results = {
@@ -1,8 +1,7 @@
-import os
 import json
-import xml.etree.ElementTree as ET
+from corpus.xml_corpus import XmlCorpus, is_filled
 
-def FeatureCompleteness(xml_folder: str, features: list) -> dict:
+def FeatureCompleteness(xml_folder: str, features: list, corpus: XmlCorpus = None) -> dict:
     """
     Checks for the presence of specified features (XPaths) in a folder containing XML files
     and calculates the presence rate for each feature (named as feature_completeness_file) as:
@@ -12,6 +11,8 @@ def FeatureCompleteness(xml_folder: str, features: list) -> dict:
     Parameters:
       - xml_folder: the path to the folder containing XML files.
       - features: a list of XPath strings (e.g., "LicensePlate/RegistrationPrefix").
+      - corpus: Optional XmlCorpus of xml_folder shared with the other evaluators;
+        the folder is read here if not given.
       
     Returns:
       A dictionary mapping each feature (XPath) to a dictionary containing:
@@ -20,28 +21,20 @@ def FeatureCompleteness(xml_folder: str, features: list) -> dict:
       It also includes a "summary" entry with:
           - "mean_feature_completeness": the average feature_completeness_file across all features.
     """
-    total_files = 0
+    if corpus is None:
+        corpus = XmlCorpus(xml_folder, features)
+    corpus.require(features)
+    total_files = len(corpus)
     feature_stats = {feature: {"present": 0, "missing_files": []} for feature in features}
     
-    for filename in os.listdir(xml_folder):
-        if filename.lower().endswith(".xml"):
-            total_files += 1
-            xml_path = os.path.join(xml_folder, filename)
-            try:
-                root = ET.parse(xml_path).getroot()
-            except ET.ParseError:
-                # If the XML cannot be parsed, consider all features as missing in this file.
-                for feature in features:
-                    feature_stats[feature]["missing_files"].append(filename)
-                continue
-            
-            for feature in features:
-                elem = root.find(feature)
-                # The feature is considered valid if the element exists and its text is non-empty.
-                if elem is None or elem.text is None or elem.text.strip() == "":
-                    feature_stats[feature]["missing_files"].append(filename)
-                else:
-                    feature_stats[feature]["present"] += 1
+    for row, filename in enumerate(corpus.files):
+        for feature in features:
+            # If the XML cannot be parsed, all features are considered missing in this file.
+            # Otherwise the feature is valid if the element exists and its text is non-empty.
+            if filename in corpus.errors or not is_filled(corpus.columns[feature][row]):
+                feature_stats[feature]["missing_files"].append(filename)
+            else:
+                feature_stats[feature]["present"] += 1
     
     results = {}
     total_feature_completeness = 0
@@ -1,14 +1,14 @@
-import os
 import json
-import xml.etree.ElementTree as ET
+from corpus.xml_corpus import XmlCorpus, is_filled
 
-def RecordCompleteness(xml_folder: str, required_fields: list) -> dict:
+def RecordCompleteness(xml_folder: str, required_fields: list, corpus: XmlCorpus = None) -> dict:
     """
     Processes all XML files in the given folder and computes the Record Completeness for each file.
     
     Parameters:
         xml_folder: The directory path containing XML files.
         required_fields: A list of XPath strings indicating the required fields in each XML file.
+        corpus: Optional XmlCorpus of xml_folder shared with the other evaluators.
         
     Returns:
         A dictionary where each key is an XML filename mapped to a dictionary containing:
@@ -17,40 +17,38 @@ def RecordCompleteness(xml_folder: str, required_fields: list) -> dict:
         Additionally, it includes a "summary" key with:
             - "mean_record_completeness": the average record completeness score across all files.
     """
+    if corpus is None:
+        corpus = XmlCorpus(xml_folder, required_fields)
+    corpus.require(required_fields)
     results = {}
     file_count = 0
     completeness_sum = 0.0
 
-    for filename in os.listdir(xml_folder):
-        if filename.lower().endswith(".xml"):
-            file_count += 1
-            xml_path = os.path.join(xml_folder, filename)
-            try:
-                root = ET.parse(xml_path).getroot()
-            except ET.ParseError as e:
-                # If the XML cannot be parsed, record an error for this file.
-                results[filename] = {"error": f"XML parse error: {e}"}
-                continue
+    for row, filename in enumerate(corpus.files):
+        file_count += 1
+        if filename in corpus.errors:
+            # If the XML cannot be parsed, record an error for this file.
+            results[filename] = {"error": f"XML parse error: {corpus.errors[filename]}"}
+            continue
 
-            total_fields = len(required_fields)
-            present = 0
-            missing_fields = []
-            for field in required_fields:
-                elem = root.find(field)
-                # A field is considered present if the element exists and its text is non-empty.
-                if elem is None or elem.text is None or elem.text.strip() == "":
-                    missing_fields.append(field)
-                else:
-                    present += 1
+        total_fields = len(required_fields)
+        present = 0
+        missing_fields = []
+        for field in required_fields:
+            # A field is considered present if the element exists and its text is non-empty.
+            if not is_filled(corpus.columns[field][row]):
+                missing_fields.append(field)
+            else:
+                present += 1
 
-            # Calculate the record completeness for the file.
-            record_completeness_file = present / total_fields if total_fields > 0 else 0
-            completeness_sum += record_completeness_file
+        # Calculate the record completeness for the file.
+        record_completeness_file = present / total_fields if total_fields > 0 else 0
+        completeness_sum += record_completeness_file
 
-            results[filename] = {
-                "record_completeness_file": record_completeness_file,
-                "missing_fields": missing_fields
-            }
+        results[filename] = {
+            "record_completeness_file": record_completeness_file,
+            "missing_fields": missing_fields
+        }
     
     # Compute the average record completeness across all files.
     mean_record_completeness = completeness_sum / file_count if file_count > 0 else 0
@@ -1,8 +1,8 @@
-import os
 import json
-import xml.etree.ElementTree as ET
+from corpus.xml_corpus import XmlCorpus, get_text
 
-def ValueOccurrenceCompleteness(xml_folder: str, expected_counts: dict, field_xpaths: dict = None) -> dict:
+def ValueOccurrenceCompleteness(xml_folder: str, expected_counts: dict, field_xpaths: dict = None,
+                                corpus: XmlCorpus = None) -> dict:
     """
     Evaluates value occurrence completeness for specified fields across a folder of XML files.
     
@@ -24,6 +24,7 @@ def ValueOccurrenceCompleteness(xml_folder: str, expected_counts: dict, field_xp
               }
       field_xpaths: Optional dictionary mapping field names to their XPath in the XML.
           If not provided, the field name is assumed to be the XML tag.
+      corpus: Optional XmlCorpus of xml_folder shared with the other evaluators.
     
     Returns:
       A dictionary where each key is a field name mapped to a dictionary containing:
@@ -32,29 +33,24 @@ def ValueOccurrenceCompleteness(xml_folder: str, expected_counts: dict, field_xp
       Also includes a "summary" key with:
           - "overall_completeness": the average field completeness across all fields.
     """
+    # Use custom XPath if provided; otherwise, use the field name as the tag.
+    xpaths = {field: field_xpaths.get(field, field) if field_xpaths else field for field in expected_counts}
+    if corpus is None:
+        corpus = XmlCorpus(xml_folder, xpaths.values())
+    corpus.require(xpaths.values())
+
     # Initialize a count dictionary for each field.
     field_counts = {field: {} for field in expected_counts.keys()}
-    total_files = 0
 
-    # Process each XML file in the folder.
-    for filename in os.listdir(xml_folder):
-        if filename.lower().endswith(".xml"):
-            total_files += 1
-            xml_path = os.path.join(xml_folder, filename)
-            try:
-                root = ET.parse(xml_path).getroot()
-            except ET.ParseError:
+    # Iterate over each field defined in expected_counts.
+    for field, xpath in xpaths.items():
+        for filename, value in zip(corpus.files, corpus.columns[xpath]):
+            if filename in corpus.errors:
                 # If the XML is invalid, skip this file.
                 continue
-
-            # Iterate over each field defined in expected_counts.
-            for field in expected_counts:
-                # Use custom XPath if provided; otherwise, use the field name as the tag.
-                xpath = field_xpaths.get(field, field) if field_xpaths else field
-                elem = root.find(xpath)
-                # Consider the value as present if the element exists and its text is nonempty.
-                value = elem.text.strip() if elem is not None and elem.text and elem.text.strip() != "" else "MISSING"
-                field_counts[field][value] = field_counts[field].get(value, 0) + 1
+            # Consider the value as present if the element exists and its text is nonempty.
+            value = get_text(value) or "MISSING"
+            field_counts[field][value] = field_counts[field].get(value, 0) + 1
 
     features_results = {}
     overall_field_scores = []
@@ -1,8 +1,8 @@
 import os
 import json
-from PIL import Image
+from corpus.image_catalog import ImageCatalog
 
-def DataFormatConsistencyImg(img_path):
+def DataFormatConsistencyImg(img_path, catalog: ImageCatalog = None):
     extension_to_format = {
         '.jpg': 'JPEG',
         '.jpeg': 'JPEG',
@@ -11,12 +11,11 @@ def DataFormatConsistencyImg(img_path):
         '.bmp': 'BMP'
     }
 
+    if catalog is None:
+        catalog = ImageCatalog(img_path)
+
     # Get list of files with recognized image extensions
-    files = [
-        f for f in os.listdir(img_path)
-        if os.path.isfile(os.path.join(img_path, f)) and
-           os.path.splitext(f)[1].lower() in extension_to_format
-    ]
+    files = [f for f in catalog.files if os.path.splitext(f)[1].lower() in extension_to_format]
 
     # Initialize report structure
     report = {"files": {}, "summary": {}}
@@ -29,11 +28,7 @@ def DataFormatConsistencyImg(img_path):
         expected_format = extension_to_format[ext]
 
         # Determine the actual format
-        try:
-            img = Image.open(os.path.join(img_path, filename))
-            actual_format = img.format if img.format else 'Unknown'
-        except Exception:
-            actual_format = 'Unknown'
+        actual_format = catalog.formats[catalog.index[filename]] or 'Unknown'
 
         # Check if formats match
         format_consistency = 1 if actual_format == expected_format else 0
@@ -1,7 +1,6 @@
-import os
 import json
-import xml.etree.ElementTree as ET
 from collections import defaultdict
+from corpus.xml_corpus import XmlCorpus, is_filled
 
 def infer_type(value):
     """
@@ -17,7 +16,7 @@ def infer_type(value):
         except ValueError:
             return 'str'
 
-def DataFormatConsistencyXml(xml_folder, xml_config):
+def DataFormatConsistencyXml(xml_folder, xml_config, corpus=None):
     """
     Analyze data type consistency for fields across XML files in a folder.
     Includes an error section for files with inconsistent data types.
@@ -25,27 +24,26 @@ def DataFormatConsistencyXml(xml_folder, xml_config):
     Parameters:
     - xml_folder (str): Path to the folder containing XML files.
     - xml_config (dict): Dictionary mapping field names to XML paths.
+    - corpus (XmlCorpus): Optional parsed XML folder shared with the other evaluators.
+      Files that cannot be parsed count as missing every field.
 
     Returns:
     - dict: Report with field details (including errors for inconsistent files) and overall consistency score.
     """
     # List all XML files in the folder
-    xml_files = [f for f in os.listdir(xml_folder) if f.endswith('.xml')]
+    if corpus is None:
+        corpus = XmlCorpus(xml_folder, xml_config.values())
+    corpus.require(xml_config.values())
+    xml_files = corpus.files
     
     # Initialize a dictionary to store data types and corresponding files for each field
     field_data = defaultdict(lambda: defaultdict(list))
     
-    # Process each XML file
-    for xml_file in xml_files:
-        full_path = os.path.join(xml_folder, xml_file)
-        tree = ET.parse(full_path)
-        root = tree.getroot()
-        
-        # Extract values for each field and infer their types
-        for field, path in xml_config.items():
-            element = root.find(path)
-            if element is not None and element.text is not None and element.text.strip() != "":
-                data_type = infer_type(element.text.strip())
+    # Extract values for each field and infer their types
+    for field, path in xml_config.items():
+        for xml_file, value in zip(xml_files, corpus.columns[path]):
+            if is_filled(value):
+                data_type = infer_type(value.strip())
                 field_data[field][data_type].append(xml_file)
     
     # Build the report
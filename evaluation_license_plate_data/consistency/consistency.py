@@ -2,8 +2,9 @@ import json
 from .data_format_consistency import DataFormatConsistency
 from .data_record_consistency import DataRecordConsistency
 from .data_value_distribution import DataValueDistribution
+from corpus.xml_corpus import XmlCorpus
 
-def consistency(xml_folder, xml_config, img_path):
+def consistency(xml_folder, xml_config, img_path, corpus=None, catalog=None):
     """
     Computes multiple consistency checks and returns their results in a combined JSON format.
     
@@ -16,16 +17,21 @@ def consistency(xml_folder, xml_config, img_path):
         xml_folder (str): Path to the folder containing XML files.
         xml_config (dict): Dictionary mapping field names to XML paths.
         img_path (str): Path to the image file for format consistency checking.
+        corpus (XmlCorpus): Optional parsed XML folder; it is parsed once for all checks.
+        catalog (ImageCatalog): Optional scanned image folder shared with the other evaluations.
     
     Returns:
         str: A JSON-formatted string containing the results of all three consistency checks.
     """
     # Get the data value distribution (expected to be a JSON string)
-    value_distribution = json.loads(DataValueDistribution(xml_folder, xml_config))
+    if corpus is None:
+        corpus = XmlCorpus(xml_folder, xml_config.values())
+
+    value_distribution = json.loads(DataValueDistribution(xml_folder, xml_config, corpus))
     
     # DataFormatConsistency returns a tuple.
     # Assume the first element corresponds to image consistency and the second to XML consistency.
-    format_consistency_img, format_consistency_xml = DataFormatConsistency(img_path, xml_folder, xml_config)
+    format_consistency_img, format_consistency_xml = DataFormatConsistency(img_path, xml_folder, xml_config, corpus, catalog)
     
     # Get the record consistency (expected to be a JSON string)
     record_consistency = json.loads(DataRecordConsistency(xml_folder, img_path))
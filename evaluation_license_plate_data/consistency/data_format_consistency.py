@@ -1,7 +1,7 @@
 from ._data_format_consistency.data_format_consistency_img import DataFormatConsistencyImg
 from ._data_format_consistency.data_format_consistency_xml import DataFormatConsistencyXml
 
-def DataFormatConsistency(img_path, xml_folder, xml_config):
-    img_report = DataFormatConsistencyImg(img_path)
-    xml_report = DataFormatConsistencyXml(xml_folder, xml_config)
+def DataFormatConsistency(img_path, xml_folder, xml_config, corpus=None, catalog=None):
+    img_report = DataFormatConsistencyImg(img_path, catalog)
+    xml_report = DataFormatConsistencyXml(xml_folder, xml_config, corpus)
     return img_report, xml_report
\ No newline at end of file
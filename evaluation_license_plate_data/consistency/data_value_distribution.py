@@ -1,6 +1,5 @@
-import os
 import json
-import xml.etree.ElementTree as ET
+from corpus.xml_corpus import XmlCorpus, get_text
 
 # Mapping of province names to their possible codes
 province_codes = {
@@ -55,7 +54,7 @@ def get_province_name(code_str):
             return province
     return code_str
 
-def DataValueDistribution(xml_folder, xml_config):
+def DataValueDistribution(xml_folder, xml_config, corpus=None):
     """
     Count the occurrences of each unique value for each field across all XML files.
     For the 'province_code' field, the code is replaced with the corresponding province name.
@@ -63,6 +62,7 @@ def DataValueDistribution(xml_folder, xml_config):
     Args:
         xml_folder (str): Path to the folder containing XML files.
         xml_config (dict): Dictionary mapping field names to XML paths.
+        corpus (XmlCorpus): Optional parsed XML folder shared with the other evaluators.
     
     Returns:
         str: A JSON-formatted string representing a dictionary where each key is a field name and
@@ -79,28 +79,21 @@ def DataValueDistribution(xml_folder, xml_config):
     # Initialize frequency dictionary for each field
     counts = {field: {} for field in features.keys()}
     
-    # List all XML files in the given folder
-    xml_files = [f for f in os.listdir(xml_folder) if f.endswith('.xml')]
+    if corpus is None:
+        corpus = XmlCorpus(xml_folder, features.values())
+    corpus.require(features.values())
+    for xml_file in corpus.errors:
+        print(f"Warning: Could not parse {xml_file}, skipping.")
     
-    # Process each XML file
-    for xml_file in xml_files:
-        full_path = os.path.join(xml_folder, xml_file)
-        try:
-            tree = ET.parse(full_path)
-            root = tree.getroot()
-            
-            # Process each field defined in xml_config
-            for field, path in features.items():
-                elements = root.findall(path)
-                for element in elements:
-                    if element.text and element.text.strip():
-                        value = element.text.strip()
-                        # For the province_code field, map the code to the province name
-                        if field == "province_code":
-                            value = get_province_name(value)
-                        counts[field][value] = counts[field].get(value, 0) + 1
-        except ET.ParseError:
-            print(f"Warning: Could not parse {xml_file}, skipping.")
+    # Count the values of each field defined in xml_config
+    for field, path in features.items():
+        for value in corpus.columns[path]:
+            value = get_text(value)
+            if value:
+                # For the province_code field, map the code to the province name
+                if field == "province_code":
+                    value = get_province_name(value)
+                counts[field][value] = counts[field].get(value, 0) + 1
     
     return json.dumps(counts, ensure_ascii=False, indent=4)
 
@@ -0,0 +1,127 @@
+import os
+from array import array
+from PIL import Image
+from PIL.ExifTags import TAGS
+
+def read_header(file_path: str) -> dict:
+    """
+    Header metadata of one image file, without decoding its pixels:
+      - format, width, height: as reported by PIL (None if the file cannot be opened),
+      - date: the EXIF DateTime, location: the EXIF GPSInfo (None if absent),
+      - error: message of the exception raised when opening the file, else None,
+      - exif_error: message of the exception raised when reading the EXIF data, else None.
+
+    PNG files keep their EXIF data in the eXIf chunk; only a chunk placed before the pixel
+    data is read, as reading one stored after it would decode the whole image.
+    """
+    header = {"format": None, "width": None, "height": None, "date": None, "location": None,
+              "error": None, "exif_error": None}
+    try:
+        with Image.open(file_path) as img:
+            header["format"] = img.format
+            header["width"], header["height"] = img.size
+            try:
+                if img.format == "PNG" and "exif" not in img.info and "Raw profile type exif" not in img.info:
+                    exif_data = None
+                else:
+                    exif_data = img._getexif()
+                if exif_data:
+                    exif = {TAGS.get(key, key): value for key, value in exif_data.items()}
+                    header["location"] = exif.get("GPSInfo")
+                    header["date"] = exif.get("DateTime")
+            except Exception as e:
+                header["exif_error"] = str(e)
+    except Exception as e:
+        header["error"] = str(e)
+    return header
+
+class ImageCatalog:
+    def __init__(self, image_folder: str) -> None:
+        """
+        The image files of a folder, scanned once and shared by every image-side evaluator.
+
+        A single directory pass records, for every regular file in listing order, its size
+        and modification time (one stat call) and its header metadata (see read_header).
+        The values are kept as a columnar table: numbers in typed arrays (-1 when unknown),
+        strings in lists, and the open and EXIF errors in dicts keyed by filename.
+
+        Parameters:
+          - image_folder: Path to the folder containing image files.
+        """
+        self.image_folder = image_folder
+        self.files = []
+        self.sizes = array("q")
+        self.mtimes = array("d")
+        self.widths = array("l")
+        self.heights = array("l")
+        self.formats = []
+        self.dates = []
+        self.has_location = array("b")
+        self.errors = {}
+        self.exif_errors = {}
+
+        with os.scandir(image_folder) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                header = read_header(entry.path)
+                self.files.append(entry.name)
+                self.sizes.append(stat.st_size)
+                self.mtimes.append(stat.st_mtime)
+                self.widths.append(-1 if header["width"] is None else header["width"])
+                self.heights.append(-1 if header["height"] is None else header["height"])
+                self.formats.append(header["format"])
+                self.dates.append(header["date"])
+                self.has_location.append(header["location"] is not None)
+                if header["error"] is not None:
+                    self.errors[entry.name] = header["error"]
+                if header["exif_error"] is not None:
+                    self.exif_errors[entry.name] = header["exif_error"]
+
+        self.index = {filename: row for row, filename in enumerate(self.files)}
+        self.by_base = {}
+        for row, filename in enumerate(self.files):
+            self.by_base.setdefault(os.path.splitext(filename)[0], []).append(row)
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def holds(self, file_path: str) -> bool:
+        """
+        True if file_path is in the catalog's folder, so its entry (or its absence) can be
+        used instead of the file system.
+        """
+        return os.path.normpath(os.path.dirname(file_path)) == os.path.normpath(self.image_folder)
+
+    def size(self, row: int) -> tuple:
+        """
+        (width, height) of a row. Raises OSError with the original message if the file
+        could not be opened as an image, like Image.open would.
+        """
+        filename = self.files[row]
+        if filename in self.errors:
+            raise OSError(self.errors[filename])
+        return self.widths[row], self.heights[row]
+
+    def record(self, row: int) -> dict:
+        """
+        Values of one row in the layout of read_header, plus its size in bytes and mtime.
+        Only the presence of the GPS data is kept, so location is True or None.
+        """
+        filename = self.files[row]
+        opened = filename not in self.errors
+        return {
+            "format": self.formats[row],
+            "width": self.widths[row] if opened else None,
+            "height": self.heights[row] if opened else None,
+            "date": self.dates[row],
+            "location": True if self.has_location[row] else None,
+            "error": self.errors.get(filename),
+            "exif_error": self.exif_errors.get(filename),
+            "size": self.sizes[row],
+            "mtime": self.mtimes[row],
+        }
@@ -0,0 +1,85 @@
+import os
+import xml.etree.ElementTree as ET
+from threading import Lock
+
+def get_text(value):
+    """
+    Stripped text of a corpus value, or None if the element is missing or has no text
+    (the same result as element.text.strip() on the parsed element).
+    """
+    return value.strip() if value else None
+
+def is_filled(value) -> bool:
+    """
+    True if the element exists and its text is non-empty.
+    """
+    return value is not None and value.strip() != ""
+
+class XmlCorpus:
+    def __init__(self, xml_folder: str, xpaths: list = ()) -> None:
+        """
+        The XML files of a folder, listed and parsed once and shared by every evaluator.
+
+        Only the values of the requested XPaths are kept, as a columnar table: one column
+        per XPath with one entry per file, in directory listing order. An entry is
+          - None if the element is missing (or the file could not be parsed),
+          - the element's text otherwise ("" for an element without text).
+        Files that cannot be parsed are listed in errors with the parser's message.
+
+        Parameters:
+          - xml_folder: Path to the folder containing XML files.
+          - xpaths: XPaths to extract, e.g. the values of xml_config. Evaluators needing
+            other XPaths add them with require().
+        """
+        self.xml_folder = xml_folder
+        self.files = [f for f in os.listdir(xml_folder) if f.lower().endswith(".xml")]
+        self.index = {filename: row for row, filename in enumerate(self.files)}
+        self.errors = {}
+        self.columns = {}
+        self.lock = Lock()
+        self._parsed = False
+        self.require(xpaths)
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def require(self, xpaths) -> None:
+        """
+        Adds the columns of the XPaths not extracted yet. All of them are read in a single
+        pass over the files, so an evaluator needing extra fields costs one more parse of
+        the folder at most.
+        """
+        with self.lock:
+            missing = list(dict.fromkeys(xpath for xpath in xpaths if xpath not in self.columns))
+            if not missing and self._parsed:
+                return
+            columns = {xpath: [None] * len(self.files) for xpath in missing}
+            for row, filename in enumerate(self.files):
+                if filename in self.errors:
+                    continue
+                try:
+                    root = ET.parse(os.path.join(self.xml_folder, filename)).getroot()
+                except ET.ParseError as e:
+                    self.errors[filename] = str(e)
+                    continue
+                for xpath in missing:
+                    element = root.find(xpath)
+                    if element is not None:
+                        columns[xpath][row] = element.text or ""
+            self.columns.update(columns)
+            self._parsed = True
+
+    def column(self, xpath: str) -> list:
+        """
+        Values of xpath for every file, extracting them first if needed.
+        """
+        if xpath not in self.columns:
+            self.require([xpath])
+        return self.columns[xpath]
+
+    def record(self, row: int, fields: dict) -> dict:
+        """
+        Values of one file as {name: value} for fields, a {name: xpath} mapping.
+        """
+        self.require(fields.values())
+        return {name: self.columns[xpath][row] for name, xpath in fields.items()}
@@ -2,7 +2,8 @@ from .feature_currentness import FeatureCurrentness
 from .record_currentness import RecordCurrentness
 import json
 
-def Currentness(xml_folder: str, photo_folder: str, threshold_days: float, xml_config: dict) -> dict:
+def Currentness(xml_folder: str, photo_folder: str, threshold_days: float, xml_config: dict, corpus=None,
+                catalog=None) -> dict:
     """
     Combines feature and record currentness evaluations into a single report.
 
@@ -21,6 +22,8 @@ def Currentness(xml_folder: str, photo_folder: str, threshold_days: float, xml_c
       threshold_days: Age threshold (in days) to consider an image file as current.
       field_xpaths: Optional dictionary mapping feature names to their XPath in the XML.
                     Defaults to {"CarModel": "CarModel", "CarColor": "CarColor"}.
+      corpus: Optional XmlCorpus of xml_folder shared with the other evaluations.
+      catalog: Optional ImageCatalog of photo_folder shared with the other evaluations.
 
     Returns:
       A dictionary combining the results from both evaluations:
@@ -30,10 +33,10 @@ def Currentness(xml_folder: str, photo_folder: str, threshold_days: float, xml_c
         }
     """
     # Evaluate feature currentness from XML files.
-    feature_report = FeatureCurrentness(xml_folder, xml_config)
+    feature_report = FeatureCurrentness(xml_folder, xml_config, corpus)
     
     # Evaluate record currentness from photo files.
-    record_report = RecordCurrentness(photo_folder, threshold_days)
+    record_report = RecordCurrentness(photo_folder, threshold_days, catalog)
     
     # Combine both reports into a single dictionary.
     combined_report = {
@@ -1,8 +1,7 @@
-import os
 import json
-import xml.etree.ElementTree as ET
+from corpus.xml_corpus import XmlCorpus
 
-def FeatureCurrentness(xml_folder: str, xml_config: dict = None) -> dict:
+def FeatureCurrentness(xml_folder: str, xml_config: dict = None, corpus: XmlCorpus = None) -> dict:
     """
     Evaluates how up-to-date each feature is across all XML files.
 
@@ -26,6 +25,7 @@ def FeatureCurrentness(xml_folder: str, xml_config: dict = None) -> dict:
       xml_folder: Path to the folder containing XML files.
       field_xpaths: Optional dictionary mapping feature names to their XPath in the XML.
                     Defaults to {"CarModel": "CarModel", "CarColor": "CarColor"}.
+      corpus: Optional XmlCorpus of xml_folder shared with the other evaluators.
 
     Returns:
       A dictionary with:
@@ -62,48 +62,46 @@ def FeatureCurrentness(xml_folder: str, xml_config: dict = None) -> dict:
     file_details = {}
     total_files = 0
 
-    for filename in os.listdir(xml_folder):
-        if filename.lower().endswith(".xml"):
-            total_files += 1
-            xml_path = os.path.join(xml_folder, filename)
-            try:
-                root = ET.parse(xml_path).getroot()
-            except ET.ParseError as e:
-                file_details[filename] = {"error": f"XML parse error: {e}"}
-                continue
-            
-            # Extract features using provided XPaths.
-            car_model_elem = root.find(field_xpaths.get("CarModel", "CarModel"))
-            car_color_elem = root.find(field_xpaths.get("CarColor", "CarColor"))
-            
-            car_model = car_model_elem.text.strip() if car_model_elem is not None and car_model_elem.text else ""
-            car_color = car_color_elem.text.strip() if car_color_elem is not None and car_color_elem.text else ""
-            
-            # Check whether the extracted values are up-to-date.
-            model_current = 1 if car_model in up_to_date_values.get("CarModel", []) else 0
-            # Compare CarColor case-insensitively.
-            new_colors = [c.lower() for c in up_to_date_values.get("CarColor", [])]
-            color_current = 1 if car_color.lower() in new_colors else 0
-            
-            # Update aggregated counts.
-            feature_counts["CarModel"]["total"] += 1
-            feature_counts["CarColor"]["total"] += 1
-            if model_current:
-                feature_counts["CarModel"]["up_to_date"] += 1
-            if color_current:
-                feature_counts["CarColor"]["up_to_date"] += 1
-            
-            overall_score = (model_current + color_current) / 2.0
-            
-            file_details[filename] = {
-                "CarModel": car_model,
-                "CarModel_current": model_current,
-                "CarColor": car_color,
-                "CarColor_current": color_current,
-                "Feature_currentness_file": overall_score
-            }
+    model_xpath = field_xpaths.get("CarModel", "CarModel")
+    color_xpath = field_xpaths.get("CarColor", "CarColor")
+    if corpus is None:
+        corpus = XmlCorpus(xml_folder, [model_xpath, color_xpath])
+    car_models, car_colors = corpus.column(model_xpath), corpus.column(color_xpath)
+    # Compare CarColor case-insensitively.
+    new_colors = [c.lower() for c in up_to_date_values.get("CarColor", [])]
+
+    for row, filename in enumerate(corpus.files):
+        total_files += 1
+        if filename in corpus.errors:
+            file_details[filename] = {"error": f"XML parse error: {corpus.errors[filename]}"}
+            continue
+        
+        # Extract features using provided XPaths.
+        car_model = car_models[row].strip() if car_models[row] else ""
+        car_color = car_colors[row].strip() if car_colors[row] else ""
+        
+        # Check whether the extracted values are up-to-date.
+        model_current = 1 if car_model in up_to_date_values.get("CarModel", []) else 0
+        color_current = 1 if car_color.lower() in new_colors else 0
+        
+        # Update aggregated counts.
+        feature_counts["CarModel"]["total"] += 1
+        feature_counts["CarColor"]["total"] += 1
+        if model_current:
+            feature_counts["CarModel"]["up_to_date"] += 1
+        if color_current:
+            feature_counts["CarColor"]["up_to_date"] += 1
+        
+        overall_score = (model_current + color_current) / 2.0
+        
+        file_details[filename] = {
+            "CarModel": car_model,
+            "CarModel_current": model_current,
+            "CarColor": car_color,
+            "CarColor_current": color_current,
+            "Feature_currentness_file": overall_score
+        }
     
-    # Calculate precision for each feature.
     features_results = {}
     for feature, counts in feature_counts.items():
         total = counts["total"]
@@ -1,8 +1,8 @@
-import os
 import json
 import time
+from corpus.image_catalog import ImageCatalog
 
-def RecordCurrentness(photo_folder: str, threshold_days: float) -> dict:
+def RecordCurrentness(photo_folder: str, threshold_days: float, catalog: ImageCatalog = None) -> dict:
     """
     Evaluates record currentness for a folder of photo files and gathers summary information.
     
@@ -23,10 +23,14 @@ def RecordCurrentness(photo_folder: str, threshold_days: float) -> dict:
     Parameters:
       photo_folder: Path to the folder containing photo files.
       threshold_days: The age threshold in days; files with age <= threshold_days are considered current.
+      catalog: Optional ImageCatalog of photo_folder; modification times are then read from it.
     
     Returns:
       A dictionary with detailed file results and a summary.
     """
+    if catalog is None:
+        catalog = ImageCatalog(photo_folder)
+
     details = {}
     total_files = 0
     current_files = 0
@@ -34,14 +38,13 @@ def RecordCurrentness(photo_folder: str, threshold_days: float) -> dict:
     # Current time in seconds since epoch.
     now = time.time()
 
-    for filename in os.listdir(photo_folder):
+    for row, filename in enumerate(catalog.files):
         # Check for common image formats.
         if filename.lower().endswith(('.jpg', '.jpeg', '.png')):
             total_files += 1
-            file_path = os.path.join(photo_folder, filename)
             
             # Use the file modification time.
-            mtime = os.path.getmtime(file_path)
+            mtime = catalog.mtimes[row]
             age_seconds = now - mtime
             age_days = age_seconds / 86400.0  # Convert seconds to days.
             is_current = age_days <= threshold_days
@@ -1,7 +1,20 @@
+import os
+import sys
+
+# The semantic accuracy evaluation uses the detectors of auto_labeling_car, which sits at the
+# repository root. This module is the entry point of the evaluation (run directly or imported
+# by app.py), so the path is set up here once, before the evaluators are imported.
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
 from completeness.completeness import completeness
-from accuracy.accuracy import accuracy
+from accuracy.accuracy import accuracy_report
 from currentness.currentness import Currentness
 from consistency.consistency import consistency
+from corpus.xml_corpus import XmlCorpus
+from corpus.image_catalog import ImageCatalog
+from scheduler import EvaluationScheduler, MAX_WORKERS
 import json
 
 def evaluation_license_plate_data(
@@ -14,6 +27,7 @@ def evaluation_license_plate_data(
     allowed_file_types: list,
     dimension_range: dict,
     file_size_range: dict,
+    max_workers: int = MAX_WORKERS,
 ) -> str:
     """
     Runs the overall evaluation process for license plate data by combining:
@@ -32,6 +46,11 @@ def evaluation_license_plate_data(
     
     Note: The photo folder for currentness evaluation is the same as the image folder.
     
+    The XML folder is listed and parsed once into an XmlCorpus shared by every evaluator, and
+    the image folder is scanned once (headers, sizes and modification times) into an ImageCatalog.
+    Both scans and then the four evaluations run as tasks of an EvaluationScheduler, so
+    independent steps run concurrently on up to max_workers threads.
+    
     Each sub-evaluation returns a JSON string; this function parses those strings,
     aggregates their results into a single dictionary, and then returns the combined
     report as a formatted JSON string.
@@ -40,6 +59,8 @@ def evaluation_license_plate_data(
       xml_folder: Path to the folder containing XML files.
       image_folder: Path to the folder containing image files (used for both accuracy and currentness evaluation).
       threshold_days: Age threshold (in days) to consider an image file as current.
+      max_workers: Maximum number of evaluation tasks run at the same time
+                   (EVALUATION_WORKERS, 4 by default; 1 runs them one after another).
       
       -- For Completeness Evaluation --
       features: List of XPath strings for Feature Completeness evaluation.
@@ -66,30 +87,42 @@ def evaluation_license_plate_data(
           - Currentness Evaluation.
     """
 
+    # Parse every XML file once. Value occurrence completeness and feature currentness fall
+    # back to the field names (e.g. "CarModel") as XPaths, so those are extracted as well.
+    # The four dimensions only depend on the shared scans, so they run concurrently.
+    scheduler = EvaluationScheduler(max_workers)
+    scheduler.add("corpus", lambda: XmlCorpus(xml_folder, [*xml_config.values(), *expected_counts, "CarModel", "CarColor"]))
+    scheduler.add("catalog", lambda: ImageCatalog(image_folder))
 
     # Run Completeness Evaluation.
-    comp_json_str = completeness(xml_folder, xml_config, expected_counts)
-    comp_result = json.loads(comp_json_str)
+    scheduler.add("completeness",
+                  lambda corpus: json.loads(completeness(xml_folder, xml_config, expected_counts, corpus)),
+                  depends_on=["corpus"])
     
     # Run Accuracy Evaluation.
-    acc_json_str = accuracy(image_folder, xml_folder, xml_config , required_metadata, allowed_file_types, dimension_range, file_size_range)
-    acc_result = json.loads(acc_json_str)
+    scheduler.add("accuracy",
+                  lambda corpus, catalog: accuracy_report(image_folder, xml_folder, xml_config , required_metadata, allowed_file_types, dimension_range, file_size_range, corpus, catalog),
+                  depends_on=["corpus", "catalog"])
     
     # For Currentness Evaluation, use the same folder as image_folder.
     photo_folder = image_folder
-    curr_json_str = Currentness(xml_folder, photo_folder, threshold_days, xml_config)
-    curr_result = json.loads(curr_json_str)
+    scheduler.add("currentness",
+                  lambda corpus, catalog: json.loads(Currentness(xml_folder, photo_folder, threshold_days, xml_config, corpus, catalog)),
+                  depends_on=["corpus", "catalog"])
+
 
+    scheduler.add("consistency",
+                  lambda corpus, catalog: json.loads(consistency(xml_folder, xml_config, photo_folder, corpus, catalog)),
+                  depends_on=["corpus", "catalog"])
 
-    consis_json_str = consistency(xml_folder, xml_config, photo_folder)
-    consis_result = json.loads(consis_json_str)
+    results = scheduler.run()
     
     # Combine all results.
     overall_result = {
-        "completeness": comp_result,
-        "accuracy": acc_result,
-        "currentness": curr_result,
-        "consistency" :consis_result
+        "completeness": results["completeness"],
+        "accuracy": results["accuracy"],
+        "currentness": results["currentness"],
+        "consistency" :results["consistency"]
     }
     
     return json.dumps(overall_result, ensure_ascii=False, indent=4)
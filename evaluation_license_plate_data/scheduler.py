@@ -0,0 +1,73 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+# Number of evaluation tasks run at the same time; 1 runs them one after another.
+MAX_WORKERS = int(os.environ.get("EVALUATION_WORKERS", 4))
+
+class EvaluationScheduler:
+    def __init__(self, max_workers: int = MAX_WORKERS) -> None:
+        """
+        Runs evaluation tasks as a dependency graph on a thread pool.
+
+        A task starts as soon as the tasks it depends on have finished, so independent tasks
+        (e.g. the evaluation dimensions once the shared XmlCorpus and ImageCatalog are built)
+        run concurrently and the total time approaches the longest chain of the graph instead
+        of the sum of all tasks. Threads are used because the tasks share the corpus and the
+        loaded models; parsing holds the GIL, but file reads and model inference release it.
+
+        Parameters:
+          - max_workers: Maximum number of tasks run at the same time. With 1, tasks run in
+            the caller's thread in the order they were added.
+        """
+        self.max_workers = max(1, max_workers)
+        self.tasks = {}
+        self.results = {}
+        self.timings = {}
+
+    def add(self, name: str, target, depends_on: list = ()) -> None:
+        """
+        Adds the task name, run as target(**{dependency: result}) once every task of
+        depends_on has finished. Dependencies must be added before the tasks using them.
+        """
+        if name in self.tasks:
+            raise ValueError(f"Task '{name}' is already defined.")
+        unknown = [dependency for dependency in depends_on if dependency not in self.tasks]
+        if unknown:
+            raise ValueError(f"Task '{name}' depends on undefined tasks: {unknown}.")
+        self.tasks[name] = (target, list(depends_on))
+
+    def run(self) -> dict:
+        """
+        Runs every task and returns {name: result}. The first exception raised by a task is
+        re-raised once the running tasks have finished; tasks not started yet are skipped.
+        """
+        if self.max_workers == 1:
+            for name in self.tasks:
+                self._run_task(name)
+            return self.results
+
+        pending = dict(self.tasks)
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="evaluation") as executor:
+            while pending or running:
+                for name, (_, depends_on) in list(pending.items()):
+                    if all(dependency in self.results for dependency in depends_on):
+                        running[executor.submit(self._run_task, name)] = name
+                        del pending[name]
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del running[future]
+                    error = future.exception()
+                    if error is not None:
+                        wait(running)
+                        raise error
+        return self.results
+
+    def _run_task(self, name: str):
+        target, depends_on = self.tasks[name]
+        start = time.time()
+        result = target(**{dependency: self.results[dependency] for dependency in depends_on})
+        self.timings[name] = time.time() - start
+        self.results[name] = result
+        return result
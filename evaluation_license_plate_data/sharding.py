@@ -0,0 +1,68 @@
+import os
+import copy
+import multiprocessing
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+
+# Number of worker processes validating records; 1 validates them in the calling process.
+SHARD_WORKERS = int(os.environ.get("EVALUATION_SHARD_WORKERS", 1))
+# Number of records sent to a worker at a time.
+SHARD_SIZE = int(os.environ.get("EVALUATION_SHARD_SIZE", 2000))
+# Validator attributes that stay in the parent process: the shared corpus (which holds a
+# lock) and the results collected so far.
+PROCESS_LOCAL = ("corpus", "results")
+
+# Validator owned by the current worker process (set by _init_worker).
+_validator = None
+
+def _init_worker(validator) -> None:
+    global _validator
+    _validator = validator
+
+def _validate_shard(records: list) -> list:
+    return [_validator.validate_record(*args) for args in records]
+
+def rule_set(validator):
+    """
+    Copy of validator without its process-local attributes, i.e. only the configuration
+    validate_record needs (required fields, valid values, compiled patterns, image catalog).
+    """
+    rules = copy.copy(validator)
+    for name in PROCESS_LOCAL:
+        if hasattr(rules, name):
+            setattr(rules, name, None)
+    return rules
+
+def validate_records(validator, records, workers: int = SHARD_WORKERS, shard_size: int = SHARD_SIZE) -> list:
+    """
+    Returns validator.validate_record(*args) for every args tuple of records, in order.
+
+    With workers > 1 the records are split into shards of shard_size and validated on a
+    pool of worker processes. The validator's rule set (see rule_set) is sent once to every
+    worker; then only the records of a shard and their results cross process boundaries.
+    records may be any iterable; it is read lazily so that at most two shards per worker
+    are in flight. Workers are started with the "spawn" method since the evaluations run on
+    the threads of an EvaluationScheduler, and forking a multi-threaded process is unsafe.
+    """
+    if workers <= 1:
+        return [validator.validate_record(*args) for args in records]
+
+    records = iter(records)
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(rule_set(validator),),
+    ) as executor:
+        pending = deque()
+        while True:
+            while len(pending) < 2 * workers:
+                shard = list(islice(records, shard_size))
+                if not shard:
+                    break
+                pending.append(executor.submit(_validate_shard, shard))
+            if not pending:
+                return results
+            results.extend(pending.popleft().result())